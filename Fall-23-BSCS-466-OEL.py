@@ -4,23 +4,49 @@ A comprehensive path-finding system using BFS, DFS, and UCS algorithms
 to navigate through campus locations with performance comparison.
 """
 
+import argparse
+import random
+import sys
 import time
+from bisect import bisect_left
 from collections import deque, defaultdict
 import heapq
 from datetime import datetime
 
+import pathbatch
+
 class CampusGraph:
     """
     Represents the campus as a weighted graph structure.
     Nodes = Locations, Edges = Paths with weights (distances/costs)
     """
     
-    def __init__(self):
-        """Initialize an empty graph using adjacency list representation"""
+    def __init__(self, verbose=True):
+        """
+        Initialize an empty graph using adjacency list representation.
+        
+        Args:
+            verbose (bool): Print a confirmation message for every change.
+                Turn this off when building large generated graphs.
+        """
         # Dictionary to store graph: {node: [(neighbor, weight), ...]}
         self.graph = defaultdict(list)
         # Set to keep track of all nodes in the graph
         self.nodes = set()
+        self.verbose = verbose
+        # Bumped on every change so derived views (CSR arrays) know when to rebuild
+        self.version = 0
+        self._csr = None
+        # Union-find index of connected components: {node: parent}, {root: size}
+        # Kept up to date by add_path; removals only mark it stale
+        self._parent = {}
+        self._component_size = {}
+        self._components_stale = False
+    
+    def _log(self, message):
+        """Print a status message unless the graph is in quiet mode"""
+        if self.verbose:
+            print(message)
     
     def add_location(self, location):
         """
@@ -31,9 +57,12 @@ class CampusGraph:
         """
         if location not in self.nodes:
             self.nodes.add(location)
-            print(f"✅ Location '{location}' added successfully!")
+            self._parent[location] = location
+            self._component_size[location] = 1
+            self.version += 1
+            self._log(f"✅ Location '{location}' added successfully!")
         else:
-            print(f"⚠️  Location '{location}' already exists!")
+            self._log(f"⚠️  Location '{location}' already exists!")
     
     def remove_location(self, location):
         """
@@ -43,7 +72,7 @@ class CampusGraph:
             location (str): Name of the location to remove
         """
         if location not in self.nodes:
-            print(f"❌ Location '{location}' does not exist!")
+            self._log(f"❌ Location '{location}' does not exist!")
             return
         
         # Remove the node from the nodes set
@@ -58,7 +87,9 @@ class CampusGraph:
             self.graph[node] = [(neighbor, weight) for neighbor, weight in self.graph[node] 
                                 if neighbor != location]
         
-        print(f"✅ Location '{location}' removed successfully!")
+        self._components_stale = True
+        self.version += 1
+        self._log(f"✅ Location '{location}' removed successfully!")
     
     def add_path(self, location1, location2, weight):
         """
@@ -78,8 +109,11 @@ class CampusGraph:
         # Add bidirectional edges (undirected graph)
         self.graph[location1].append((location2, weight))
         self.graph[location2].append((location1, weight))
+        if not self._components_stale:
+            self._union(location1, location2)
         
-        print(f"✅ Path added: {location1} ↔ {location2} (Cost: {weight})")
+        self.version += 1
+        self._log(f"✅ Path added: {location1} ↔ {location2} (Cost: {weight})")
     
     def remove_path(self, location1, location2):
         """
@@ -90,7 +124,7 @@ class CampusGraph:
             location2 (str): Second location
         """
         if location1 not in self.nodes or location2 not in self.nodes:
-            print(f"❌ One or both locations do not exist!")
+            self._log(f"❌ One or both locations do not exist!")
             return
         
         # Remove edges in both directions
@@ -99,7 +133,81 @@ class CampusGraph:
         self.graph[location2] = [(neighbor, weight) for neighbor, weight in self.graph[location2] 
                                   if neighbor != location1]
         
-        print(f"✅ Path removed: {location1} ↔ {location2}")
+        self._components_stale = True
+        self.version += 1
+        self._log(f"✅ Path removed: {location1} ↔ {location2}")
+    
+    def _find(self, location):
+        """Return the component representative of a location (with path halving)"""
+        parent = self._parent
+        while parent[location] != location:
+            parent[location] = parent[parent[location]]
+            location = parent[location]
+        return location
+    
+    def _union(self, location1, location2):
+        """Merge the components of two locations (union by size)"""
+        root1, root2 = self._find(location1), self._find(location2)
+        if root1 == root2:
+            return
+        if self._component_size[root1] < self._component_size[root2]:
+            root1, root2 = root2, root1
+        self._parent[root2] = root1
+        self._component_size[root1] += self._component_size.pop(root2)
+    
+    def _rebuild_components(self):
+        """Recompute the component index from scratch (after removals)"""
+        self._parent = {node: node for node in self.nodes}
+        self._component_size = {node: 1 for node in self.nodes}
+        for node in self.nodes:
+            for neighbor, _ in self.graph.get(node, ()):
+                self._union(node, neighbor)
+        self._components_stale = False
+    
+    def connected(self, location1, location2):
+        """
+        Check whether two locations are in the same connected component.
+        Answered from the union-find index in near-constant time, no search.
+        
+        Args:
+            location1 (str): First location
+            location2 (str): Second location
+            
+        Returns:
+            bool: True if a path between the two locations exists
+        """
+        if location1 not in self.nodes or location2 not in self.nodes:
+            return False
+        if self._components_stale:
+            self._rebuild_components()
+        return self._find(location1) == self._find(location2)
+    
+    def component_sizes(self):
+        """
+        Sizes of all connected components (largest first), e.g. for capacity planning.
+        
+        Returns:
+            list: Number of locations in each component
+        """
+        if self._components_stale:
+            self._rebuild_components()
+        return sorted(self._component_size.values(), reverse=True)
+    
+    def component_size(self, location):
+        """
+        Number of locations reachable from a location (including itself).
+        
+        Args:
+            location (str): Location to look up
+            
+        Returns:
+            int: Size of the location's component (0 if it does not exist)
+        """
+        if location not in self.nodes:
+            return 0
+        if self._components_stale:
+            self._rebuild_components()
+        return self._component_size[self._find(location)]
     
     def display_graph(self):
         """Display the entire campus graph structure"""
@@ -117,7 +225,42 @@ class CampusGraph:
                 print(f"📍 {node} → {connections}")
             else:
                 print(f"📍 {node} → (No connections)")
+        sizes = self.component_sizes()
+        print(f"🧩 Connected areas: {len(sizes)} (sizes: {', '.join(map(str, sizes))})")
         print("="*60 + "\n")
+    
+    def to_csr(self):
+        """
+        Build a compressed sparse row (CSR) view of the graph for NumPy code.
+        Locations are numbered in sorted order; the neighbors of location i are
+        indices[indptr[i]:indptr[i + 1]] with matching costs in weights.
+        The view is cached until the graph changes.
+        
+        Returns:
+            tuple: (names, indptr, indices, weights)
+        """
+        if self._csr is not None and self._csr[0] == self.version:
+            return self._csr[1]
+        
+        # NumPy is only needed by the vectorized algorithms, so import it lazily
+        import numpy as np
+        
+        names = sorted(self.nodes)
+        position = {name: i for i, name in enumerate(names)}
+        edges = [self.graph.get(name, ()) for name in names]
+        
+        indptr = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum([len(adjacent) for adjacent in edges], out=indptr[1:])
+        edge_count = int(indptr[-1])
+        indices = np.fromiter(
+            (position[neighbor] for adjacent in edges for neighbor, _ in adjacent),
+            dtype=np.int64, count=edge_count)
+        weights = np.fromiter((weight for adjacent in edges for _, weight in adjacent),
+                              dtype=np.float64, count=edge_count)
+        
+        csr = (names, indptr, indices, weights)
+        self._csr = (self.version, csr)
+        return csr
 
 
 class PathFinder:
@@ -149,6 +292,10 @@ class PathFinder:
         if start not in self.graph.nodes or goal not in self.graph.nodes:
             return None, [], 0, 0
         
+        # Different components: no path exists, skip the search entirely
+        if not self.graph.connected(start, goal):
+            return None, [], 0, 0
+        
         # Queue stores tuples: (current_node, path_so_far, cost_so_far)
         queue = deque([(start, [start], 0)])
         visited = set([start])
@@ -171,6 +318,74 @@ class PathFinder:
         # No path found
         return None, visited_order, 0, len(visited_order)
     
+    def bfs_levels(self, start):
+        """
+        Level-synchronous BFS on the CSR view of the graph (NumPy-backed).
+        Instead of popping one node at a time, the whole frontier is expanded
+        per level with vectorized gathers and a visited mask, which makes
+        reachability and hop-distance queries on large graphs much faster.
+        
+        Args:
+            start (str): Starting location
+            
+        Returns:
+            tuple: (names, hops, parents) where hops[i] is the number of edges
+            from start to names[i] (-1 if unreachable) and parents[i] is the
+            index of names[i]'s predecessor in the BFS tree (-1 for the start
+            and for unreachable locations)
+        """
+        import numpy as np
+        
+        names, indptr, indices, _ = self.graph.to_csr()
+        n = len(names)
+        hops = np.full(n, -1, dtype=np.int64)
+        parents = np.full(n, -1, dtype=np.int64)
+        if start not in self.graph.nodes:
+            return names, hops, parents
+        
+        source = bisect_left(names, start)
+        visited = np.zeros(n, dtype=bool)
+        # Scratch array used to keep a single discoverer per newly reached node
+        claim = np.empty(n, dtype=np.int64)
+        visited[source] = True
+        hops[source] = 0
+        frontier = np.array([source], dtype=np.int64)
+        level = 0
+        
+        while frontier.size:
+            level += 1
+            
+            # Gather every edge leaving the frontier in one shot
+            first_edge = indptr[frontier]
+            degree = indptr[frontier + 1] - first_edge
+            total = int(degree.sum())
+            if total == 0:
+                break
+            edge_ids = (np.repeat(first_edge - (np.cumsum(degree) - degree), degree)
+                        + np.arange(total))
+            neighbors = indices[edge_ids]
+            
+            # Drop neighbors that were already reached on an earlier level
+            fresh = ~visited[neighbors]
+            neighbors = neighbors[fresh]
+            if neighbors.size == 0:
+                break
+            owners = np.repeat(frontier, degree)[fresh]
+            
+            # Several frontier nodes may reach the same neighbor: the last write
+            # into claim wins, which leaves exactly one entry per neighbor
+            slots = np.arange(neighbors.size)
+            claim[neighbors] = slots
+            winners = claim[neighbors] == slots
+            neighbors = neighbors[winners]
+            
+            visited[neighbors] = True
+            hops[neighbors] = level
+            parents[neighbors] = owners[winners]
+            frontier = neighbors
+        
+        return names, hops, parents
+    
     def dfs(self, start, goal, max_depth=float('inf')):
         """
         Depth-First Search: Explores as deep as possible before backtracking.
@@ -187,6 +402,10 @@ class PathFinder:
         if start not in self.graph.nodes or goal not in self.graph.nodes:
             return None, [], 0, 0
         
+        # Different components: no path exists, skip the search entirely
+        if not self.graph.connected(start, goal):
+            return None, [], 0, 0
+        
         # Stack stores tuples: (current_node, path_so_far, cost_so_far, depth)
         stack = [(start, [start], 0, 0)]
         visited = set()
@@ -231,6 +450,10 @@ class PathFinder:
         if start not in self.graph.nodes or goal not in self.graph.nodes:
             return None, [], 0, 0
         
+        # Different components: no path exists, skip the search entirely
+        if not self.graph.connected(start, goal):
+            return None, [], 0, 0
+        
         # Priority queue stores tuples: (cost, current_node, path_so_far)
         # heapq uses first element (cost) for priority
         pq = [(0, start, [start])]
@@ -389,6 +612,431 @@ def create_sample_campus(graph):
     print("✅ Sample campus created with 6 locations and 7 paths!")
 
 
+def generate_campus(num_locations, avg_degree=4, seed=None):
+    """
+    Generate a large random campus for benchmarking (quiet, no per-edge output).
+    A random spanning tree keeps every location reachable; extra random paths
+    bring the average degree up to avg_degree.
+    
+    Args:
+        num_locations (int): Number of locations to create
+        avg_degree (int): Target average number of connections per location
+        seed (int): Seed for reproducible graphs
+        
+    Returns:
+        CampusGraph: The generated campus
+    """
+    rng = random.Random(seed)
+    graph = CampusGraph(verbose=False)
+    names = [f"Loc{i}" for i in range(num_locations)]
+    graph.add_location(names[0])
+    
+    for i in range(1, num_locations):
+        graph.add_path(names[i], names[rng.randrange(i)], rng.randint(1, 10))
+    
+    extra_paths = max(0, num_locations * avg_degree // 2 - (num_locations - 1))
+    for _ in range(extra_paths):
+        a, b = rng.randrange(num_locations), rng.randrange(num_locations)
+        if a != b:
+            graph.add_path(names[a], names[b], rng.randint(1, 10))
+    
+    return graph
+
+
+def benchmark_bfs(sizes=(1_000, 10_000, 100_000, 1_000_000), repeats=3, seed=0):
+    """
+    Compare the deque-based bfs with the NumPy bfs_levels on generated graphs.
+    The goal for bfs is the location farthest from the start, so both versions
+    explore (almost) the whole graph.
+    
+    Args:
+        sizes (iterable): Graph sizes (number of locations) to test
+        repeats (int): Runs per measurement; the best time is reported
+        seed (int): Seed for the generated graphs
+    """
+    print("\n" + "="*70)
+    print("📊 BFS BENCHMARK (deque bfs vs vectorized bfs_levels)")
+    print("="*70)
+    print(f"{'Locations':<12} {'Paths':<12} {'bfs (s)':<12} {'CSR build (s)':<15} "
+          f"{'bfs_levels (s)':<15} {'Speedup':<8}")
+    print("-"*70)
+    
+    for size in sizes:
+        graph = generate_campus(size, seed=seed)
+        finder = PathFinder(graph)
+        start = "Loc0"
+        
+        start_time = time.perf_counter()
+        names, hops, _ = finder.bfs_levels(start)
+        csr_time = time.perf_counter() - start_time
+        goal = names[int(hops.argmax())]
+        
+        levels_time = float('inf')
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            finder.bfs_levels(start)
+            levels_time = min(levels_time, time.perf_counter() - start_time)
+        csr_time -= levels_time
+        
+        deque_time = float('inf')
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            finder.bfs(start, goal)
+            deque_time = min(deque_time, time.perf_counter() - start_time)
+        
+        paths = int(graph.to_csr()[1][-1]) // 2
+        print(f"{size:<12} {paths:<12} {deque_time:<12.6f} {csr_time:<15.6f} {levels_time:<15.6f} "
+              f"{deque_time / levels_time:.1f}x")
+    
+    print("="*70 + "\n")
+
+
+def load_campus(path, verbose=False):
+    """
+    Load a campus graph from a text file with one path per line:
+    "location1,location2,cost". A line with a single name adds an isolated
+    location; blank lines and lines starting with '#' are ignored.
+    
+    Args:
+        path (str): Path of the graph file
+        verbose (bool): Print a message for every location/path added
+        
+    Returns:
+        CampusGraph: The loaded campus
+    """
+    graph = CampusGraph(verbose=verbose)
+    for location1, location2, cost in pathbatch.read_graph(path):
+        if location2 is None:
+            graph.add_location(location1)
+        else:
+            graph.add_path(location1, location2, cost)
+    return graph
+
+
+# ---------------------------------------------------------------
+# All-pairs shortest paths (process pool + shared memory)
+# ---------------------------------------------------------------
+
+# Per-worker state, filled in by _all_pairs_worker_init
+_all_pairs_state = {}
+
+
+def _attach_array(name, shape, dtype):
+    """Attach to an existing shared memory block and view it as a NumPy array"""
+    import numpy as np
+    from multiprocessing import shared_memory
+    
+    block = shared_memory.SharedMemory(name=name)
+    return block, np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _all_pairs_worker_init(layout):
+    """
+    Pool initializer: attach the shared CSR arrays and the result matrix once
+    per worker and keep plain-list copies of the adjacency for fast Dijkstra.
+    
+    Args:
+        layout (dict): {array_name: (shm_name, shape, dtype)}
+    """
+    blocks = []
+    arrays = {}
+    for key, (name, shape, dtype) in layout.items():
+        block, array = _attach_array(name, shape, dtype)
+        blocks.append(block)
+        arrays[key] = array
+    
+    _all_pairs_state.clear()
+    _all_pairs_state.update(
+        blocks=blocks,
+        dist=arrays["dist"],
+        indptr=arrays["indptr"].tolist(),
+        indices=arrays["indices"].tolist(),
+        weights=arrays["weights"].tolist(),
+    )
+
+
+def _all_pairs_rows(sources):
+    """
+    Run one Dijkstra per source and write each distance row straight into the
+    shared result matrix.
+    
+    Args:
+        sources (list): Source location indices
+        
+    Returns:
+        list: The sources that were completed
+    """
+    state = _all_pairs_state
+    indptr, indices, weights = state["indptr"], state["indices"], state["weights"]
+    dist = state["dist"]
+    n = len(indptr) - 1
+    
+    for source in sources:
+        best = [float('inf')] * n
+        best[source] = 0.0
+        pq = [(0.0, source)]
+        while pq:
+            cost, node = heapq.heappop(pq)
+            if cost > best[node]:
+                continue
+            for edge in range(indptr[node], indptr[node + 1]):
+                neighbor = indices[edge]
+                new_cost = cost + weights[edge]
+                if new_cost < best[neighbor]:
+                    best[neighbor] = new_cost
+                    heapq.heappush(pq, (new_cost, neighbor))
+        dist[source] = best
+    
+    return sources
+
+
+def _save_all_pairs_checkpoint(path, names, dist, done):
+    """Write the partial distance matrix atomically (temp file + rename)"""
+    import os
+    import numpy as np
+    
+    temp_path = f"{path}.tmp.npz"
+    np.savez(temp_path, names=np.array(names), dist=dist, done=done)
+    os.replace(temp_path, path)
+
+
+def all_pairs_shortest_paths(graph, processes=None, checkpoint=None, batch_size=32,
+                             checkpoint_every=50):
+    """
+    Compute the shortest travel cost between every pair of locations.
+    Runs one Dijkstra per source across a process pool. The CSR graph and the
+    n x n result matrix live in multiprocessing.shared_memory, so workers
+    neither copy the graph nor send rows back through pipes.
+    
+    Args:
+        graph (CampusGraph): The campus graph
+        processes (int): Worker processes (defaults to the CPU count)
+        checkpoint (str): Optional .npz file for partial results; an existing
+            checkpoint for the same locations is resumed
+        batch_size (int): Sources handed to a worker per task
+        checkpoint_every (int): Completed batches between checkpoint writes
+        
+    Returns:
+        tuple: (names, dist) where dist[i][j] is the cost from names[i] to
+        names[j] (inf when unreachable)
+    """
+    import os
+    from multiprocessing import Pool, shared_memory
+    import numpy as np
+    
+    names, indptr, indices, weights = graph.to_csr()
+    n = len(names)
+    
+    done = np.zeros(n, dtype=bool)
+    resumed = None
+    if checkpoint and os.path.exists(checkpoint):
+        with np.load(checkpoint) as saved:
+            if saved["names"].tolist() == names:
+                done = saved["done"].copy()
+                resumed = saved["dist"]
+                print(f"♻️  Resuming from checkpoint: {int(done.sum())}/{n} sources done")
+    
+    blocks = []
+    try:
+        layout = {}
+        shared = {}
+        for key, source_array in (("indptr", indptr), ("indices", indices), ("weights", weights),
+                                  ("dist", None)):
+            shape = (n, n) if key == "dist" else source_array.shape
+            dtype = np.dtype(np.float64 if key == "dist" else source_array.dtype)
+            size = max(1, int(np.prod(shape)) * dtype.itemsize)
+            block = shared_memory.SharedMemory(create=True, size=size)
+            blocks.append(block)
+            shared[key] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+            if source_array is not None:
+                shared[key][...] = source_array
+            layout[key] = (block.name, shape, dtype.str)
+        
+        dist = shared["dist"]
+        dist.fill(np.inf)
+        if resumed is not None:
+            dist[done] = resumed[done]
+        
+        pending = np.flatnonzero(~done).tolist()
+        batches = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+        
+        with Pool(processes, initializer=_all_pairs_worker_init, initargs=(layout,)) as pool:
+            for completed, sources in enumerate(pool.imap_unordered(_all_pairs_rows, batches), 1):
+                done[sources] = True
+                if checkpoint and completed % checkpoint_every == 0:
+                    _save_all_pairs_checkpoint(checkpoint, names, dist, done)
+        
+        if checkpoint:
+            _save_all_pairs_checkpoint(checkpoint, names, dist, done)
+        return names, dist.copy()
+    finally:
+        for block in blocks:
+            block.close()
+            block.unlink()
+
+
+def summarize_all_pairs(names, dist, top=5, betweenness_limit=2_000):
+    """
+    Derive campus-wide statistics from an all-pairs distance matrix.
+    
+    - closeness: reachable locations divided by the total cost to reach them
+    - eccentricity: the cost to the farthest reachable location
+    - betweenness (pair counting): number of (s, t) pairs with a shortest path
+      through v, i.e. dist[s][v] + dist[v][t] == dist[s][t]; it needs n
+      vectorized n x n passes, so it is skipped above betweenness_limit
+    
+    Args:
+        names (list): Location names (matrix order)
+        dist (ndarray): n x n distance matrix
+        top (int): Number of locations listed in each ranking
+        betweenness_limit (int): Largest graph for the betweenness pass
+        
+    Returns:
+        dict: Summary values and rankings
+    """
+    import numpy as np
+    
+    n = len(names)
+    reachable = np.isfinite(dist)
+    np.fill_diagonal(reachable, False)
+    reach_counts = reachable.sum(axis=1)
+    totals = np.where(reachable, dist, 0.0).sum(axis=1)
+    
+    closeness = np.divide(reach_counts, totals, out=np.zeros(n), where=totals > 0)
+    eccentricity = np.where(reachable, dist, -np.inf).max(axis=1, initial=-np.inf)
+    average_cost = np.divide(totals, reach_counts, out=np.full(n, np.inf), where=reach_counts > 0)
+    
+    summary = {
+        "locations": n,
+        "reachable_pairs": int(reach_counts.sum()),
+        "unreachable_pairs": n * (n - 1) - int(reach_counts.sum()),
+        "average_travel_cost": (float(totals.sum() / reach_counts.sum())
+                                if reach_counts.sum() else float('inf')),
+        "most_central": [(names[i], float(closeness[i]))
+                         for i in np.argsort(-closeness, kind="stable")[:top]],
+        "worst_connected": [(names[i], float(average_cost[i]), int(n - 1 - reach_counts[i]))
+                            for i in np.lexsort((-average_cost, reach_counts))[:top]],
+        "largest_eccentricity": [(names[i], float(eccentricity[i]))
+                                 for i in np.argsort(-eccentricity, kind="stable")[:top]],
+        "betweenness": None,
+    }
+    
+    if n <= betweenness_limit:
+        tolerance = 1e-9 * np.maximum(1.0, np.where(reachable, dist, 0.0))
+        betweenness = np.zeros(n, dtype=np.int64)
+        # inf - inf for unreachable pairs gives nan, which never passes the test
+        with np.errstate(invalid="ignore"):
+            for v in range(n):
+                through = np.abs(dist[:, v, None] + dist[None, v, :] - dist) <= tolerance
+                through &= reachable
+                through[v, :] = False
+                through[:, v] = False
+                betweenness[v] = int(through.sum()) // 2
+        summary["betweenness"] = [(names[i], int(betweenness[i]))
+                                  for i in np.argsort(-betweenness, kind="stable")[:top]]
+    
+    return summary
+
+
+def display_all_pairs_summary(summary):
+    """
+    Print the campus-wide summary produced by summarize_all_pairs.
+    
+    Args:
+        summary (dict): Result of summarize_all_pairs
+    """
+    print("\n" + "="*70)
+    print("🌐 CAMPUS-WIDE TRAVEL ANALYTICS")
+    print("="*70)
+    print(f"📍 Locations: {summary['locations']}")
+    print(f"🔗 Reachable pairs: {summary['reachable_pairs']}  |  "
+          f"Unreachable pairs: {summary['unreachable_pairs']}")
+    print(f"💰 Average travel cost: {summary['average_travel_cost']:.3f}")
+    
+    print("\n🏆 Most central (closeness):")
+    for name, value in summary["most_central"]:
+        print(f"   {name:<25} {value:.5f}")
+    
+    if summary["betweenness"] is not None:
+        print("\n🚦 Most traversed (pairs with a shortest path through the location):")
+        for name, value in summary["betweenness"]:
+            print(f"   {name:<25} {value}")
+    
+    print("\n🏚️  Worst connected (average cost, unreachable locations):")
+    for name, value, unreachable in summary["worst_connected"]:
+        print(f"   {name:<25} {value:.3f} ({unreachable} unreachable)")
+    
+    print("\n📏 Largest eccentricity (cost to farthest reachable location):")
+    for name, value in summary["largest_eccentricity"]:
+        print(f"   {name:<25} {value}")
+    print("="*70 + "\n")
+
+
+# ---------------------------------------------------------------
+# Non-interactive batch queries
+# ---------------------------------------------------------------
+
+# Per-worker path finder, created once by _batch_worker_init
+_batch_finder = None
+
+
+def _batch_worker_init(graph_path):
+    """
+    Pool initializer: every worker loads the graph file once.
+    
+    Args:
+        graph_path (str): Path of the graph file
+    """
+    global _batch_finder
+    _batch_finder = PathFinder(load_campus(graph_path))
+
+
+def _batch_search(finder, start, goal, algorithm, constraint):
+    """PathFinder search in the (path, cost, nodes_visited) form pathbatch expects"""
+    if algorithm == "bfs":
+        path, _, cost, nodes_count = finder.bfs(start, goal)
+    else:
+        limit = float('inf') if constraint is None else constraint
+        search = finder.dfs if algorithm == "dfs" else finder.ucs
+        path, _, cost, nodes_count = search(start, goal, limit)
+    return path, cost, nodes_count
+
+
+def run_query(line, finder=None):
+    """
+    Run a single batch query on this script's PathFinder (see pathbatch.run_query).
+    
+    Args:
+        line (str): One line of query input
+        finder (PathFinder): Path finder to use (defaults to the worker's)
+        
+    Returns:
+        dict: Result record with the keys in pathbatch.BATCH_FIELDS
+    """
+    finder = finder or _batch_finder
+    return pathbatch.run_query(line, finder.graph.nodes,
+                               lambda *query: _batch_search(finder, *query))
+
+
+def run_batch(graph_path, queries, output, output_format="jsonl", processes=None, window=10_000):
+    """
+    Stream queries on a graph file through a worker pool (see pathbatch.run_batch).
+    
+    Args:
+        graph_path (str): Path of the graph file
+        queries (iterable): Lines of query input (file object or stdin)
+        output (file): Text stream for the results
+        output_format (str): "jsonl" or "csv"
+        processes (int): Worker processes (1 runs in-process, default CPU count)
+        window (int): Queries read ahead and in flight at a time
+        
+    Returns:
+        dict: Aggregate statistics (queries, found, errors, seconds, queries_per_second)
+    """
+    return pathbatch.run_batch(queries, output, run_query, output_format, processes, window,
+                               initializer=_batch_worker_init, initargs=(graph_path,))
+
+
 def main_menu():
     """
     Main interactive menu for the Smart Campus Path Finder system.
@@ -477,6 +1125,12 @@ def main_menu():
                 print("❌ Invalid locations! Please check and try again.")
                 continue
             
+            if not campus.connected(start, goal):
+                print(f"❌ No path exists: '{start}' and '{goal}' are not connected.")
+                print(f"   ('{start}' can reach {campus.component_size(start)} location(s), "
+                      f"'{goal}' can reach {campus.component_size(goal)})")
+                continue
+            
             # Ask for constraints
             print("\n⚙️  Optional Constraints:")
             try:
@@ -560,6 +1214,51 @@ def main_menu():
             print("❌ Invalid choice! Please enter a number between 1 and 9.")
 
 
+def main(argv=None):
+    """
+    Command-line entry point. Without options the interactive menu starts.
+    
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Smart Campus Path Finder")
+    parser.add_argument("--benchmark-bfs", nargs="*", type=int, metavar="SIZE",
+                        help="benchmark deque bfs against bfs_levels on generated graphs")
+    parser.add_argument("--all-pairs", metavar="GRAPH_FILE",
+                        help="compute all-pairs shortest paths for a graph file "
+                             "and print campus analytics")
+    parser.add_argument("--batch", metavar="GRAPH_FILE",
+                        help="answer queries non-interactively on a graph file")
+    parser.add_argument("--queries", default="-", metavar="FILE",
+                        help="query file for --batch, one 'start,goal,algorithm[,constraint]' "
+                             "or JSON object per line (default: stdin)")
+    parser.add_argument("--output", default="-", metavar="FILE",
+                        help="result file for --batch (default: stdout)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl",
+                        help="result format for --batch (default: jsonl)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes for --all-pairs/--batch (default: CPU count)")
+    parser.add_argument("--checkpoint", metavar="NPZ_FILE",
+                        help="checkpoint/resume file for --all-pairs partial results")
+    args = parser.parse_args(argv)
+    
+    if args.benchmark_bfs is not None:
+        benchmark_bfs(args.benchmark_bfs or (1_000, 10_000, 100_000, 1_000_000))
+    elif args.all_pairs:
+        start_time = time.perf_counter()
+        names, dist = all_pairs_shortest_paths(load_campus(args.all_pairs), args.processes,
+                                               args.checkpoint)
+        print(f"⏱️  All-pairs shortest paths for {len(names)} locations: "
+              f"{time.perf_counter() - start_time:.3f} seconds")
+        display_all_pairs_summary(summarize_all_pairs(names, dist))
+    elif args.batch:
+        pathbatch.run_batch_files(args.queries, args.output, run_query, args.format,
+                                  args.processes, initializer=_batch_worker_init,
+                                  initargs=(args.batch,))
+    else:
+        main_menu()
+
+
 # Program entry point
 if __name__ == "__main__":
-    main_menu()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -7,10 +7,13 @@
 # using BFS, DFS, and Uniform Cost Search algorithms.
 # ---------------------------------------------------------------
 
+import argparse
 import heapq
 import time
 from datetime import datetime
 
+import pathbatch
+
 # ---------------------------------------------------------------
 # Graph class - represents the campus as a graph
 # ---------------------------------------------------------------
@@ -221,6 +224,75 @@ def main():
         else:
             print("Invalid choice! Try again.")
 
+# ---------------------------------------------------------------
+# BATCH MODE
+# ---------------------------------------------------------------
+# Graph of each batch worker, loaded once by _batch_worker_init
+_batch_graph = None
+
+
+def load_graph(path):
+    """Build a Graph from a 'location1,location2,cost' file (see pathbatch.read_graph)"""
+    g = Graph()
+    for location1, location2, cost in pathbatch.read_graph(path):
+        if location2 is None:
+            g.add_location(location1)
+        else:
+            g.add_path(location1, location2, cost)
+    return g
+
+
+def _batch_worker_init(graph_path):
+    """Pool initializer: every worker loads the graph file once"""
+    global _batch_graph
+    _batch_graph = load_graph(graph_path)
+
+
+def _batch_search(start, goal, algorithm, constraint):
+    """Run this script's bfs/dfs/ucs; the constraint is their depth/cost limit"""
+    if algorithm == "ucs":
+        expanded_count, _, path, cost = ucs(_batch_graph, start, goal, constraint)
+        return path, cost, expanded_count
+    search = bfs if algorithm == "bfs" else dfs
+    expanded_count, _, path = search(_batch_graph, start, goal, constraint)
+    # bfs/dfs only return the path, so its cost is summed from the edges
+    cost = sum(_batch_graph.graph[src][dest] for src, dest in zip(path, path[1:]))
+    return path, cost, expanded_count
+
+
+def run_query(line):
+    """Answer one batch query line on the worker's graph (see pathbatch.run_query)"""
+    return pathbatch.run_query(line, _batch_graph.graph, _batch_search)
+
+
+def cli(argv=None):
+    """
+    Command line: the interactive menu by default, or --batch to answer
+    queries from a file or stdin with this script's search functions
+    (query and result formats are shared with Fall-23-BSCS-466-OEL.py).
+    """
+    parser = argparse.ArgumentParser(description="Smart Campus Path Finder")
+    parser.add_argument("--batch", metavar="GRAPH_FILE",
+                        help="answer queries non-interactively on a graph file with one "
+                             "'location1,location2,cost' path per line")
+    parser.add_argument("--queries", default="-", metavar="FILE",
+                        help="query file for --batch, one 'start,goal,algorithm[,constraint]' "
+                             "or JSON object per line (default: stdin)")
+    parser.add_argument("--output", default="-", metavar="FILE",
+                        help="result file for --batch (default: stdout)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), default="jsonl",
+                        help="result format for --batch (default: jsonl)")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes for --batch (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    if args.batch:
+        pathbatch.run_batch_files(args.queries, args.output, run_query, args.format,
+                                  args.processes, initializer=_batch_worker_init,
+                                  initargs=(args.batch,))
+    else:
+        main()
+
 # ---------------------------------------------------------------
 if __name__ == "__main__":  # ✅ fixed (was _name_ and _main_)
-    main()
+    cli()
@@ -1,9 +1,15 @@
 import numpy as np
 
-arr=np.array([1,2,3,4,5])
-print("Original array:", arr)
-print("Type of the array:", type(arr))
-arr2=np.array([[1,2,3],[4,5,6]])
-print("2D array:\n", arr2)
-arr3=np.array([[[1,2,3],[3,4,5]],[[5,6,7],[7,8,9]]])
-print("3D array:\n", arr3)
+
+def main():
+    arr=np.array([1,2,3,4,5])
+    print("Original array:", arr)
+    print("Type of the array:", type(arr))
+    arr2=np.array([[1,2,3],[4,5,6]])
+    print("2D array:\n", arr2)
+    arr3=np.array([[[1,2,3],[3,4,5]],[[5,6,7],[7,8,9]]])
+    print("3D array:\n", arr3)
+
+
+if __name__ == "__main__":
+    main()
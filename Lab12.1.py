@@ -1,41 +1,60 @@
 import pandas as pd
 import numpy as np
-animalset={'animals':["cat","dog","rabbit"],'age':[3,7,2]}
-myvar=pd.DataFrame(animalset)
-print(myvar)
-print("--"*50)
-a=[1,7,2,9]
-series=pd.Series(a)
-print(series)
-print("--"*50)
-print(series[0])
-print("--"*50)
-myvar=pd.Series(a,index=["x","y","z","a"])
-print(myvar)
-print("--"*50)
-calories={"day1":420,"day2":380,"day3":390}
-myvar=pd.Series(calories)
-print(myvar)
-print("--"*50)
-ser=pd.Series()
-print(ser)
-print("--"*50)
-data=np.array(["egg","corn","milk","cheese","lentils","sugar"])
-ser=pd.Series(data)
-print(ser)
-print("--"*50)
-data={
-"calories":[420,380,390],
-"duration":[50,40,45]
-}
 
-df=pd.DataFrame(data)
-print(df)
-print("--"*50)
-df=pd.DataFrame(data,index=["day1","day2","day3"])
-print(df)
-print(df.loc["day2"])
-print("--"*50)
-df=pd.read_csv('student_practice_data.csv')
-print(df)
-print("--"*50)
+from frametools import load_sensor_frame, memory_report
+
+
+def main():
+    animalset={'animals':["cat","dog","rabbit"],'age':[3,7,2]}
+    myvar=pd.DataFrame(animalset)
+    print(myvar)
+    print("--"*50)
+    a=[1,7,2,9]
+    series=pd.Series(a)
+    print(series)
+    print("--"*50)
+    print(series[0])
+    print("--"*50)
+    myvar=pd.Series(a,index=["x","y","z","a"])
+    print(myvar)
+    print("--"*50)
+    calories={"day1":420,"day2":380,"day3":390}
+    myvar=pd.Series(calories)
+    print(myvar)
+    print("--"*50)
+    ser=pd.Series()
+    print(ser)
+    print("--"*50)
+    data=np.array(["egg","corn","milk","cheese","lentils","sugar"])
+    ser=pd.Series(data)
+    print(ser)
+    print("--"*50)
+    data={
+    "calories":[420,380,390],
+    "duration":[50,40,45]
+    }
+
+    df=pd.DataFrame(data)
+    print(df)
+    print("--"*50)
+    df=pd.DataFrame(data,index=["day1","day2","day3"])
+    print(df)
+    print(df.loc["day2"])
+    print("--"*50)
+    # Typed load: float32 readings and a categorical Location
+    df=load_sensor_frame('student_practice_data.csv')
+    print(df)
+    print(df.dtypes)
+    print("--"*50)
+    print("Memory footprint (deep) without and with the schema:")
+    print(memory_report(pd.read_csv('student_practice_data.csv'),df).to_string())
+    print("--"*50)
+    # Streaming mode: typed frames of 50 rows, only the columns needed
+    for chunk in load_sensor_frame('student_practice_data.csv',usecols=["Temperature","Location"],
+                                   chunksize=50):
+        print(f"{len(chunk)} rows, mean temperature {chunk['Temperature'].mean():.2f}")
+    print("--"*50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Fibonacci
+Fibonacci numbers for LAB-Paper.py's fibonacciseries and beyond: the nth term
+by fast doubling (O(log n) big-integer multiplications), a lazy stream that
+starts anywhere with constant memory, and F(n) mod m for whole NumPy arrays
+of n by vectorized exponentiation of the Fibonacci matrix.
+"""
+
+import argparse
+import functools
+import sys
+import time
+
+import numpy as np
+
+# Distinct (n, modulus) queries kept by the fib() memo cache
+FIB_CACHE_SIZE = 1024
+
+# Largest modulus for fib_mod(): residues below 2**32 multiply within uint64
+MAX_MODULUS = 1 << 32
+
+
+def _fib_pair(n, modulus=None):
+    """
+    (F(n), F(n+1)) by fast doubling:
+    F(2k) = F(k) * (2F(k+1) - F(k)),  F(2k+1) = F(k)^2 + F(k+1)^2.
+
+    Args:
+        n (int): Index (n >= 0)
+        modulus (int): Reduce every step modulo this (None = exact)
+
+    Returns:
+        tuple: (F(n), F(n+1))
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if modulus is not None:
+            c, d = c % modulus, d % modulus
+        a, b = (d, c + d) if bit == "1" else (c, d)
+        if modulus is not None:
+            b %= modulus
+    return a, b
+
+
+@functools.lru_cache(maxsize=FIB_CACHE_SIZE)
+def fib(n, modulus=None):
+    """
+    The nth Fibonacci number (F(0) = 0, F(1) = 1), memoized for repeated
+    queries.
+
+    Args:
+        n (int): Index
+        modulus (int): Return F(n) mod this (None = exact)
+
+    Returns:
+        int: F(n) (or F(n) mod modulus)
+
+    Raises:
+        ValueError: If n is negative or the modulus is not positive
+    """
+    if n < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+    if modulus is not None and modulus < 1:
+        raise ValueError("modulus must be positive")
+    return _fib_pair(n, modulus)[0]
+
+
+def fib_stream(start=0, stop=None):
+    """
+    Lazily yield F(start), F(start + 1), ... holding only two terms. The first
+    pair is computed by fast doubling, so a window deep in the sequence does
+    not walk through the terms before it.
+
+    Args:
+        start (int): Index of the first term
+        stop (int): Index after the last term (None = endless)
+
+    Yields:
+        int: Consecutive Fibonacci numbers
+
+    Raises:
+        ValueError: If start is negative
+    """
+    if start < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+    a, b = _fib_pair(start)
+    for _ in range(start, stop) if stop is not None else iter(int, 1):
+        yield a
+        a, b = b, a + b
+
+
+def fib_window(start, count):
+    """
+    Args:
+        start (int): Index of the first term
+        count (int): Number of terms
+
+    Returns:
+        list: F(start), ..., F(start + count - 1)
+    """
+    return list(fib_stream(start, start + count))
+
+
+def fib_mod(indices, modulus):
+    """
+    F(n) mod m for every n of an array, by exponentiating Q = [[1, 1], [1, 0]]
+    one bit at a time for all n together. Powers of Q are determined by two
+    Fibonacci numbers (Q^k = [[F(k+1), F(k)], [F(k), F(k-1)]]), so each
+    element is carried as the pair (F(k), F(k+1)) and multiplied by the
+    shared Q^(2^j) only where bit j of its n is set.
+
+    Args:
+        indices (array-like): Non-negative integer indices (up to 2**63 - 1)
+        modulus (int): Modulus, 1 <= modulus <= 2**32
+
+    Returns:
+        ndarray: uint64 array of F(n) mod modulus, same shape as indices
+
+    Raises:
+        ValueError: If an index is negative or the modulus is out of range
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if not 1 <= modulus <= MAX_MODULUS:
+        raise ValueError(f"modulus must be between 1 and {MAX_MODULUS}")
+    if indices.size and indices.min() < 0:
+        raise ValueError("Fibonacci index must be non-negative")
+
+    m = np.uint64(modulus)
+    flat = indices.ravel()
+    current = np.zeros(flat.shape, dtype=np.uint64)              # F(k), k = 0
+    following = np.full(flat.shape, 1 % modulus, dtype=np.uint64)  # F(k + 1)
+    step, step_next = 1 % modulus, 1 % modulus                   # F(2^j), F(2^j + 1), j = 0
+    for bit in range(int(flat.max()).bit_length() if flat.size else 0):
+        selected = np.flatnonzero((flat >> bit) & 1)
+        if len(selected):
+            x, y = current[selected], following[selected]
+            # F(k+i) = F(k) F(i+1) + F(k-1) F(i),  F(k+i+1) = F(k+1) F(i+1) + F(k) F(i)
+            current[selected] = (x * np.uint64((step_next - step) % modulus) % m
+                                 + y * np.uint64(step) % m) % m
+            following[selected] = (y * np.uint64(step_next) % m + x * np.uint64(step) % m) % m
+        step, step_next = _fib_pair(1 << (bit + 1), modulus)
+    return current.reshape(indices.shape)
+
+
+def _list_series(n):
+    """LAB-Paper's original fibonacciseries, kept as the benchmark baseline"""
+    a, b = 0, 1
+    sequence = []
+    for _ in range(n):
+        sequence.append(a)
+        a, b = b, a + b
+    return sequence
+
+
+def benchmark_fibonacci(n=200_000, count=1_000_000, modulus=1_000_000_007, seed=0):
+    """
+    Compare building the whole list (the original fibonacciseries) with fast
+    doubling, the lazy stream and the vectorized modular variant.
+
+    Args:
+        n (int): Index of the term to compute
+        count (int): Indices in the modular batch
+        modulus (int): Modulus of the batch
+        seed (int): Random seed
+    """
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, 1 << 62, count)
+
+    print("\n" + "=" * 70)
+    print("📊 FIBONACCI BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    reference = _list_series(n + 1)[n]
+    list_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    nth = _fib_pair(n)[0]
+    doubling_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    window = fib_window(n, 10)
+    window_time = time.perf_counter() - start_time
+
+    sample = indices[:2_000].tolist()
+    start_time = time.perf_counter()
+    scalar = [_fib_pair(index, modulus)[0] for index in sample]
+    scalar_time = (time.perf_counter() - start_time) / len(sample) * count
+
+    start_time = time.perf_counter()
+    batch = fib_mod(indices, modulus)
+    batch_time = time.perf_counter() - start_time
+
+    same = nth == reference == window[0] and batch[:len(sample)].tolist() == scalar
+    print(f"{'Task':<52} {'Time (s)':<12}")
+    print("-" * 70)
+    print(f"{f'F({n}) via the whole list (original)':<52} {list_time:<12.4f}")
+    print(f"{f'F({n}) via fast doubling':<52} {doubling_time:<12.4f}")
+    print(f"{f'F({n})..F({n + 9}) via fib_stream':<52} {window_time:<12.4f}")
+    print(f"{f'{count} x F(n) mod m, scalar doubling (extrapolated)':<52} {scalar_time:<12.3f}")
+    print(f"{f'{count} x F(n) mod m, fib_mod (NumPy)':<52} {batch_time:<12.3f}")
+    print("-" * 70)
+    print(f"F({n}) has {nth.bit_length()} bits  |  Identical answers: {same}")
+    print("=" * 70 + "\n")
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Fibonacci numbers")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    nth = commands.add_parser("nth", help="print F(n)")
+    nth.add_argument("n", type=int)
+    nth.add_argument("--mod", type=int, default=None, help="print F(n) mod this instead")
+
+    window = commands.add_parser("window", help="print COUNT terms starting at F(START)")
+    window.add_argument("start", type=int)
+    window.add_argument("count", type=int)
+
+    bench = commands.add_parser("bench", help="benchmark against the original list-building series")
+    bench.add_argument("--n", type=int, default=200_000, help="index of the term to compute")
+    bench.add_argument("--count", type=int, default=1_000_000, help="indices in the modular batch")
+
+    args = parser.parse_args(argv)
+    # Terms can have far more than the default 4300 printable digits
+    sys.set_int_max_str_digits(0)
+    if args.command == "nth":
+        print(fib(args.n, args.mod))
+    elif args.command == "window":
+        for index, term in enumerate(fib_stream(args.start, args.start + args.count), args.start):
+            print(f"F({index}) = {term}")
+    elif args.command == "bench":
+        benchmark_fibonacci(args.n, args.count)
+
+
+if __name__ == "__main__":
+    main()
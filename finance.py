@@ -0,0 +1,526 @@
+"""
+Finance Toolkit
+Grouped revenue analysis for the financial ledgers of LAB-Paper.py. The
+grouping columns are categorical, so every aggregate of a column is computed
+from one shared set of integer group codes with NumPy bincount reductions
+instead of one pandas groupby pass per statistic. Ledgers larger than memory
+are aggregated chunk by chunk from mergeable per-group moments.
+"""
+
+import argparse
+import io
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+AGGREGATES = ("count", "sum", "mean", "var", "std", "min", "max")
+
+# Bytes of ledger CSV parsed per chunk by aggregate_ledger()
+DEFAULT_CHUNK_BYTES = 64 << 20
+
+
+def categorize(frame, columns):
+    """
+    Convert grouping columns to categoricals in place (once per frame), so
+    every later report reuses their codes instead of hashing the strings.
+
+    Args:
+        frame (DataFrame): Ledger to convert
+        columns (list): Column names to convert
+
+    Returns:
+        DataFrame: The same frame
+    """
+    for column in columns:
+        if not isinstance(frame[column].dtype, pd.CategoricalDtype):
+            frame[column] = frame[column].astype("category")
+    return frame
+
+
+def _group_codes(column):
+    """Integer codes (-1 = missing) and category labels of a grouping column"""
+    if isinstance(column.dtype, pd.CategoricalDtype):
+        return column.cat.codes.to_numpy(), column.cat.categories
+    codes, labels = pd.factorize(column, sort=True)
+    return codes, pd.Index(labels)
+
+
+def _group_state(codes, n_groups, values):
+    """
+    Mergeable per-group moments: count, sum, M2 (sum of squared deviations
+    from the group mean), min and max. Missing values and keys are skipped.
+
+    Args:
+        codes (ndarray): Group code per row (-1 = missing key)
+        n_groups (int): Number of groups
+        values (ndarray): float64 value per row
+
+    Returns:
+        dict: name -> float64 array of length n_groups
+    """
+    valid = (codes >= 0) & ~np.isnan(values)
+    if not valid.all():
+        codes, values = codes[valid], values[valid]
+
+    count = np.bincount(codes, minlength=n_groups).astype(np.float64)
+    total = np.bincount(codes, weights=values, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = total / count
+    deviation = values - mean[codes]
+    m2 = np.bincount(codes, weights=deviation * deviation, minlength=n_groups)
+
+    minimum = np.full(n_groups, np.inf)
+    maximum = np.full(n_groups, -np.inf)
+    np.minimum.at(minimum, codes, values)
+    np.maximum.at(maximum, codes, values)
+    return {"count": count, "sum": total, "m2": m2, "min": minimum, "max": maximum}
+
+
+def _empty_state(n_groups):
+    """Moments of n_groups groups without any rows"""
+    return {"count": np.zeros(n_groups), "sum": np.zeros(n_groups), "m2": np.zeros(n_groups),
+            "min": np.full(n_groups, np.inf), "max": np.full(n_groups, -np.inf)}
+
+
+def _merge_state(first, second):
+    """
+    Combine the moments of two disjoint row sets group by group (Chan et al.
+    parallel variance), exactly as if all rows had been aggregated together.
+
+    Args:
+        first (dict): Per-group moments (see _group_state)
+        second (dict): Moments of the same groups over other rows
+
+    Returns:
+        dict: Merged moments
+    """
+    count = first["count"] + second["count"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        delta = first["sum"] / first["count"] - second["sum"] / second["count"]
+        correction = delta * delta * first["count"] * second["count"] / count
+    both = (first["count"] > 0) & (second["count"] > 0)
+    return {
+        "count": count,
+        "sum": first["sum"] + second["sum"],
+        "m2": first["m2"] + second["m2"] + np.where(both, correction, 0.0),
+        "min": np.minimum(first["min"], second["min"]),
+        "max": np.maximum(first["max"], second["max"]),
+    }
+
+
+def _aggregates(state, stats):
+    """Requested statistics (pandas semantics: ddof=1, NaN for empty groups)"""
+    count = state["count"]
+    empty = count == 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        derived = {
+            "count": count.astype(np.int64),
+            "sum": state["sum"],
+            "mean": np.where(empty, np.nan, state["sum"] / count),
+            "var": np.where(count > 1, state["m2"] / (count - 1), np.nan),
+            "min": np.where(empty, np.nan, state["min"]),
+            "max": np.where(empty, np.nan, state["max"]),
+        }
+        derived["std"] = np.sqrt(derived["var"])
+    return {name: derived[name] for name in stats}
+
+
+def _requested(groups, stats):
+    """Grouping column -> statistics, with the defaults filled in and checked"""
+    if groups is None:
+        groups = ["Market_Sector", "Trading_Day_Type"]
+    if not isinstance(groups, dict):
+        groups = {column: stats for column in groups}
+    unknown = {stat for wanted in (*groups.values(), stats) for stat in wanted} - set(AGGREGATES)
+    if unknown:
+        raise ValueError(f"Unknown statistic(s): {', '.join(sorted(unknown))}")
+    return groups
+
+
+class FinanceReport:
+    """
+    Result of finance_report(): per-group aggregates for every grouping
+    column and whole-ledger totals of the value column.
+    """
+
+    def __init__(self, value, groups, total):
+        """
+        Args:
+            value (str): Name of the aggregated value column
+            groups (dict): Grouping column -> DataFrame of aggregates (one row per group)
+            total (dict): Aggregate name -> whole-ledger value
+        """
+        self.value = value
+        self.groups = groups
+        self.total = total
+
+    def peak(self, column, stat="sum"):
+        """
+        Group with the highest value of a statistic (like groupby().stat().idxmax()).
+
+        Args:
+            column (str): Grouping column
+            stat (str): Aggregate to compare
+
+        Returns:
+            The label of the peak group
+
+        Raises:
+            KeyError: If the report was not grouped by column
+            ValueError: If stat was not among the aggregates requested for column
+        """
+        if column not in self.groups:
+            raise KeyError(f"Not grouped by {column!r} (grouped by: {', '.join(self.groups)})")
+        aggregates = self.groups[column]
+        if stat not in aggregates.columns:
+            raise ValueError(f"{stat!r} was not computed for {column!r} "
+                             f"(available: {', '.join(aggregates.columns)})")
+        return aggregates[stat].idxmax()
+
+    def __repr__(self):
+        return (f"FinanceReport(value={self.value!r}, groups={list(self.groups)}, "
+                f"rows={self.total['count']})")
+
+
+def finance_report(frame, value="Revenue", groups=None, stats=AGGREGATES):
+    """
+    Aggregate a value column by several grouping columns in one go. Each
+    grouping column is factorized once (categoricals reuse their codes) and
+    all statistics come from the same per-group moments.
+
+    Args:
+        frame (DataFrame): Ledger with the value and grouping columns
+        value (str): Column to aggregate
+        groups (dict): Grouping column -> statistics for it (default: every
+            column in `stats` for Market_Sector and Trading_Day_Type)
+        stats (tuple): Statistics for groups given as a list, and for the totals
+
+    Returns:
+        FinanceReport: Per-group and whole-ledger aggregates
+
+    Raises:
+        ValueError: If an unknown statistic is requested
+    """
+    groups = _requested(groups, stats)
+
+    values = frame[value].to_numpy(dtype=np.float64, na_value=np.nan)
+    aggregates = {}
+    for column, wanted in groups.items():
+        codes, labels = _group_codes(frame[column])
+        state = _group_state(codes, len(labels), values)
+        aggregates[column] = pd.DataFrame(_aggregates(state, wanted),
+                                          index=pd.Index(labels, name=column))
+
+    whole = _group_state(np.zeros(len(values), dtype=np.intp), 1, values)
+    total = {name: result[0].item() for name, result in _aggregates(whole, stats).items()}
+    return FinanceReport(value, aggregates, total)
+
+
+def _ledger_ranges(path, chunk_bytes):
+    """
+    Split a ledger CSV into byte ranges that end on line boundaries (fields
+    must not contain quoted newlines).
+
+    Args:
+        path (str): Ledger CSV with a header line
+        chunk_bytes (int): Approximate bytes per range
+
+    Returns:
+        tuple: (column names, list of (start, end) byte offsets)
+    """
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, "rb") as file:
+        names = file.readline().decode("utf-8-sig").strip().split(",")
+        start = file.tell()
+        while start < size:
+            file.seek(min(start + chunk_bytes, size))
+            file.readline()
+            end = min(file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return names, ranges
+
+
+def _range_states(task):
+    """
+    Parse one byte range of a ledger and compute its moments (pool worker).
+
+    Args:
+        task (tuple): (path, start, end, column names, value column, grouping columns)
+
+    Returns:
+        tuple: ({grouping column: (labels, moments)}, whole-range moments)
+    """
+    path, start, end, names, value, columns = task
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    frame = pd.read_csv(io.BytesIO(data), header=None, names=names, usecols=[value, *columns],
+                        dtype={value: np.float64, **{column: "category" for column in columns}})
+    values = frame[value].to_numpy(dtype=np.float64, na_value=np.nan)
+    groups = {}
+    for column in columns:
+        codes, labels = _group_codes(frame[column])
+        groups[column] = (labels, _group_state(codes, len(labels), values))
+    return groups, _group_state(np.zeros(len(values), dtype=np.intp), 1, values)
+
+
+def _merge_labelled(merged, labels, state):
+    """
+    Merge a chunk's moments, keyed by its own labels, into the running
+    moments: groups first seen in this chunk are appended.
+
+    Args:
+        merged (tuple): (labels, moments) so far, or None
+        labels (Index): Group labels of the chunk
+        state (dict): Moments of the chunk
+
+    Returns:
+        tuple: Updated (labels, moments)
+    """
+    if merged is None:
+        return pd.Index(labels), state
+    known, running = merged
+    new = labels.difference(known, sort=False)
+    if len(new):
+        known = known.append(new)
+        padding = _empty_state(len(new))
+        running = {name: np.concatenate([running[name], padding[name]]) for name in running}
+    aligned = _empty_state(len(known))
+    slots = known.get_indexer(labels)
+    for name in aligned:
+        aligned[name][slots] = state[name]
+    return known, _merge_state(running, aligned)
+
+
+def aggregate_ledger(path, value="Revenue", groups=None, stats=AGGREGATES,
+                     chunk_bytes=DEFAULT_CHUNK_BYTES, processes=1):
+    """
+    finance_report() for ledger CSVs of any size. The file is split into byte
+    ranges that are parsed and reduced to per-group moments one at a time
+    (or in parallel), then merged exactly; memory holds one range per process.
+
+    Args:
+        path (str): Ledger CSV with a header line
+        value (str): Column to aggregate
+        groups (dict): Grouping column -> statistics (see finance_report)
+        stats (tuple): Statistics for groups given as a list, and for the totals
+        chunk_bytes (int): Approximate bytes parsed per chunk
+        processes (int): Worker processes (1 runs in-process, None = CPU count)
+
+    Returns:
+        FinanceReport: Same results as finance_report() on the whole ledger
+
+    Raises:
+        ValueError: If an unknown statistic is requested
+    """
+    from multiprocessing import Pool
+
+    groups = _requested(groups, stats)
+
+    names, ranges = _ledger_ranges(path, chunk_bytes)
+    tasks = [(path, start, end, names, value, list(groups)) for start, end in ranges]
+    merged = dict.fromkeys(groups)
+    whole = _empty_state(1)
+
+    pool = None
+    if processes != 1:
+        pool = Pool(processes or os.cpu_count() or 1)
+    try:
+        if pool is None:
+            results = map(_range_states, tasks)
+        else:
+            results = pool.imap_unordered(_range_states, tasks)
+        for chunk_groups, chunk_whole in results:
+            for column, (labels, state) in chunk_groups.items():
+                merged[column] = _merge_labelled(merged[column], labels, state)
+            whole = _merge_state(whole, chunk_whole)
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    aggregates = {}
+    for column, wanted in groups.items():
+        labels, state = merged[column] or (pd.Index([]), _empty_state(0))
+        # Sorted labels, like groupby and finance_report
+        order = labels.argsort()
+        state = {name: moments[order] for name, moments in state.items()}
+        aggregates[column] = pd.DataFrame(_aggregates(state, wanted),
+                                          index=pd.Index(labels[order], name=column))
+    total = {name: result[0].item() for name, result in _aggregates(whole, stats).items()}
+    return FinanceReport(value, aggregates, total)
+
+
+def generate_ledger(rows, seed=0):
+    """
+    Synthetic daily ledger shaped like LAB-Paper's financial_data.
+
+    Args:
+        rows (int): Number of ledger rows
+        seed (int): Random seed
+
+    Returns:
+        DataFrame: Month, Revenue, Market_Sector and Trading_Day_Type columns
+    """
+    rng = np.random.default_rng(seed)
+    months = np.array(["Jan", "Feb", "Mar", "Apr", "May", "Jun",
+                       "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"], dtype=object)
+    sectors = np.array(["Tech", "Finance", "Health", "Energy", "Retail"], dtype=object)
+    day_types = np.array(["Bullish", "Bearish", "Neutral"], dtype=object)
+    return pd.DataFrame({
+        "Month": months[np.arange(rows) // 30 % 12],
+        "Revenue": rng.normal(150000, 15000, rows).round(2),
+        "Market_Sector": sectors[rng.integers(0, len(sectors), rows)],
+        "Trading_Day_Type": day_types[rng.integers(0, len(day_types), rows)],
+    })
+
+
+def benchmark_report(rows=1_000_000):
+    """
+    Compare LAB-Paper's three pandas passes with one finance_report().
+
+    Args:
+        rows (int): Rows in the synthetic ledger
+    """
+    ledger = generate_ledger(rows)
+
+    print("\n" + "=" * 70)
+    print("📊 FINANCE REPORT BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    sector_mean = ledger.groupby("Market_Sector")["Revenue"].mean()
+    peak = ledger.groupby("Trading_Day_Type")["Revenue"].sum().idxmax()
+    variance = ledger["Revenue"].var()
+    pandas_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    report = finance_report(ledger,
+                            groups={"Market_Sector": ("mean",), "Trading_Day_Type": ("sum",)},
+                            stats=("var",))
+    object_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    categorize(ledger, ["Market_Sector", "Trading_Day_Type"])
+    categorize_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    full = finance_report(ledger)
+    categorical_time = time.perf_counter() - start_time
+
+    same = (np.allclose(report.groups["Market_Sector"]["mean"], sector_mean)
+            and report.peak("Trading_Day_Type") == peak
+            and np.isclose(report.total["var"], variance)
+            and np.allclose(full.groups["Market_Sector"]["mean"], sector_mean))
+    print(f"Rows: {rows}")
+    print(f"{'Method':<46} {'Time (s)':<12}")
+    print("-" * 70)
+    print(f"{'pandas: 2 groupbys + var (object strings)':<46} {pandas_time:<12.3f}")
+    print(f"{'finance_report (object strings)':<46} {object_time:<12.3f}")
+    print(f"{'categorize() once':<46} {categorize_time:<12.3f}")
+    print(f"{'finance_report (categoricals, all stats)':<46} {categorical_time:<12.3f}")
+    print("-" * 70)
+    print(f"Identical results: {same}")
+    print("=" * 70 + "\n")
+
+
+def benchmark_ledger(path, processes=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Compare reading the whole ledger into pandas with the chunked engine.
+
+    Args:
+        path (str): Ledger CSV
+        processes (int): Worker processes for the parallel run (None = CPU count)
+        chunk_bytes (int): Approximate bytes parsed per chunk
+    """
+    print("\n" + "=" * 70)
+    print("📊 OUT-OF-CORE LEDGER AGGREGATION BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    ledger = pd.read_csv(path)
+    sector_mean = ledger.groupby("Market_Sector")["Revenue"].mean()
+    peak = ledger.groupby("Trading_Day_Type")["Revenue"].sum().idxmax()
+    variance = ledger["Revenue"].var()
+    rows = len(ledger)
+    del ledger
+    pandas_time = time.perf_counter() - start_time
+
+    timings = []
+    for workers in (1, processes):
+        start_time = time.perf_counter()
+        report = aggregate_ledger(path, chunk_bytes=chunk_bytes, processes=workers)
+        timings.append(time.perf_counter() - start_time)
+
+    same = (np.allclose(report.groups["Market_Sector"]["mean"], sector_mean)
+            and report.peak("Trading_Day_Type") == peak
+            and np.isclose(report.total["var"], variance))
+    chunks = len(_ledger_ranges(path, chunk_bytes)[1])
+    print(f"Rows: {rows}  |  Chunks: {chunks} of ~{chunk_bytes >> 20} MB")
+    print(f"{'Method':<46} {'Time (s)':<12}")
+    print("-" * 70)
+    print(f"{'pandas: read_csv + 2 groupbys + var':<46} {pandas_time:<12.3f}")
+    print(f"{'aggregate_ledger (in-process)':<46} {timings[0]:<12.3f}")
+    parallel = f"aggregate_ledger ({processes or os.cpu_count()} processes)"
+    print(f"{parallel:<46} {timings[1]:<12.3f}")
+    print("-" * 70)
+    print(f"Identical results: {same}")
+    print("=" * 70 + "\n")
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the finance benchmarks.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Finance toolkit")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench_report = commands.add_parser("bench-report",
+                                       help="benchmark finance_report against pandas groupbys")
+    bench_report.add_argument("--rows", type=int, default=1_000_000, help="ledger rows")
+
+    report = commands.add_parser("report", help="aggregate a ledger CSV chunk by chunk")
+    report.add_argument("ledger", help="ledger CSV (Month,Revenue,Market_Sector,Trading_Day_Type)")
+    report.add_argument("--processes", type=int, default=1, help="worker processes (0 = CPU count)")
+    report.add_argument("--chunk-mb", type=int, default=DEFAULT_CHUNK_BYTES >> 20,
+                        help="MB parsed per chunk")
+
+    bench_ledger = commands.add_parser("bench-ledger",
+                                       help="benchmark aggregate_ledger against pandas")
+    bench_ledger.add_argument("--rows", type=int, default=5_000_000,
+                              help="rows in the generated ledger")
+    bench_ledger.add_argument("--csv", default=None, help="existing ledger CSV (skips generation)")
+    bench_ledger.add_argument("--processes", type=int, default=None,
+                              help="worker processes for the parallel run")
+    bench_ledger.add_argument("--chunk-mb", type=int, default=DEFAULT_CHUNK_BYTES >> 20,
+                              help="MB parsed per chunk")
+
+    args = parser.parse_args(argv)
+    if args.command == "bench-report":
+        benchmark_report(args.rows)
+    elif args.command == "report":
+        result = aggregate_ledger(args.ledger, chunk_bytes=args.chunk_mb << 20,
+                                  processes=args.processes or None)
+        for column, aggregates in result.groups.items():
+            print(f"\n{column} (peak by sum: {result.peak(column)}):")
+            print(aggregates.to_string())
+        print("\nWhole ledger:", result.total)
+    elif args.command == "bench-ledger":
+        path = args.csv
+        if path is None:
+            path = f"ledger_bench_{args.rows}.csv"
+            if not os.path.exists(path):
+                print(f"📝 Generating {args.rows} rows into '{path}'...")
+                generate_ledger(args.rows).to_csv(path, index=False)
+        benchmark_ledger(path, args.processes, args.chunk_mb << 20)
+
+
+if __name__ == "__main__":
+    main()
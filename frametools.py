@@ -0,0 +1,452 @@
+"""
+Frame Tools
+Reusable pandas helpers for the record tables used by the labs
+(student records in Lab13, sensor exports, financial ledgers): keyed
+lookups, typed CSV loaders and a memory optimizer.
+"""
+
+import argparse
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from smartfarm import LOCATION_COLUMN, SENSOR_COLUMNS, generate_sensor_csv
+
+# Column -> dtype for each export read by the labs. Readings fit float32
+# (about 7 significant digits) and the few distinct labels fit categoricals.
+SENSOR_SCHEMA = {**{column: "float32" for column in SENSOR_COLUMNS}, LOCATION_COLUMN: "category"}
+FINANCE_SCHEMA = {"Month": "category", "Revenue": "float64",
+                  "Market_Sector": "category", "Trading_Day_Type": "category"}
+
+# Keys (evenly spaced, first and last included) kept in a KeyedLookup's
+# fingerprint, so sorted or replaced rows are noticed at a fixed cost
+_KEY_SAMPLES = 64
+
+
+class KeyedLookup:
+    """
+    Fast keyed row lookups on a DataFrame column. The key column is hashed
+    into a pandas Index once; every batch of keys is then answered by one
+    vectorized get_indexer call instead of a full column scan per key.
+    Duplicate keys resolve to their first row.
+
+    The index is rebuilt automatically when the frame's rows or columns
+    change (e.g. through insert()/pop() here or on the frame itself) or
+    when rows are reordered or replaced (a sample of the keys is compared).
+    Call invalidate() after editing a few key values in place.
+    """
+
+    def __init__(self, frame, key):
+        """
+        Args:
+            frame (DataFrame): Table to look rows up in
+            key (str): Column whose values identify the rows
+        """
+        self.frame = frame
+        self.key = key
+        self._index = None
+        self._rows = None
+        self._fingerprint = None
+
+    def invalidate(self):
+        """Drop the cached index; it is rebuilt on the next lookup"""
+        self._index = None
+
+    def _current(self):
+        """Shape, column labels and sampled keys (changed by insert/pop/append, sorts, new rows)"""
+        keys = self.frame[self.key].array
+        positions = np.unique(np.linspace(0, len(keys) - 1, _KEY_SAMPLES).astype(np.intp))
+        sample = keys[positions[:len(keys)]]
+        # Missing keys compare as None (NaN != NaN would force a rebuild every time)
+        sample = np.where(pd.isna(sample), None, np.asarray(sample, dtype=object))
+        return len(self.frame), tuple(self.frame.columns), tuple(sample.tolist())
+
+    def _ensure_index(self):
+        if self._index is not None and self._fingerprint == self._current():
+            return
+        keys = self.frame[self.key]
+        if keys.is_unique:
+            self._index = pd.Index(keys.to_numpy())
+            self._rows = None
+        else:
+            first = ~keys.duplicated(keep="first").to_numpy()
+            self._index = pd.Index(keys.to_numpy()[first])
+            self._rows = np.flatnonzero(first)
+        self._fingerprint = self._current()
+
+    def positions(self, keys):
+        """
+        Row positions of a batch of keys.
+
+        Args:
+            keys (list): Key values to find
+
+        Returns:
+            ndarray: Row position per key (-1 where the key is absent)
+        """
+        self._ensure_index()
+        found = self._index.get_indexer(pd.Index(keys) if not isinstance(keys, pd.Index) else keys)
+        if self._rows is not None:
+            found = np.where(found >= 0, self._rows[found], -1)
+        return found
+
+    def get(self, keys, columns, default=np.nan):
+        """
+        Values of one or more columns for a batch of keys.
+
+        Args:
+            keys (list): Key values to find
+            columns (str or list): Column name (returns an array) or names
+                (returns a DataFrame indexed by the keys)
+            default: Value returned for keys that are absent
+
+        Returns:
+            ndarray or DataFrame: The looked-up values
+        """
+        rows = self.positions(keys)
+        found = rows >= 0
+        if isinstance(columns, str):
+            return self._take(self.frame[columns].to_numpy(), rows, found, default)
+        return pd.DataFrame({name: self._take(self.frame[name].to_numpy(), rows, found, default)
+                             for name in columns}, index=pd.Index(keys, name=self.key))
+
+    def lookup(self, keys, columns, default=np.nan):
+        """
+        One value per (key, column) pair, like the removed DataFrame.lookup.
+
+        Args:
+            keys (list): Key value per pair
+            columns (list): Column name per pair
+            default: Value for pairs whose key is absent
+
+        Returns:
+            ndarray: The looked-up values
+        """
+        rows = self.positions(keys)
+        columns = np.asarray(columns, dtype=object)
+        result = np.empty(len(rows), dtype=object)
+        # One vectorized take per distinct column, not per pair
+        for name in pd.unique(columns):
+            pairs = columns == name
+            result[pairs] = self._take(self.frame[name].to_numpy(), rows[pairs], rows[pairs] >= 0,
+                                       default)
+        return result
+
+    @staticmethod
+    def _take(values, rows, found, default):
+        if len(values):
+            taken = values[np.where(found, rows, 0)]
+        else:
+            taken = np.empty(len(rows), dtype=values.dtype)
+        if found.all():
+            return taken
+        if isinstance(default, float) and taken.dtype.kind in "iu":
+            # As when pandas reindexes: integers become floats so NaN fits
+            taken = taken.astype(np.float64)
+        elif not isinstance(default, float) or taken.dtype.kind not in "fc":
+            taken = taken.astype(object)
+        taken[~found] = default
+        return taken
+
+    def insert(self, loc, column, value, allow_duplicates=False):
+        """DataFrame.insert on the frame; the index is rebuilt on the next lookup"""
+        self.frame.insert(loc, column, value, allow_duplicates=allow_duplicates)
+        self.invalidate()
+
+    def pop(self, column):
+        """DataFrame.pop on the frame; the index is rebuilt on the next lookup"""
+        popped = self.frame.pop(column)
+        self.invalidate()
+        return popped
+
+
+def _optimized_column(column, categorical_ratio, sparse_threshold):
+    """Smallest safe dtype for one column (the column itself if none is smaller)"""
+    kind = column.dtype.kind
+    if sparse_threshold is not None and kind == "f" and len(column) and \
+            column.isna().mean() >= sparse_threshold:
+        return column.astype(pd.SparseDtype(column.dtype, np.nan))
+    if kind in "iu":
+        # Signed types only, so subtracting from a downcast column cannot wrap
+        narrow = pd.to_numeric(column, downcast="integer")
+        return narrow if narrow.dtype.itemsize < column.dtype.itemsize else column
+    if kind == "f" and column.dtype.itemsize > 4:
+        narrow = column.astype(np.float32)
+        # Only when every value survives the round trip exactly
+        if np.array_equal(narrow.to_numpy(np.float64), column.to_numpy(), equal_nan=True):
+            return narrow
+        return column
+    if kind == "O" or isinstance(column.dtype, pd.StringDtype):
+        if len(column) and column.nunique(dropna=False) <= categorical_ratio * len(column):
+            categorical = column.astype("category")
+            # Tiny tables can be smaller as plain strings than as codes + categories
+            if (categorical.memory_usage(deep=True, index=False)
+                    < column.memory_usage(deep=True, index=False)):
+                return categorical
+    return column
+
+
+def optimize_frame(frame, categorical_ratio=0.75, sparse_threshold=None, exclude=()):
+    """
+    Shrink a frame's memory: integers are downcast to the smallest signed
+    type that holds their range, floats to float32 when no value changes,
+    strings with few distinct values become categoricals (when that is
+    smaller), and (optionally) mostly-missing float columns become sparse.
+    Other columns, and the excluded ones, are kept as they are.
+
+    Args:
+        frame (DataFrame): Frame to optimize (left unchanged)
+        categorical_ratio (float): Largest distinct/rows ratio considered for a categorical
+        sparse_threshold (float): Missing fraction at which a float column becomes
+            sparse (None = never)
+        exclude (list): Columns whose dtype must not change (e.g. schema-declared ones)
+
+    Returns:
+        tuple: (optimized DataFrame, memory_report() of the savings per column)
+    """
+    exclude = set(exclude)
+    optimized = pd.DataFrame({name: frame[name] if name in exclude else
+                              _optimized_column(frame[name], categorical_ratio, sparse_threshold)
+                              for name in frame.columns}, index=frame.index)
+    return optimized, memory_report(frame, optimized)
+
+
+def read_typed_csv(path, schema, usecols=None, chunksize=None, optimize=False, **kwargs):
+    """
+    read_csv with an explicit schema: only the wanted columns are parsed and
+    each is stored in its declared dtype instead of inferred float64/object.
+
+    Args:
+        path (str): CSV file
+        schema (dict): Column -> dtype
+        usecols (list): Columns to keep (default: every column in the schema)
+        chunksize (int): Rows per frame; yields typed frames instead of one
+        optimize (bool): Also accept columns the schema does not declare and
+            pass them through optimize_frame() after inference; declared
+            columns always keep the dtype the schema gives them
+        **kwargs: Passed to pd.read_csv
+
+    Returns:
+        DataFrame, or an iterator of DataFrames when chunksize is given
+
+    Raises:
+        KeyError: If a requested column has no dtype in the schema (without optimize)
+    """
+    usecols = list(schema if usecols is None else usecols)
+    missing = [column for column in usecols if column not in schema]
+    if missing and not optimize:
+        raise KeyError(f"No dtype declared for column(s): {', '.join(missing)}")
+    dtype = {column: schema[column] for column in usecols if column in schema}
+    frames = pd.read_csv(path, usecols=usecols, dtype=dtype, chunksize=chunksize, **kwargs)
+    if not optimize:
+        return frames
+    if chunksize is None:
+        return optimize_frame(frames, exclude=dtype)[0]
+    return (optimize_frame(chunk, exclude=dtype)[0] for chunk in frames)
+
+
+def load_records(data, schema=None, index=None):
+    """
+    In-memory counterpart of the typed loaders: builds a frame from a dict of
+    columns (or records), casts the columns the schema declares and runs the
+    rest through optimize_frame().
+
+    Args:
+        data (dict | list): Anything pd.DataFrame accepts
+        schema (dict): Column -> dtype for the columns that must keep a fixed type
+        index (list): Row labels (default: a RangeIndex)
+
+    Returns:
+        DataFrame: The typed, optimized frame
+    """
+    frame = pd.DataFrame(data, index=index)
+    schema = {column: dtype for column, dtype in (schema or {}).items()
+              if column in frame.columns}
+    return optimize_frame(frame.astype(schema), exclude=schema)[0]
+
+
+def load_sensor_frame(path, usecols=None, chunksize=None):
+    """
+    Sensor export (Temperature, Moisture, Humidity, Location) as a typed
+    frame: float32 readings (blank = NaN) and a categorical Location.
+    In chunked mode each frame has its own Location categories. Any other
+    column asked for in usecols is inferred and optimized.
+
+    Args:
+        path (str): Sensor CSV
+        usecols (list): Columns to keep (default: all four)
+        chunksize (int): Rows per frame for streaming
+
+    Returns:
+        DataFrame, or an iterator of DataFrames when chunksize is given
+    """
+    return read_typed_csv(path, SENSOR_SCHEMA, usecols, chunksize, optimize=True)
+
+
+def load_finance_frame(path, usecols=None, chunksize=None):
+    """
+    Financial ledger (Month, Revenue, Market_Sector, Trading_Day_Type) as a
+    typed frame with categorical labels. Any other column asked for in
+    usecols is inferred and optimized.
+
+    Args:
+        path (str): Ledger CSV
+        usecols (list): Columns to keep (default: all four)
+        chunksize (int): Rows per frame for streaming
+
+    Returns:
+        DataFrame, or an iterator of DataFrames when chunksize is given
+    """
+    return read_typed_csv(path, FINANCE_SCHEMA, usecols, chunksize, optimize=True)
+
+
+def memory_report(before, after):
+    """
+    Per-column memory footprint (memory_usage(deep=True)) of two versions of
+    a frame, e.g. read without and with a schema.
+
+    Args:
+        before (DataFrame): Original frame
+        after (DataFrame): Typed/optimized frame
+
+    Returns:
+        DataFrame: dtype and bytes before/after, saved bytes and percent per
+            column, with a Total row
+    """
+    before_bytes = before.memory_usage(deep=True, index=False)
+    after_bytes = after.memory_usage(deep=True, index=False).reindex(before_bytes.index,
+                                                                    fill_value=0)
+    report = pd.DataFrame({
+        "before_dtype": before.dtypes.astype(str),
+        "after_dtype": after.dtypes.astype(str).reindex(before_bytes.index, fill_value="(dropped)"),
+        "before_bytes": before_bytes,
+        "after_bytes": after_bytes,
+    })
+    report.loc["Total"] = ["", "", before_bytes.sum(), after_bytes.sum()]
+    report["saved_bytes"] = report["before_bytes"] - report["after_bytes"]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        report["saved_pct"] = (100 * report["saved_bytes"] / report["before_bytes"]).round(1)
+    return report
+
+
+def benchmark_lookup(rows=1_000_000, lookups=100_000, sample=200, seed=0):
+    """
+    Compare a boolean-mask scan per key (what Lab13 did) with KeyedLookup.
+
+    Args:
+        rows (int): Rows in the synthetic table
+        lookups (int): Keys looked up in one batch
+        sample (int): Keys timed for the per-key scan (it is extrapolated;
+            scanning 1M rows 100k times would take hours)
+        seed (int): Random seed
+    """
+    rng = np.random.default_rng(seed)
+    frame = pd.DataFrame({"Name": [f"student{i:07d}" for i in rng.permutation(rows)],
+                          "Score": rng.integers(0, 101, rows)})
+    names = frame["Name"].to_numpy()[rng.integers(0, rows, lookups)].tolist()
+
+    print("\n" + "=" * 70)
+    print("📊 KEYED LOOKUP BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    scanned = [frame.loc[frame["Name"] == name, "Score"].values[0] for name in names[:sample]]
+    scan_time = (time.perf_counter() - start_time) / sample * lookups
+
+    students = KeyedLookup(frame, "Name")
+    start_time = time.perf_counter()
+    students.positions(names[:1])
+    build_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    scores = students.get(names, "Score")
+    lookup_time = time.perf_counter() - start_time
+
+    same = list(scores[:sample]) == scanned
+    print(f"Rows: {rows}  |  Lookups: {lookups}")
+    print(f"{'Method':<40} {'Time (s)':<12}")
+    print("-" * 70)
+    print(f"{'Mask scan per key (extrapolated)':<40} {scan_time:<12.3f}")
+    print(f"{'KeyedLookup: build index (once)':<40} {build_time:<12.3f}")
+    print(f"{'KeyedLookup: batched get_indexer':<40} {lookup_time:<12.3f}")
+    print("-" * 70)
+    print(f"Speedup: {scan_time / (build_time + lookup_time):,.0f}x  |  Identical values: {same}")
+    print("=" * 70 + "\n")
+
+
+def benchmark_read(path):
+    """
+    Compare an untyped pd.read_csv (what Lab12.1 did) with the typed sensor
+    loader, in time and memory.
+
+    Args:
+        path (str): Sensor CSV to load
+    """
+    print("\n" + "=" * 70)
+    print("📊 TYPED READ_CSV BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    untyped = pd.read_csv(path)
+    untyped_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    typed = load_sensor_frame(path)
+    typed_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    streamed_rows = sum(len(chunk) for chunk in load_sensor_frame(path, chunksize=100_000))
+    stream_time = time.perf_counter() - start_time
+
+    same = all(np.allclose(untyped[column], typed[column], equal_nan=True, rtol=1e-6)
+               for column in SENSOR_COLUMNS)
+    print(f"Rows: {len(typed)}")
+    print(f"{'Loader':<40} {'Time (s)':<12}")
+    print("-" * 70)
+    print(f"{'pd.read_csv (inferred dtypes)':<40} {untyped_time:<12.3f}")
+    print(f"{'load_sensor_frame (schema)':<40} {typed_time:<12.3f}")
+    print(f"{'load_sensor_frame (chunks of 100k)':<40} {stream_time:<12.3f}")
+    print("-" * 70)
+    print(memory_report(untyped, typed).to_string())
+    print("-" * 70)
+    print(f"Rows streamed: {streamed_rows}  |  Same readings: {same}")
+    print("=" * 70 + "\n")
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the frame tool benchmarks.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="pandas frame tools")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench_lookup = commands.add_parser("bench-lookup",
+                                       help="benchmark KeyedLookup against per-key scans")
+    bench_lookup.add_argument("--rows", type=int, default=1_000_000, help="rows in the table")
+    bench_lookup.add_argument("--lookups", type=int, default=100_000, help="keys looked up")
+
+    bench_read = commands.add_parser("bench-read",
+                                     help="benchmark the typed sensor loader against read_csv")
+    bench_read.add_argument("--rows", type=int, default=1_000_000, help="rows in the generated CSV")
+    bench_read.add_argument("--csv", default=None, help="existing sensor CSV (skips generation)")
+
+    args = parser.parse_args(argv)
+    if args.command == "bench-lookup":
+        benchmark_lookup(args.rows, args.lookups)
+    elif args.command == "bench-read":
+        path = args.csv
+        if path is None:
+            path = f"sensor_bench_{args.rows}.csv"
+            if not os.path.exists(path):
+                print(f"📝 Generating {args.rows} rows into '{path}'...")
+                generate_sensor_csv(path, args.rows)
+        benchmark_read(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""
+Inventory
+Stock levels indexed for LAB-Paper.py's low-stock check. SKUs are kept in a
+sorted NumPy array, so a prefix is one contiguous range found by binary
+search, and a min segment tree over the quantities (in SKU order) finds the
+products under a threshold inside that range without visiting the others.
+Quantity changes update the tree in O(log n).
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+# Fully covered tree nodes with at most this many leaves are scanned with NumPy
+_SCAN_LEAVES = 64
+_EMPTY = np.iinfo(np.int64).max
+
+
+class Inventory:
+    """
+    SKU -> quantity store answering "products under a threshold whose SKU
+    starts with a prefix" in O(log n + k) tree steps for k results.
+    """
+
+    def __init__(self, stock=None):
+        """
+        Args:
+            stock (dict): SKU -> quantity (more can be added with add())
+        """
+        stock = stock or {}
+        self.skus = np.array(list(stock), dtype=str)
+        self.quantities = np.array(list(stock.values()), dtype=np.int64)
+        order = np.argsort(self.skus, kind="stable")
+        self.skus, self.quantities = self.skus[order], self.quantities[order]
+        self._build_tree()
+
+    def __len__(self):
+        return len(self.skus)
+
+    def __contains__(self, sku):
+        position = np.searchsorted(self.skus, sku)
+        return position < len(self.skus) and self.skus[position] == sku
+
+    def __getitem__(self, sku):
+        return int(self.quantities[self._positions([sku])[0]])
+
+    def items(self):
+        """
+        Returns:
+            list: (SKU, quantity) pairs in SKU order
+        """
+        return list(zip(self.skus.tolist(), self.quantities.tolist()))
+
+    def _build_tree(self):
+        """Min segment tree: leaf size + i holds quantity i, node j = min of 2j, 2j + 1"""
+        self._size = 1 << max(len(self.skus) - 1, 0).bit_length()
+        self._tree = np.full(2 * self._size, _EMPTY, dtype=np.int64)
+        self._tree[self._size:self._size + len(self.quantities)] = self.quantities
+        start = self._size // 2
+        while start:
+            nodes = np.arange(start, 2 * start)
+            self._tree[nodes] = np.minimum(self._tree[2 * nodes], self._tree[2 * nodes + 1])
+            start //= 2
+
+    def _positions(self, skus):
+        """Sorted-array positions of existing SKUs (KeyError for unknown ones)"""
+        skus = np.asarray(skus, dtype=str)
+        positions = np.searchsorted(self.skus, skus)
+        found = positions < len(self.skus)
+        found[found] = self.skus[positions[found]] == skus[found]
+        if not found.all():
+            raise KeyError(f"Unknown SKU(s): {', '.join(skus[~found][:5].tolist())}")
+        return positions
+
+    def update(self, skus, quantities):
+        """
+        Set the quantities of existing SKUs (batches update the tree level by
+        level with vectorized minimums).
+
+        Args:
+            skus (list): SKUs to change
+            quantities (array-like): New quantity per SKU
+
+        Raises:
+            KeyError: If a SKU is not in the inventory (see add())
+        """
+        positions = self._positions(skus)
+        self.quantities[positions] = quantities
+        nodes = np.unique(positions + self._size)
+        self._tree[nodes] = self.quantities[nodes - self._size]
+        while nodes[0] > 1:
+            nodes = np.unique(nodes // 2)
+            self._tree[nodes] = np.minimum(self._tree[2 * nodes], self._tree[2 * nodes + 1])
+
+    def adjust(self, skus, deltas):
+        """
+        Add to (or, with negative deltas, take from) existing quantities.
+
+        Args:
+            skus (list): SKUs to change (each at most once per call)
+            deltas (array-like): Change per SKU
+        """
+        current = self.quantities[self._positions(skus)]
+        self.update(skus, current + np.asarray(deltas, dtype=np.int64))
+
+    def add(self, stock):
+        """
+        Insert new SKUs (or overwrite existing ones); the arrays and the tree
+        are rebuilt, so add products in batches.
+
+        Args:
+            stock (dict): SKU -> quantity
+        """
+        merged = dict(self.items())
+        merged.update(stock)
+        self.__init__(merged)
+
+    def prefix_range(self, prefix):
+        """
+        Args:
+            prefix (str): SKU prefix ("" = every SKU)
+
+        Returns:
+            tuple: (start, end) positions of the SKUs starting with prefix
+        """
+        if not prefix:
+            return 0, len(self.skus)
+        # Every SKU with the prefix sorts between it and its successor string
+        successor = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+        start, end = np.searchsorted(self.skus, [prefix, successor])
+        return int(start), int(end)
+
+    def low_stock(self, threshold, prefix=""):
+        """
+        Products with quantity below threshold whose SKU starts with prefix.
+
+        Args:
+            threshold (int): Exclusive quantity limit
+            prefix (str): SKU prefix ("" = every SKU)
+
+        Returns:
+            list: (SKU, quantity) pairs in SKU order
+        """
+        start, end = self.prefix_range(prefix)
+        positions = []
+        # Depth-first over nodes overlapping [start, end) whose minimum is low
+        stack = [(1, 0, self._size)]
+        while stack:
+            node, low, high = stack.pop()
+            if high <= start or low >= end or self._tree[node] >= threshold:
+                continue
+            if start <= low and high <= end and high - low <= _SCAN_LEAVES:
+                leaves = self._tree[self._size + low:self._size + high]
+                positions.extend((np.flatnonzero(leaves < threshold) + low).tolist())
+                continue
+            middle = (low + high) // 2
+            stack.append((2 * node + 1, middle, high))
+            stack.append((2 * node, low, middle))
+        return list(zip(self.skus[positions].tolist(), self.quantities[positions].tolist()))
+
+
+def _scan_low_stock(stock, threshold, prefix):
+    """LAB-Paper's checkstock scan (collecting instead of printing), the benchmark baseline"""
+    return [(sku, quantity) for sku, quantity in stock.items()
+            if sku.startswith(prefix) and quantity < threshold]
+
+
+def benchmark_inventory(skus=1_000_000, queries=100, updates=10_000, seed=0):
+    """
+    Compare the full dict scan of checkstock with Inventory.low_stock() on a
+    large catalogue, before and after a batch of quantity changes.
+
+    Args:
+        skus (int): Catalogue size
+        queries (int): Prefix/threshold queries timed
+        updates (int): Quantities changed between the two query rounds
+        seed (int): Random seed
+    """
+    rng = np.random.default_rng(seed)
+    names = [f"p{category:03d}-{number:07d}" for category, number in
+             zip(rng.integers(0, 1000, skus).tolist(), range(skus))]
+    stock = dict(zip(names, rng.integers(0, 10_000, skus).tolist()))
+    prefixes = [f"p{category:03d}"[:length] for category, length in
+                zip(rng.integers(0, 1000, queries).tolist(), rng.integers(2, 5, queries).tolist())]
+
+    print("\n" + "=" * 70)
+    print("📊 INVENTORY LOW-STOCK BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    inventory = Inventory(stock)
+    build_time = time.perf_counter() - start_time
+
+    changed = rng.choice(names, updates, replace=False).tolist()
+    new_quantities = rng.integers(0, 10_000, updates)
+    results = []
+    timings = {"scan": 0.0, "index": 0.0, "update": 0.0}
+    for round_number in range(2):
+        for prefix in prefixes:
+            start_time = time.perf_counter()
+            scanned = _scan_low_stock(stock, 100, prefix)
+            timings["scan"] += time.perf_counter() - start_time
+
+            start_time = time.perf_counter()
+            indexed = inventory.low_stock(100, prefix)
+            timings["index"] += time.perf_counter() - start_time
+            results.append(sorted(scanned) == indexed)
+        if round_number == 0:
+            stock.update(zip(changed, new_quantities.tolist()))
+            start_time = time.perf_counter()
+            inventory.update(changed, new_quantities)
+            timings["update"] = time.perf_counter() - start_time
+
+    per_query = 2 * queries
+    print(f"SKUs: {skus}  |  Queries: {per_query}  |  Threshold: 100")
+    print(f"{'Operation':<44} {'Time (s)':<12} {'Per query (ms)':<14}")
+    print("-" * 70)
+    print(f"{'Build Inventory (sort + segment tree)':<44} {build_time:<12.3f}")
+    for method, key in (("checkstock-style dict scan", "scan"), ("Inventory.low_stock", "index")):
+        print(f"{method:<44} {timings[key]:<12.3f} {timings[key] / per_query * 1000:<14.3f}")
+    print(f"{f'Inventory.update ({updates} SKUs)':<44} {timings['update']:<12.3f}")
+    print("-" * 70)
+    print(f"Identical results (before and after updates): {all(results)}")
+    print("=" * 70 + "\n")
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the inventory benchmark.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Indexed inventory store")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser("bench", help="benchmark low-stock queries against a dict scan")
+    bench.add_argument("--skus", type=int, default=1_000_000, help="catalogue size")
+    bench.add_argument("--queries", type=int, default=100, help="queries per round")
+
+    args = parser.parse_args(argv)
+    if args.command == "bench":
+        benchmark_inventory(args.skus, args.queries)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,8 @@
+def main():
+    print("TASK # 1")
+    tasklist=["MANGO","STUDENT",466,3.14,'X','Y','Z',True,False]
+    print(tasklist[-7:-1])
 
-print("TASK # 1")
-tasklist=["MANGO","STUDENT",466,3.14,'X','Y','Z',True,False]
-print(tasklist[-7:-1])
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
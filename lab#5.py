@@ -42,4 +42,5 @@ def loopfunction():
             print("Invalid choice. Please enter a number between 1 and 4.")
 
 
-loopfunction()
+if __name__ == "__main__":
+    loopfunction()
@@ -115,5 +115,6 @@ def loopfunction():
         else:
             print("Invalid choice. Please enter a number between 1 and 9.")
 
-loopfunction()  
 
+if __name__ == "__main__":
+    loopfunction()
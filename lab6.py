@@ -40,15 +40,6 @@ def bfs(graph, start, goal):
     return None  
 
 
-
-start_node = 'A'  
-goal_node = 'G'
-
-print("BFS Search (Shortest Path)")
-bfs_path = bfs(graph2, start_node, goal_node)
-print("Path Found by BFS:", bfs_path)
-
-
 def dfs(graph, start, goal):
     stack = [[start]]  
     visited = set()           
@@ -65,9 +56,6 @@ def dfs(graph, start, goal):
                 stack.append(new_path)
     return None 
 
-print("DFS Search (Shortest Path)")
-dfs_path = dfs(graph2, start_node, goal_node)
-print("Path Found by DFS:", dfs_path)
 
 graph_ucs = {
     'A': {'B': 13, 'C': 4},
@@ -79,8 +67,6 @@ graph_ucs = {
     'G': {}
 }
 
-start_node = 'A'
-goal_node = 'G'
 
 def ucs(graph, start, goal):
     pq = queue.PriorityQueue()
@@ -103,8 +89,23 @@ def ucs(graph, start, goal):
     return None, float('inf')
 
 
+def main():
+    start_node = 'A'  
+    goal_node = 'G'
+
+    print("BFS Search (Shortest Path)")
+    bfs_path = bfs(graph2, start_node, goal_node)
+    print("Path Found by BFS:", bfs_path)
+
+    print("DFS Search (Shortest Path)")
+    dfs_path = dfs(graph2, start_node, goal_node)
+    print("Path Found by DFS:", dfs_path)
+
+    print("UCS Search (Lowest Cost Path)")
+    ucs_path, ucs_cost = ucs(graph_ucs, start_node, goal_node)
+    print("Path Found by UCS:", ucs_path)
+    print("Cost of Path Found by UCS:", ucs_cost)
+
 
-print("UCS Search (Lowest Cost Path)")
-ucs_path, ucs_cost = ucs(graph_ucs, start_node, goal_node)
-print("Path Found by UCS:", ucs_path)
-print("Cost of Path Found by UCS:", ucs_cost)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -33,10 +33,14 @@ def uniform_cost_search(graph, start, goal):
     return None, float('inf')
 
 
+def main():
+    start_node = 'A'
+    goal_node = 'F'
+    path, total_cost = uniform_cost_search(graph, start_node, goal_node)
 
-start_node = 'A'
-goal_node = 'F'
-path, total_cost = uniform_cost_search(graph, start_node, goal_node)
+    print("Path found by UCS:", path)
+    print("Total cost:", total_cost)
 
-print("Path found by UCS:", path)
-print("Total cost:", total_cost)
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()
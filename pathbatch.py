@@ -0,0 +1,227 @@
+"""
+Campus Path Batch Queries
+Non-interactive query engine shared by the campus path finders
+(Fall-23-BSCS-466-OEL.py and Fall-23-BSCS-628-OEL.py). Each script keeps its
+own graph and search functions; this module reads graph files, parses query
+lines and streams them through a worker pool into JSONL/CSV result records.
+"""
+
+import csv
+import json
+import os
+import sys
+import time
+
+BATCH_FIELDS = ["start", "goal", "algorithm", "constraint", "found", "path", "cost",
+                "nodes_visited", "time", "error"]
+
+
+def read_graph(path):
+    """
+    Read a graph file with one path per line: "location1,location2,cost".
+    A line with a single name is an isolated location; blank lines and lines
+    starting with '#' are ignored.
+
+    Args:
+        path (str): Path of the graph file
+
+    Yields:
+        tuple: (location1, location2, cost); location2 and cost are None for
+            an isolated location
+
+    Raises:
+        ValueError: If a line has neither one nor three fields
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = [field.strip() for field in line.split(",")]
+            if len(fields) == 1:
+                yield fields[0], None, None
+            elif len(fields) == 3:
+                yield fields[0], fields[1], float(fields[2])
+            else:
+                raise ValueError(f"{path}:{line_number}: expected 'location1,location2,cost', "
+                                 f"got {line!r}")
+
+
+def parse_query(line):
+    """
+    Parse one batch query. Accepts either CSV ("start,goal,algorithm[,constraint]")
+    or a JSON object with the keys start, goal, algorithm and constraint.
+    The constraint is the max depth for BFS/DFS and the max cost for UCS;
+    how a search applies it is up to that search.
+
+    Args:
+        line (str): One line of query input
+
+    Returns:
+        tuple: (start, goal, algorithm, constraint) where constraint may be None
+
+    Raises:
+        ValueError: If a field is missing, empty, not a string or not valid
+    """
+    line = line.strip()
+    if line.startswith("{"):
+        query = json.loads(line)
+        start, goal = query["start"], query["goal"]
+        algorithm, constraint = query.get("algorithm", "ucs"), query.get("constraint")
+    else:
+        fields = [field.strip() for field in line.split(",")]
+        if len(fields) < 2:
+            raise ValueError("expected 'start,goal,algorithm[,constraint]'")
+        start, goal = fields[0], fields[1]
+        algorithm = fields[2] if len(fields) > 2 and fields[2] else "ucs"
+        constraint = fields[3] if len(fields) > 3 and fields[3] else None
+
+    for name, value in (("start", start), ("goal", goal), ("algorithm", algorithm)):
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError(f"{name} must be a non-empty string, got {value!r}")
+    algorithm = algorithm.strip().lower()
+    if algorithm not in ("bfs", "dfs", "ucs"):
+        raise ValueError(f"unknown algorithm {algorithm!r} (use bfs/dfs/ucs)")
+    if constraint is not None:
+        constraint = float(constraint) if algorithm == "ucs" else int(constraint)
+    return start, goal, algorithm, constraint
+
+
+def run_query(line, locations, search):
+    """
+    Run a single batch query and return a flat result record.
+    Errors (bad syntax, unknown locations) are reported in the record instead
+    of stopping the batch.
+
+    Args:
+        line (str): One line of query input
+        locations (container): Known location names
+        search (callable): search(start, goal, algorithm, constraint) returning
+            (path, cost, nodes_visited); an empty or None path means not found
+
+    Returns:
+        dict: Result record with the keys in BATCH_FIELDS
+    """
+    record = dict.fromkeys(BATCH_FIELDS)
+    record["found"] = False
+    try:
+        start, goal, algorithm, constraint = parse_query(line)
+    except (ValueError, KeyError, TypeError, AttributeError) as error:
+        record["error"] = f"{error} in query {line.strip()!r}"
+        return record
+
+    record.update(start=start, goal=goal, algorithm=algorithm.upper(), constraint=constraint)
+    missing = [location for location in (start, goal) if location not in locations]
+    if missing:
+        record["error"] = f"unknown location(s): {', '.join(missing)}"
+        return record
+
+    start_time = time.perf_counter()
+    path, cost, nodes_visited = search(start, goal, algorithm, constraint)
+    record.update(found=bool(path), path=" → ".join(path) if path else None,
+                  cost=cost if path else None, nodes_visited=nodes_visited,
+                  time=round(time.perf_counter() - start_time, 6))
+    return record
+
+
+def run_batch(queries, output, answer, output_format="jsonl", processes=None, window=10_000,
+              initializer=None, initargs=()):
+    """
+    Stream queries through a worker pool and write one result per query.
+    Queries are read and dispatched in fixed-size windows, so memory stays
+    constant however long the input is; results keep the input order.
+
+    Args:
+        queries (iterable): Lines of query input (file object or stdin)
+        output (file): Text stream for the results
+        answer (callable): Top-level function mapping one query line to a record
+        output_format (str): "jsonl" or "csv"
+        processes (int): Worker processes (1 runs in-process, default CPU count)
+        window (int): Queries read ahead and in flight at a time
+        initializer (callable): Run once per worker (or once in-process) before
+            any query, e.g. to load the graph
+        initargs (tuple): Arguments for initializer
+
+    Returns:
+        dict: Aggregate statistics (queries, found, errors, seconds, queries_per_second)
+    """
+    from itertools import islice
+    from multiprocessing import Pool
+
+    if output_format == "csv":
+        writer = csv.DictWriter(output, fieldnames=BATCH_FIELDS)
+        writer.writeheader()
+        write = writer.writerow
+    else:
+        write = lambda record: output.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    lines = (line for line in queries if line.strip() and not line.lstrip().startswith("#"))
+    stats = {"queries": 0, "found": 0, "errors": 0}
+    start_time = time.perf_counter()
+
+    pool = None
+    if processes == 1:
+        if initializer is not None:
+            initializer(*initargs)
+    else:
+        processes = processes or os.cpu_count() or 1
+        pool = Pool(processes, initializer=initializer, initargs=initargs)
+
+    try:
+        while True:
+            batch = list(islice(lines, window))
+            if not batch:
+                break
+            if pool is None:
+                records = map(answer, batch)
+            else:
+                records = pool.imap(answer, batch,
+                                    chunksize=max(1, len(batch) // (4 * processes)))
+            for record in records:
+                write(record)
+                stats["queries"] += 1
+                stats["found"] += record["found"]
+                stats["errors"] += record["error"] is not None
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+    stats["seconds"] = time.perf_counter() - start_time
+    stats["queries_per_second"] = stats["queries"] / stats["seconds"] if stats["seconds"] else 0.0
+    return stats
+
+
+def run_batch_files(queries_path, output_path, answer, output_format="jsonl", processes=None,
+                    initializer=None, initargs=()):
+    """
+    run_batch() on named files ("-" = stdin/stdout), with the summary line
+    printed to stderr so stdout stays a clean result stream.
+
+    Args:
+        queries_path (str): Query file, or "-" for stdin
+        output_path (str): Result file, or "-" for stdout
+        answer (callable): Top-level function mapping one query line to a record
+        output_format (str): "jsonl" or "csv"
+        processes (int): Worker processes (1 runs in-process, default CPU count)
+        initializer (callable): Run once per worker before any query
+        initargs (tuple): Arguments for initializer
+
+    Returns:
+        dict: The statistics from run_batch()
+    """
+    queries = sys.stdin if queries_path == "-" else open(queries_path, "r", encoding="utf-8")
+    output = (sys.stdout if output_path == "-"
+              else open(output_path, "w", encoding="utf-8", newline=""))
+    try:
+        stats = run_batch(queries, output, answer, output_format, processes,
+                          initializer=initializer, initargs=initargs)
+    finally:
+        if queries is not sys.stdin:
+            queries.close()
+        if output is not sys.stdout:
+            output.close()
+    print(f"📊 {stats['queries']} queries ({stats['found']} paths found, "
+          f"{stats['errors']} errors) in {stats['seconds']:.3f} s → "
+          f"{stats['queries_per_second']:.1f} queries/s", file=sys.stderr)
+    return stats
@@ -0,0 +1,323 @@
+"""
+Primes
+Primality for LAB-Paper.py's checkprime and for bulk queries: a segmented
+Sieve of Eratosthenes on NumPy bool arrays for ranges, a cached sieve table
+for small numbers, and deterministic Miller-Rabin for any 64-bit integer.
+"""
+
+import argparse
+import contextlib
+import io
+import math
+import time
+
+import numpy as np
+
+# Numbers below this are answered from the cached sieve table, which never
+# grows past it (16 MB of bools); larger sieves are segmented
+SIEVE_LIMIT = 1 << 24
+DEFAULT_SEGMENT_SIZE = 1 << 20
+
+# With these bases Miller-Rabin is exact for every n < 3.3e24 (so all 64-bit n)
+_MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_MAX_UINT64 = (1 << 64) - 1
+
+_sieve = np.zeros(0, dtype=bool)
+
+
+def sieve(limit):
+    """
+    Sieve of Eratosthenes.
+
+    Args:
+        limit (int): Exclusive upper bound
+
+    Returns:
+        ndarray: bool array where entry n says whether n is prime
+    """
+    table = np.ones(max(limit, 2), dtype=bool)
+    table[:2] = False
+    for p in range(2, math.isqrt(max(limit - 1, 0)) + 1):
+        if table[p]:
+            table[p * p::p] = False
+    return table[:limit]
+
+
+def sieve_table(limit):
+    """
+    The cached sieve table, grown (by doubling, up to SIEVE_LIMIT) to cover
+    at least `limit`.
+
+    Args:
+        limit (int): Exclusive upper bound that must be covered
+
+    Returns:
+        ndarray: bool primality table of length >= limit
+
+    Raises:
+        ValueError: If limit exceeds SIEVE_LIMIT (use segmented_sieve)
+    """
+    global _sieve
+    if limit > SIEVE_LIMIT:
+        raise ValueError(f"the cached sieve table stops at {SIEVE_LIMIT}; use segmented_sieve()")
+    if len(_sieve) < limit:
+        _sieve = sieve(min(max(limit, 2 * len(_sieve), 1 << 16), SIEVE_LIMIT))
+    return _sieve
+
+
+def segmented_sieve(low, high, segment_size=DEFAULT_SEGMENT_SIZE):
+    """
+    Primes in [low, high), sieved one segment at a time so memory stays at
+    one segment plus the base primes up to sqrt(high). Base primes come from
+    the cached table while it covers them, and from a segmented pass of
+    their own beyond SIEVE_LIMIT.
+
+    Args:
+        low (int): Inclusive lower bound
+        high (int): Exclusive upper bound
+        segment_size (int): Numbers sieved per segment
+
+    Yields:
+        ndarray: int64 primes of each segment, in increasing order
+    """
+    low = max(low, 2)
+    if high <= low:
+        return
+    root = math.isqrt(high - 1)
+    if root < SIEVE_LIMIT:
+        base = np.flatnonzero(sieve_table(root + 1)[:root + 1])
+    else:
+        base = primes_in_range(2, root + 1, segment_size)
+    for start in range(low, high, segment_size):
+        end = min(start + segment_size, high)
+        segment = np.ones(end - start, dtype=bool)
+        for p in base.tolist():
+            if p * p >= end:
+                break
+            first = max(p * p, -(-start // p) * p)
+            segment[first - start::p] = False
+        yield np.flatnonzero(segment).astype(np.int64) + start
+
+
+def primes_in_range(low, high, segment_size=DEFAULT_SEGMENT_SIZE):
+    """
+    Args:
+        low (int): Inclusive lower bound
+        high (int): Exclusive upper bound
+        segment_size (int): Numbers sieved per segment
+
+    Returns:
+        ndarray: int64 primes in [low, high)
+    """
+    return np.concatenate([np.zeros(0, dtype=np.int64), *segmented_sieve(low, high, segment_size)])
+
+
+def miller_rabin(n):
+    """
+    Deterministic Miller-Rabin test (exact for every n < 3.3e24).
+
+    Args:
+        n (int): Number to test
+
+    Returns:
+        bool: True if n is prime
+    """
+    if n < 2:
+        return False
+    for p in _MR_BASES:
+        if n % p == 0:
+            return n == p
+    d, shifts = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        shifts += 1
+    for a in _MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(shifts - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def is_prime(n):
+    """
+    Primality of one number: a sieve-table lookup for small n, Miller-Rabin
+    otherwise.
+
+    Args:
+        n (int): Number to test
+
+    Returns:
+        bool: True if n is prime
+    """
+    n = int(n)
+    if n < SIEVE_LIMIT:
+        return n >= 2 and bool(sieve_table(n + 1)[n])
+    return miller_rabin(n)
+
+
+def checkprime_many(values):
+    """
+    Primality of many numbers at once. Values below SIEVE_LIMIT are looked up
+    in the cached sieve table in one vectorized step; larger ones are first
+    screened against the small primes with vectorized remainders, and only
+    the survivors run Miller-Rabin.
+
+    Args:
+        values (array-like): Integers in the 64-bit range (negative = not prime)
+
+    Returns:
+        ndarray: bool array of the same shape
+
+    Raises:
+        ValueError: If a value is not an integer or does not fit in 64 bits
+    """
+    # Lists stay exact Python ints (NumPy would turn huge ones into floats)
+    values = values if isinstance(values, np.ndarray) else np.array(values, dtype=object)
+    if values.dtype.kind not in "iub":
+        numbers = [int(n) for n in values.ravel().tolist()]
+        if any(n != value for n, value in zip(numbers, values.ravel().tolist())) or \
+                any(n < -(1 << 63) or n > _MAX_UINT64 for n in numbers):
+            raise ValueError("checkprime_many() accepts 64-bit integers only")
+        if numbers and max(numbers) >= 1 << 63:
+            # Negative numbers are never prime; 0 keeps them so in uint64
+            values = np.array([max(n, 0) for n in numbers], dtype=np.uint64).reshape(values.shape)
+        else:
+            values = np.array(numbers, dtype=np.int64).reshape(values.shape)
+
+    result = np.zeros(values.shape, dtype=bool)
+    flat = values.ravel()
+    small = (flat >= 0) & (flat < SIEVE_LIMIT) if flat.dtype.kind == "i" else flat < SIEVE_LIMIT
+    if small.any():
+        table = sieve_table(int(flat[small].max()) + 1)
+        result.ravel()[small] = table[flat[small].astype(np.intp)]
+
+    large = np.flatnonzero(~small & (flat >= SIEVE_LIMIT))
+    if len(large):
+        candidates = flat[large].astype(np.uint64)
+        survivors = np.ones(len(large), dtype=bool)
+        for p in np.flatnonzero(sieve_table(1000)[:1000]).tolist():
+            survivors &= candidates % np.uint64(p) != 0
+        tested = large[survivors]
+        result.ravel()[tested] = [miller_rabin(int(n)) for n in flat[tested].tolist()]
+    return result
+
+
+def _trial_division(n):
+    """LAB-Paper's original checkprime, kept as the benchmark baseline"""
+    if n <= 1:
+        return False
+    for i in range(2, int(n**0.5) + 1):
+        print(i)
+        if n % i == 0:
+            return False
+    return True
+
+
+def benchmark_primes(count=1_000_000, maximum=10_000_000, sample=2_000, seed=0):
+    """
+    Compare the original trial-division checkprime (printing every divisor
+    it tries, to a buffer) with is_prime()/checkprime_many() and the sieve.
+
+    Args:
+        count (int): Random numbers checked in the batch test
+        maximum (int): Exclusive upper bound of the random numbers
+        sample (int): Numbers timed with the original function (extrapolated)
+        seed (int): Random seed
+    """
+    rng = np.random.default_rng(seed)
+    numbers = rng.integers(0, maximum, count)
+    large = rng.integers(1 << 62, 1 << 63, 10_000, dtype=np.int64)
+
+    print("\n" + "=" * 70)
+    print("📊 PRIMALITY BENCHMARK")
+    print("=" * 70)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        start_time = time.perf_counter()
+        reference = [_trial_division(n) for n in numbers[:sample].tolist()]
+        trial_time = (time.perf_counter() - start_time) / sample * count
+
+        start_time = time.perf_counter()
+        _trial_division(1_000_000_007)
+        trial_one_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    is_prime(1_000_000_007)
+    single_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    batch = checkprime_many(numbers)
+    batch_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    large_result = checkprime_many(large)
+    large_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    found = sum(len(segment) for segment in segmented_sieve(10**9, 10**9 + 10**7))
+    segment_time = time.perf_counter() - start_time
+
+    same = batch[:sample].tolist() == reference
+    print(f"{'Task':<52} {'Time (s)':<12}")
+    print("-" * 70)
+    print(f"{'checkprime(1_000_000_007), original':<52} {trial_one_time:<12.4f}")
+    print(f"{'is_prime(1_000_000_007), Miller-Rabin':<52} {single_time:<12.4f}")
+    print(f"{f'{count} numbers < {maximum}, original (extrapolated)':<52} {trial_time:<12.3f}")
+    print(f"{f'{count} numbers < {maximum}, checkprime_many':<52} {batch_time:<12.3f}")
+    print(f"{'10000 numbers in [2^62, 2^63), checkprime_many':<52} {large_time:<12.3f}")
+    print(f"{'primes in [1e9, 1e9 + 1e7), segmented sieve':<52} {segment_time:<12.3f}")
+    print("-" * 70)
+    print(f"Primes found: batch {int(batch.sum())}, 64-bit {int(large_result.sum())}, "
+          f"range {found}")
+    print(f"Identical answers: {same}")
+    print("=" * 70 + "\n")
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Primality tests and prime sieves")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check = commands.add_parser("check", help="test numbers for primality")
+    check.add_argument("numbers", type=int, nargs="+", help="numbers to test")
+
+    primes_range = commands.add_parser("range",
+                                       help="count (and optionally list) primes in [LOW, HIGH)")
+    primes_range.add_argument("low", type=int)
+    primes_range.add_argument("high", type=int)
+    primes_range.add_argument("--list", action="store_true", help="print every prime")
+
+    bench = commands.add_parser("bench", help="benchmark against the original checkprime")
+    bench.add_argument("--count", type=int, default=1_000_000,
+                       help="random numbers in the batch test")
+    bench.add_argument("--max", type=int, default=10_000_000,
+                       help="upper bound of the random numbers")
+
+    args = parser.parse_args(argv)
+    if args.command == "check":
+        for number, prime in zip(args.numbers, checkprime_many(args.numbers).tolist()):
+            print(f"{number}: {'prime' if prime else 'not prime'}")
+    elif args.command == "range":
+        found = 0
+        for segment in segmented_sieve(args.low, args.high):
+            found += len(segment)
+            if args.list:
+                print("\n".join(map(str, segment.tolist())))
+        print(f"{found} primes in [{args.low}, {args.high})")
+    elif args.command == "bench":
+        benchmark_primes(args.count, args.max)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Sensor Health
+Failure monitoring for large sensor fleets (LAB-Paper.py's failed-sensor
+checks). Sensor IDs, counters and the failed flags live in NumPy arrays, each
+batch of readings is applied with vectorized updates, and every batch reports
+only the sensors whose status changed instead of rescanning the fleet.
+"""
+
+import argparse
+import time
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+# Sensors whose status changed in one batch (IDs in registration order)
+HealthUpdate = namedtuple("HealthUpdate", ["failed", "recovered"])
+
+# Per-sensor state arrays: name -> (dtype, value for a new sensor)
+STATE_COLUMNS = {"readings": (np.int64, 0),                # readings received
+                 "successes": (np.int64, 0),               # good readings received
+                 "consecutive_failures": (np.int64, 0),
+                 "last_value": (np.float64, np.nan),
+                 "failed": (bool, False)}
+
+
+def _state_view(name):
+    """Property exposing the filled part of one state buffer (a writable view)"""
+    return property(lambda self: self._state[name][:self._size],
+                    doc=f"{name} per sensor, in slot order")
+
+
+class SensorFleet:
+    """
+    Health state of a fleet of sensors. A reading of 0 (or NaN) is a failed
+    reading; a sensor is failed once its latest `failure_threshold` readings
+    all failed, and recovers with its next good reading.
+    """
+
+    def __init__(self, sensor_ids=(), failure_threshold=1):
+        """
+        Args:
+            sensor_ids (list): Sensors to register up front (more are added
+                as they first report)
+            failure_threshold (int): Consecutive failed readings that mark a sensor failed
+        """
+        self.failure_threshold = failure_threshold
+        # IDs and state live in buffers with spare capacity; only the first
+        # _size slots are in use. The dict answers "already registered?" and
+        # the hash index for batch lookups is rebuilt lazily after growth.
+        self._size = 0
+        self._slot_of = {}
+        self._ids = np.empty(0, dtype=object)
+        self._state = {name: np.full(0, fill, dtype=dtype)
+                       for name, (dtype, fill) in STATE_COLUMNS.items()}
+        self._lookup = None
+        self.add_sensors(sensor_ids)
+
+    readings = _state_view("readings")
+    successes = _state_view("successes")
+    consecutive_failures = _state_view("consecutive_failures")
+    last_value = _state_view("last_value")
+    failed = _state_view("failed")
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def _index(self):
+        """pandas hash index over the registered IDs (slot order)"""
+        if self._lookup is None:
+            self._lookup = pd.Index(self._ids[:self._size])
+        return self._lookup
+
+    @property
+    def ids(self):
+        """Sensor IDs in registration order (slot order)"""
+        return self._index
+
+    def add_sensors(self, sensor_ids):
+        """
+        Register sensors that are not known yet (known IDs are ignored).
+        The ID and state buffers at least double when they fill up, so registering
+        sensors a few at a time costs amortized O(1) copies per sensor.
+
+        Args:
+            sensor_ids (list): Sensor IDs
+        """
+        new = [sensor for sensor in dict.fromkeys(sensor_ids) if sensor not in self._slot_of]
+        if not new:
+            return
+        size = self._size
+        needed = size + len(new)
+        if needed > len(self._ids):
+            capacity = max(2 * len(self._ids), needed)
+            ids = np.empty(capacity, dtype=object)
+            ids[:size] = self._ids[:size]
+            self._ids = ids
+            for name, (dtype, fill) in STATE_COLUMNS.items():
+                buffer = np.full(capacity, fill, dtype=dtype)
+                buffer[:size] = self._state[name][:size]
+                self._state[name] = buffer
+        self._ids[size:needed] = new
+        self._slot_of.update(zip(new, range(size, needed)))
+        self._size = needed
+        self._lookup = None
+
+    def slots(self, sensor_ids, register=True):
+        """
+        Array positions of sensors, for batches that repeat the same IDs
+        (pass the result to ingest_slots() and skip the hashing).
+
+        Args:
+            sensor_ids (list): Sensor IDs
+            register (bool): Add unknown sensors instead of raising
+
+        Returns:
+            ndarray: Slot per sensor
+
+        Raises:
+            KeyError: If a sensor is unknown and register is False
+        """
+        slots = self._index.get_indexer(pd.Index(sensor_ids))
+        if (slots < 0).any():
+            unknown = np.asarray(sensor_ids, dtype=object)[slots < 0]
+            if not register:
+                raise KeyError(f"Unknown sensor(s): {', '.join(map(str, unknown[:5]))}")
+            self.add_sensors(unknown)
+            slots = self._index.get_indexer(pd.Index(sensor_ids))
+        return slots
+
+    def ingest(self, sensor_ids, values):
+        """
+        Apply one batch of readings.
+
+        Args:
+            sensor_ids (list): Sensor per reading (repeats allowed, in time order)
+            values (array-like): Reading values (0 or NaN = failed reading)
+
+        Returns:
+            HealthUpdate: Sensors that failed / recovered in this batch
+        """
+        return self.ingest_slots(self.slots(sensor_ids), values)
+
+    def ingest_slots(self, slots, values):
+        """
+        ingest() for readings already mapped to slots (see slots()).
+
+        Args:
+            slots (ndarray): Slot per reading
+            values (array-like): Reading values (0 or NaN = failed reading)
+
+        Returns:
+            HealthUpdate: Sensors that failed / recovered in this batch
+        """
+        slots = np.asarray(slots, dtype=np.intp)
+        values = np.asarray(values, dtype=np.float64)
+        if not len(slots):
+            return HealthUpdate(self._index[:0], self._index[:0])
+
+        good = (values != 0) & ~np.isnan(values)
+        # Sorting the batch finds repeated sensors in O(b log b), whatever the fleet size
+        order = np.argsort(slots, kind="stable")
+        sorted_slots = slots[order]
+        new_sensor = np.r_[True, sorted_slots[1:] != sorted_slots[:-1]]
+        if new_sensor.all():
+            # One reading per sensor (the usual case): plain scatter updates
+            sensors = slots
+            self.consecutive_failures[sensors] = np.where(good, 0,
+                                                          self.consecutive_failures[sensors] + 1)
+            self.readings[sensors] += 1
+            self.successes[sensors] += good
+            self.last_value[sensors] = values
+        else:
+            # Group the batch by sensor, keeping each sensor's readings in order
+            slots, values, good = sorted_slots, values[order], good[order]
+            starts = np.flatnonzero(new_sensor)
+            ends = np.r_[starts[1:], len(slots)]
+            sensors = slots[starts]
+
+            last_good = np.maximum.reduceat(np.where(good, np.arange(len(slots)), -1), starts)
+            counts = ends - starts
+            # A good reading resets the run; otherwise the whole batch extends it
+            self.consecutive_failures[sensors] = np.where(
+                last_good >= starts, ends - 1 - last_good,
+                self.consecutive_failures[sensors] + counts)
+            self.readings[sensors] += counts
+            self.successes[sensors] += np.add.reduceat(good.astype(np.int64), starts)
+            self.last_value[sensors] = values[ends - 1]
+
+        was_failed = self.failed[sensors]
+        now_failed = self.consecutive_failures[sensors] >= self.failure_threshold
+        self.failed[sensors] = now_failed
+        # Transitions are few, so sorting them (slots = registration order) is cheap
+        return HealthUpdate(self._index[np.sort(sensors[now_failed & ~was_failed])],
+                            self._index[np.sort(sensors[was_failed & ~now_failed])])
+
+    def failed_ids(self):
+        """
+        Returns:
+            Index: IDs of every currently failed sensor
+        """
+        return self._index[self.failed]
+
+    def status(self, sensor_ids):
+        """
+        Args:
+            sensor_ids (list): Sensor IDs
+
+        Returns:
+            DataFrame: Counters and failed flag per sensor
+        """
+        slots = self.slots(sensor_ids, register=False)
+        return pd.DataFrame({"readings": self.readings[slots], "successes": self.successes[slots],
+                             "consecutive_failures": self.consecutive_failures[slots],
+                             "last_value": self.last_value[slots], "failed": self.failed[slots]},
+                            index=pd.Index(sensor_ids, name="sensor"))
+
+
+def benchmark_fleet(sensors=100_000, minutes=60, failure_rate=0.01, seed=0):
+    """
+    Compare rescanning a dict of readings every minute (the LAB-Paper loop)
+    with SensorFleet batches, for a fleet reporting once a minute.
+
+    Args:
+        sensors (int): Fleet size
+        minutes (int): Batches (one reading per sensor each)
+        failure_rate (float): Chance that a reading is 0
+        seed (int): Random seed
+    """
+    rng = np.random.default_rng(seed)
+    ids = [f"SENSOR_{i:06d}" for i in range(sensors)]
+    batches = [np.where(rng.random(sensors) < failure_rate, 0, rng.integers(1, 200, sensors))
+               for _ in range(minutes)]
+
+    print("\n" + "=" * 70)
+    print("📊 SENSOR FLEET HEALTH BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    previous = set()
+    dict_transitions = 0
+    for batch in batches:
+        readings = dict(zip(ids, batch.tolist()))
+        failed = set()
+        for sensor, value in readings.items():
+            if value == 0:
+                failed.add(sensor)
+        dict_transitions += len(failed - previous)
+        previous = failed
+    dict_time = time.perf_counter() - start_time
+
+    timings = []
+    for by_slot in (False, True):
+        fleet = SensorFleet(ids)
+        slots = fleet.slots(ids)
+        start_time = time.perf_counter()
+        transitions = 0
+        for batch in batches:
+            update = fleet.ingest_slots(slots, batch) if by_slot else fleet.ingest(ids, batch)
+            transitions += len(update.failed)
+        timings.append(time.perf_counter() - start_time)
+
+    same = transitions == dict_transitions and set(fleet.failed_ids()) == previous
+    print(f"Sensors: {sensors}  |  Batches: {minutes}  |  Failure rate: {failure_rate:.0%}")
+    print(f"{'Method':<44} {'Time (s)':<12} {'Per batch (ms)':<14}")
+    print("-" * 70)
+    for method, elapsed in (("dict loop + set diff (rescan)", dict_time),
+                            ("SensorFleet.ingest (IDs)", timings[0]),
+                            ("SensorFleet.ingest_slots", timings[1])):
+        print(f"{method:<44} {elapsed:<12.3f} {elapsed / minutes * 1000:<14.2f}")
+    print("-" * 70)
+    print(f"Failure transitions: {transitions}  |  Identical results: {same}")
+    print("=" * 70 + "\n")
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the fleet benchmark.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Sensor fleet health monitor")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser("bench", help="benchmark SensorFleet against per-key dict loops")
+    bench.add_argument("--sensors", type=int, default=100_000, help="fleet size")
+    bench.add_argument("--minutes", type=int, default=60, help="batches of readings")
+
+    args = parser.parse_args(argv)
+    if args.command == "bench":
+        benchmark_fleet(args.sensors, args.minutes)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,2063 @@
+"""
+SmartFarm Sensor Toolkit
+Fast, memory-bounded loading and analysis of the SmartFarm sensor CSV
+(Temperature, Moisture, Humidity, Location) used by Lab12.
+"""
+
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import re
+import struct
+import time
+from collections import namedtuple
+from itertools import islice
+
+import numpy as np
+
+# Numeric sensor columns, in file order
+SENSOR_COLUMNS = ("Temperature", "Moisture", "Humidity")
+
+# Binary column caches live in this folder next to the CSV they were built from
+CACHE_DIR_NAME = ".smartfarm_cache"
+
+# Fixed .npy header size: lets a column file be written in one streaming pass
+# and its final row count filled in afterwards
+_NPY_HEADER_SIZE = 128
+
+# Rows parsed per chunk: large enough to amortize parser overhead, small
+# enough that a chunk (65536 x 3 floats = 1.5 MB) stays cache/RAM friendly
+DEFAULT_CHUNK_ROWS = 65_536
+
+# Text column holding where a reading was taken; stored as integer codes
+LOCATION_COLUMN = "Location"
+
+# Row layout for the one-pass parse (location names longer than 64
+# characters are truncated)
+_ROW_DTYPE = np.dtype([(name, np.float64) for name in SENSOR_COLUMNS] + [(LOCATION_COLUMN, "U64")])
+
+# A loaded sensor file: numeric matrix, Location codes and the code table
+SensorData = namedtuple("SensorData", ["values", "codes", "labels"])
+
+# Rows a query evaluates at a time: a block's readings (1.5 MB) and its 64 KB
+# mask buffers stay in cache between comparisons, and per-block overhead is small
+QUERY_BLOCK_ROWS = 65_536
+
+# Use a sorted index only if it narrows a query to at most this fraction of
+# the rows; beyond that a blocked scan is cheaper than gathering the matches
+_INDEX_SELECTIVITY = 0.25
+
+# Output buffer for write_csv: few, large writes instead of one per row
+WRITE_BUFFER_BYTES = 1 << 20
+
+# gzip level for compressed output: level 1 compresses sensor CSVs about 3x
+# at little more than the cost of writing plain text (level 6 is ~3x slower)
+GZIP_LEVEL = 1
+
+# Filters counted by analyze_stream (the Lab12 comparisons), as Query expressions
+STREAM_FILTERS = ("temperature > 25", "moisture < 40", "75 <= humidity <= 85",
+                  "temperature > 25 and moisture > 40", "humidity < 80 or temperature < 22")
+
+
+def _parse_lines(text, has_location=True):
+    """
+    Parse a block of CSV lines with NumPy's C parser. Empty readings become
+    NaN and empty locations become "".
+
+    Args:
+        text (str): Complete CSV lines without the header
+        has_location (bool): Whether the lines have a fourth Location field
+
+    Returns:
+        tuple: (values, locations) with an (n, 3) float array and an array of
+        location strings (None when the file has no Location column)
+    """
+    if not text.endswith("\n"):
+        text += "\n"
+    # Fill empty fields with plain str.replace passes (much faster than a regex).
+    # Two ",," passes are enough: the first leaves no two gaps adjacent.
+    text = "\n" + text
+    text = text.replace(",,", ",nan,").replace(",,", ",nan,").replace("\n,", "\nnan,")
+    if not has_location:
+        text = text.replace(",\n", ",nan\n")
+        values = np.loadtxt(io.StringIO(text), delimiter=",", usecols=range(len(SENSOR_COLUMNS)),
+                            dtype=np.float64, ndmin=2)
+        return values, None
+
+    # One pass parses the numbers and the location text together
+    parsed = np.loadtxt(io.StringIO(text), delimiter=",", dtype=_ROW_DTYPE, ndmin=1)
+    values = np.column_stack([parsed[name] for name in SENSOR_COLUMNS]) if parsed.size else \
+        np.empty((0, len(SENSOR_COLUMNS)))
+    return values, parsed[LOCATION_COLUMN]
+
+
+def _encode_locations(raw, labels, codes_of):
+    """
+    Turn location strings into integer codes, growing the shared code table.
+
+    Args:
+        raw (ndarray): Location strings of one chunk
+        labels (list): Code table (labels[code] is the location name); extended in place
+        codes_of (dict): {location name: code}; extended in place
+
+    Returns:
+        ndarray: int32 codes, -1 where the location is missing
+    """
+    uniques, inverse = np.unique(raw, return_inverse=True)
+    lookup = np.empty(len(uniques), dtype=np.int32)
+    for i, label in enumerate(uniques.tolist()):
+        label = label.strip()
+        if not label:
+            lookup[i] = -1
+            continue
+        if label not in codes_of:
+            codes_of[label] = len(labels)
+            labels.append(label)
+        lookup[i] = codes_of[label]
+    return lookup[inverse.reshape(-1)]
+
+
+def _read_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS, labels=None, offset=None,
+                 complete_lines=False):
+    """
+    Stream the sensor CSV in chunks, reporting how far into the file each
+    chunk ends (see iter_chunks for the buffer reuse rules).
+
+    Args:
+        path (str): Path of the sensor CSV (with a header row)
+        chunk_rows (int): Maximum rows per chunk
+        labels (list): Location code table, extended in place
+        offset (int): Byte offset to start reading from (None = after the header)
+        complete_lines (bool): Stop before a last line without a newline,
+            which may still be being written
+
+    Yields:
+        tuple: (values, codes, end) where end is the byte offset just after the chunk
+    """
+    labels = [] if labels is None else labels
+    codes_of = {label: code for code, label in enumerate(labels)}
+    buffer = np.empty((chunk_rows, len(SENSOR_COLUMNS)), dtype=np.float64)
+    code_buffer = np.empty(chunk_rows, dtype=np.int32)
+    with open(path, "rb") as file:
+        has_location = len(file.readline().split(b",")) > len(SENSOR_COLUMNS)
+        if offset is not None:
+            file.seek(offset)
+        if not has_location:
+            code_buffer.fill(-1)
+        while True:
+            lines = list(islice(file, chunk_rows))
+            end = file.tell()
+            if complete_lines and lines and not lines[-1].endswith(b"\n"):
+                end -= len(lines.pop())
+            if not lines:
+                break
+            text = b"".join(lines).decode("utf-8")
+            if "\r" in text:
+                text = text.replace("\r\n", "\n")
+            values, raw_locations = _parse_lines(text, has_location)
+            rows = values.shape[0]
+            buffer[:rows] = values
+            if has_location:
+                code_buffer[:rows] = _encode_locations(raw_locations, labels, codes_of)
+            yield buffer[:rows], code_buffer[:rows], end
+
+
+def iter_chunks(path, chunk_rows=DEFAULT_CHUNK_ROWS, labels=None):
+    """
+    Stream the sensor CSV in fixed-size chunks with bounded memory.
+    Every chunk is parsed and copied into preallocated buffers, so the yielded
+    arrays are only valid until the next chunk is read; copy them to keep them.
+
+    Args:
+        path (str): Path of the sensor CSV (with a header row)
+        chunk_rows (int): Maximum rows per chunk
+        labels (list): Location code table, extended in place as new
+            locations appear (pass a list to read the codes' names)
+
+    Yields:
+        tuple: (values, codes) views: values of shape (rows, 3) with
+        Temperature, Moisture, Humidity and int32 Location codes (-1 = missing)
+    """
+    for values, codes, _ in _read_chunks(path, chunk_rows, labels):
+        yield values, codes
+
+
+def load_sensor_data(path, chunk_rows=DEFAULT_CHUNK_ROWS, cache=False):
+    """
+    Load the whole sensor CSV into memory using the streaming parser.
+
+    Args:
+        path (str): Path of the sensor CSV
+        chunk_rows (int): Rows parsed per chunk
+        cache (bool): Read the columns from the binary cache (see load_cached)
+            instead of parsing the text again
+
+    Returns:
+        SensorData: values (rows x 3: Temperature, Moisture, Humidity),
+        codes (int32 Location codes, -1 = missing) and labels (code table)
+    """
+    if cache:
+        columns, labels = load_cached(path, chunk_rows)
+        values = np.column_stack([columns[name] for name in SENSOR_COLUMNS])
+        return SensorData(values, np.array(columns[LOCATION_COLUMN]), labels)
+
+    labels = []
+    chunks, codes = [], []
+    for values, chunk_codes in iter_chunks(path, chunk_rows, labels):
+        chunks.append(values.copy())
+        codes.append(chunk_codes.copy())
+    if not chunks:
+        return SensorData(np.empty((0, len(SENSOR_COLUMNS))), np.empty(0, dtype=np.int32), labels)
+    return SensorData(np.concatenate(chunks), np.concatenate(codes), labels)
+
+
+def _npy_header(rows, dtype):
+    """
+    Build a .npy (format 1.0) header for a 1-D array, padded to _NPY_HEADER_SIZE.
+
+    Args:
+        rows (int): Array length
+        dtype (dtype): Element type
+
+    Returns:
+        bytes: Header to write before the raw array data
+    """
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d,), }" % (
+        np.dtype(dtype).str, rows)
+    header = header.ljust(_NPY_HEADER_SIZE - 10 - 1) + "\n"
+    return b"\x93NUMPY\x01\x00" + struct.pack("<H", len(header)) + header.encode("latin1")
+
+
+def cache_dir(path):
+    """
+    Folder holding the binary column cache of a CSV file. The name includes
+    a hash of the absolute path, so files with the same name do not collide.
+
+    Args:
+        path (str): Path of the sensor CSV
+
+    Returns:
+        str: Cache folder path
+    """
+    source = os.path.abspath(path)
+    digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(os.path.dirname(source), CACHE_DIR_NAME, f"{stem}-{digest}")
+
+
+def _source_signature(path):
+    """Identify a CSV version by absolute path, size and modification time"""
+    info = os.stat(path)
+    return {"source": os.path.abspath(path), "size": info.st_size, "mtime_ns": info.st_mtime_ns}
+
+
+def _read_cache_meta(directory, name="meta.json"):
+    """Return the cache metadata, or None if the cache is missing or incomplete"""
+    try:
+        with open(os.path.join(directory, name), "r", encoding="utf-8") as file:
+            return json.load(file)
+    except (OSError, ValueError):
+        return None
+
+
+def _tail_digest(path, offset):
+    """
+    Fingerprint of the bytes a cache was built from: the header line and the
+    first and last 4 KB before offset. If it still matches (and the file has
+    grown), rows are taken to have been appended. Cheap, whatever the size.
+    """
+    with open(path, "rb") as file:
+        digest = hashlib.sha1(file.readline())
+        first = file.tell()
+        digest.update(file.read(max(0, min(4096, offset - first))))
+        start = max(first, offset - 4096)
+        file.seek(start)
+        digest.update(file.read(max(0, offset - start)))
+    return digest.hexdigest()
+
+
+def _cache_signature(meta):
+    """The part of the cache metadata that identifies one version of the data"""
+    return {key: meta[key] for key in ("source", "size", "mtime_ns", "rows")}
+
+
+def _column_dtype(name):
+    """Element type of a cached column file"""
+    return np.dtype(np.int32 if name == LOCATION_COLUMN else np.float64)
+
+
+def _write_columns(files, values, codes):
+    """Append a chunk to the open column files"""
+    for i, name in enumerate(SENSOR_COLUMNS):
+        files[name].write(np.ascontiguousarray(values[:, i]).tobytes())
+    files[LOCATION_COLUMN].write(codes.tobytes())
+
+
+def _write_meta(directory, meta, name="meta.json"):
+    with open(os.path.join(directory, name), "w", encoding="utf-8") as file:
+        json.dump(meta, file, indent=2)
+
+
+def build_cache(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Parse the CSV once and store every sensor column (and the Location codes)
+    as a .npy file that can be memory-mapped. Columns are streamed to disk
+    chunk by chunk, so building the cache needs no more memory than one chunk.
+    meta.json (with the location code table and how many bytes of the CSV
+    were read) is written last, so an interrupted build is never mistaken
+    for a valid cache.
+
+    Args:
+        path (str): Path of the sensor CSV
+        chunk_rows (int): Rows parsed per chunk
+
+    Returns:
+        str: Cache folder path
+    """
+    directory = cache_dir(path)
+    os.makedirs(directory, exist_ok=True)
+    meta_path = os.path.join(directory, "meta.json")
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    # Taken before reading: if the CSV changes during the build, the next
+    # run sees a different signature and refreshes
+    signature = _source_signature(path)
+    names = SENSOR_COLUMNS + (LOCATION_COLUMN,)
+    files = {name: open(os.path.join(directory, f"{name}.npy.tmp"), "wb") for name in names}
+    labels = []
+    rows = 0
+    offset = None
+    try:
+        for file in files.values():
+            file.write(b"\0" * _NPY_HEADER_SIZE)
+        for values, codes, offset in _read_chunks(path, chunk_rows, labels):
+            rows += values.shape[0]
+            _write_columns(files, values, codes)
+        for name, file in files.items():
+            file.seek(0)
+            file.write(_npy_header(rows, _column_dtype(name)))
+    finally:
+        for file in files.values():
+            file.close()
+
+    if offset is None:
+        with open(path, "rb") as file:
+            offset = len(file.readline())
+    for name in names:
+        os.replace(os.path.join(directory, f"{name}.npy.tmp"),
+                   os.path.join(directory, f"{name}.npy"))
+    _write_meta(directory, dict(signature, rows=rows, columns=list(names), locations=labels,
+                                offset=offset, digest=_tail_digest(path, offset)))
+    return directory
+
+
+def _append_cache(path, meta, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Parse only the rows appended to the CSV since the cache was built and
+    add them to the end of the column files.
+
+    Returns:
+        dict: The new cache metadata
+    """
+    directory = cache_dir(path)
+    meta_path = os.path.join(directory, "meta.json")
+    os.remove(meta_path)  # an interrupted append leads to a full rebuild
+
+    signature = _source_signature(path)
+    names = SENSOR_COLUMNS + (LOCATION_COLUMN,)
+    labels = list(meta["locations"])
+    rows = meta["rows"]
+    offset = meta["offset"]
+    files = {name: open(os.path.join(directory, f"{name}.npy"), "r+b") for name in names}
+    try:
+        for name, file in files.items():
+            file.seek(_NPY_HEADER_SIZE + rows * _column_dtype(name).itemsize)
+        for values, codes, offset in _read_chunks(path, chunk_rows, labels, meta["offset"],
+                                                  complete_lines=True):
+            rows += values.shape[0]
+            _write_columns(files, values, codes)
+        for name, file in files.items():
+            file.seek(0)
+            file.write(_npy_header(rows, _column_dtype(name)))
+    finally:
+        for file in files.values():
+            file.close()
+
+    meta = dict(meta, **signature, rows=rows, locations=labels, offset=offset,
+                digest=_tail_digest(path, offset))
+    _write_meta(directory, meta)
+    return meta
+
+
+def refresh_cache(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Bring the binary cache up to date with the CSV. If rows were only
+    appended since the last run (the bytes already read are unchanged), just
+    the new rows are parsed and added, and the saved summary and sorted
+    indexes are updated with them; otherwise the cache is rebuilt. The cost
+    of an append is proportional to the new data, not the whole history.
+    Appended rows must be whole lines; a last line without a newline (it may
+    still be being written) is left for the next refresh.
+
+    Args:
+        path (str): Path of the sensor CSV
+        chunk_rows (int): Rows parsed per chunk
+
+    Returns:
+        dict: mode ("unchanged", "append" or "rebuild"), rows and new_rows
+    """
+    directory = cache_dir(path)
+    meta = _read_cache_meta(directory)
+    signature = _source_signature(path)
+    if meta is not None and LOCATION_COLUMN in meta.get("columns", ()) and "offset" in meta:
+        if all(meta[key] == value for key, value in signature.items()):
+            return {"mode": "unchanged", "rows": meta["rows"], "new_rows": 0}
+        grown = signature["size"] > meta["size"] and signature["size"] >= meta["offset"]
+        if grown and _tail_digest(path, meta["offset"]) == meta["digest"]:
+            previous = meta
+            meta = _append_cache(path, meta, chunk_rows)
+            _update_derived(directory, previous, meta)
+            return {"mode": "append", "rows": meta["rows"],
+                    "new_rows": meta["rows"] - previous["rows"]}
+
+    build_cache(path, chunk_rows)
+    rows = _read_cache_meta(directory)["rows"]
+    return {"mode": "rebuild", "rows": rows, "new_rows": rows}
+
+
+def _open_columns(directory, meta):
+    return {name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode="r")
+            for name in meta["columns"]}
+
+
+def load_cached(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Open the sensor columns from the binary cache as read-only memory maps,
+    refreshing the cache first if the CSV is new or has changed
+    (see refresh_cache: appended rows are added, anything else rebuilds).
+
+    Args:
+        path (str): Path of the sensor CSV
+        chunk_rows (int): Rows parsed per chunk when the cache is refreshed
+
+    Returns:
+        tuple: ({column name: read-only memmap}, location code table). The
+        Location entry holds int32 codes (-1 = missing).
+    """
+    refresh_cache(path, chunk_rows)
+    directory = cache_dir(path)
+    meta = _read_cache_meta(directory)
+    return _open_columns(directory, meta), meta["locations"]
+
+
+# ColumnStats arrays saved by state()
+_STATE_ARRAYS = ("count", "total", "mean", "m2", "minimum", "maximum")
+
+
+class ColumnStats:
+    """
+    NaN-aware per-column statistics (count, NaN count, sum, mean, variance,
+    min, max) gathered in a single pass. Blocks are folded in one at a time
+    and partial results merge exactly (Chan et al. parallel variance), so the
+    same object summarizes an in-memory array, a stream of chunks or the
+    results of several workers.
+    """
+
+    def __init__(self, columns=SENSOR_COLUMNS):
+        """
+        Args:
+            columns (tuple): Column names, in matrix column order
+        """
+        self.columns = tuple(columns)
+        width = len(self.columns)
+        self.rows = 0
+        self.count = np.zeros(width, dtype=np.int64)
+        self.total = np.zeros(width)
+        self.mean = np.zeros(width)
+        self.m2 = np.zeros(width)  # sum of squared deviations from the mean
+        self.minimum = np.full(width, np.inf)
+        self.maximum = np.full(width, -np.inf)
+
+    @classmethod
+    def from_array(cls, values, columns=SENSOR_COLUMNS, block_rows=DEFAULT_CHUNK_ROWS):
+        """
+        Summarize an in-memory (or memory-mapped) matrix block by block, so
+        every block stays in cache while all its statistics are computed.
+
+        Args:
+            values (ndarray): (rows, columns) matrix
+            columns (tuple): Column names
+            block_rows (int): Rows per block
+
+        Returns:
+            ColumnStats: Statistics of the whole matrix
+        """
+        stats = cls(columns)
+        for start in range(0, len(values), block_rows):
+            stats.update(values[start:start + block_rows])
+        return stats
+
+    def update(self, block):
+        """
+        Fold a block of rows into the statistics.
+
+        Args:
+            block (ndarray): (rows, columns) matrix; NaN marks a missing reading
+
+        Returns:
+            ColumnStats: self
+        """
+        block = np.asarray(block, dtype=np.float64).reshape(-1, len(self.columns))
+        if block.shape[0] == 0:
+            return self
+        present = ~np.isnan(block)
+        count = present.sum(axis=0)
+        filled = np.where(present, block, 0.0)
+        total = filled.sum(axis=0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, total / count, 0.0)
+        deviation = np.where(present, block - mean, 0.0)
+        part = ColumnStats(self.columns)
+        part.rows = block.shape[0]
+        part.count, part.total, part.mean = count, total, mean
+        part.m2 = np.einsum("ij,ij->j", deviation, deviation)
+        # fmin/fmax skip NaN; an all-NaN column keeps the ±inf start value
+        part.minimum = np.fmin(part.minimum, np.fmin.reduce(block, axis=0))
+        part.maximum = np.fmax(part.maximum, np.fmax.reduce(block, axis=0))
+        return self.merge(part)
+
+    def merge(self, other):
+        """
+        Combine the statistics of another part of the data into this one.
+        The result equals the statistics of both parts computed together.
+
+        Args:
+            other (ColumnStats): Statistics over the same columns
+
+        Returns:
+            ColumnStats: self
+        """
+        if other.columns != self.columns:
+            raise ValueError(f"Cannot merge statistics of {other.columns} into {self.columns}")
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            weight = np.where(count > 0, other.count / count, 0.0)
+        self.m2 = self.m2 + other.m2 + delta * delta * self.count * weight
+        self.mean = self.mean + delta * weight
+        self.count = count
+        self.rows += other.rows
+        self.total = self.total + other.total
+        self.minimum = np.fmin(self.minimum, other.minimum)
+        self.maximum = np.fmax(self.maximum, other.maximum)
+        return self
+
+    def state(self):
+        """
+        Returns:
+            dict: The statistics as plain lists, JSON-serializable (see from_state)
+        """
+        return dict({key: getattr(self, key).tolist() for key in _STATE_ARRAYS},
+                    columns=list(self.columns), rows=self.rows)
+
+    @classmethod
+    def from_state(cls, state):
+        """
+        Args:
+            state (dict): Output of state()
+
+        Returns:
+            ColumnStats: The restored statistics
+        """
+        stats = cls(state["columns"])
+        stats.rows = state["rows"]
+        for key in _STATE_ARRAYS:
+            dtype = np.int64 if key == "count" else np.float64
+            setattr(stats, key, np.array(state[key], dtype=dtype))
+        return stats
+
+    @property
+    def nan_count(self):
+        """Missing readings per column"""
+        return self.rows - self.count
+
+    def variance(self, ddof=0):
+        """
+        Args:
+            ddof (int): Delta degrees of freedom (1 = sample variance)
+
+        Returns:
+            ndarray: Per-column variance (NaN where count <= ddof)
+        """
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > ddof, self.m2 / (self.count - ddof), np.nan)
+
+    def to_dict(self, ddof=0):
+        """
+        Returns:
+            dict: {column: {"count", "nan_count", "sum", "mean", "var", "std", "min", "max"}};
+            mean/var/min/max are NaN for a column without readings
+        """
+        variance = self.variance(ddof)
+        empty = self.count == 0
+        mean = np.where(empty, np.nan, self.mean)
+        minimum = np.where(empty, np.nan, self.minimum)
+        maximum = np.where(empty, np.nan, self.maximum)
+        return {name: {"count": int(self.count[i]), "nan_count": int(self.nan_count[i]),
+                       "sum": float(self.total[i]), "mean": float(mean[i]),
+                       "var": float(variance[i]), "std": float(np.sqrt(variance[i])),
+                       "min": float(minimum[i]), "max": float(maximum[i])}
+                for i, name in enumerate(self.columns)}
+
+
+class SortedIndex:
+    """
+    One sorted permutation per sensor column. Once a column is sorted, range
+    predicates are answered with a binary search (O(log n + k) instead of a
+    full scan) and ordered scans or top-N results need no further sorting.
+    Missing readings (NaN) sort last and never match a range.
+
+    Appended rows go into small delta runs, each sorted on its own, so the
+    existing order is neither sorted again nor copied; queries search every
+    run and merge the matches, and compact() folds the runs into the base.
+    """
+
+    def __init__(self, columns, runs=()):
+        """
+        Args:
+            columns (dict): {column name: 1-D array of readings}; indexes are
+                built lazily, the first time a column is queried
+            runs (list): First row of each delta run, in increasing order
+                (the base run covers the rows before the first one)
+        """
+        self.columns = columns
+        self.runs = list(runs)
+        self._parts = {}
+
+    @classmethod
+    def from_array(cls, values, columns=SENSOR_COLUMNS):
+        """
+        Args:
+            values (ndarray): (rows, columns) matrix
+            columns (tuple): Column names, in matrix column order
+
+        Returns:
+            SortedIndex: Index over the matrix columns
+        """
+        return cls({name: values[:, i] for i, name in enumerate(columns)})
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def _bounds(self):
+        """(first row, end row) of the base run and every delta run"""
+        starts = [0, *self.runs]
+        return list(zip(starts, starts[1:] + [len(self)]))
+
+    @staticmethod
+    def _part(order, sorted_values):
+        # NaNs sort to the end: the first NaN marks the end of the valid part
+        return order, sorted_values, int(np.searchsorted(sorted_values, np.nan, side="left"))
+
+    def _column(self, name):
+        """
+        Return one (permutation, sorted readings, non-NaN count) per run,
+        sorting runs on first use. Permutations hold file row numbers.
+        """
+        parts = self._parts.setdefault(name, [])
+        for start, stop in self._bounds()[len(parts):]:
+            readings = np.asarray(self.columns[name][start:stop])
+            order = np.argsort(readings, kind="stable")
+            parts.append(self._part(order + start if start else order, readings[order]))
+        return parts
+
+    def span(self, column, low=None, high=None, low_inclusive=True, high_inclusive=True):
+        """
+        Positions in sorted order of the readings within a range.
+
+        Args:
+            column (str): Column name
+            low (float): Lower bound (None = unbounded)
+            high (float): Upper bound (None = unbounded)
+            low_inclusive (bool): Whether readings equal to low match
+            high_inclusive (bool): Whether readings equal to high match
+
+        Returns:
+            list: One (start, stop) per run (base first), so that the run's
+            order[start:stop] are its matching rows
+        """
+        spans = []
+        for _, sorted_values, valid in self._column(column):
+            readings = sorted_values[:valid]
+            start = 0 if low is None else int(
+                np.searchsorted(readings, low, "left" if low_inclusive else "right"))
+            stop = valid if high is None else int(
+                np.searchsorted(readings, high, "right" if high_inclusive else "left"))
+            spans.append((start, max(start, stop)))
+        return spans
+
+    def count(self, column, low=None, high=None, low_inclusive=True, high_inclusive=True):
+        """Number of readings within a range (arguments as in span), in O(log n)"""
+        return sum(stop - start for start, stop in
+                   self.span(column, low, high, low_inclusive, high_inclusive))
+
+    def range(self, column, low=None, high=None, low_inclusive=True, high_inclusive=True,
+              file_order=True):
+        """
+        Rows whose reading lies within a range (arguments as in span).
+
+        Args:
+            file_order (bool): Return the rows in file order (sorts the k
+                matches); False returns them by value (a view of the index
+                when there are no delta runs)
+
+        Returns:
+            ndarray: Row indices
+        """
+        spans = self.span(column, low, high, low_inclusive, high_inclusive)
+        parts = self._column(column)
+        if len(parts) == 1:
+            (start, stop), (order, _, _) = spans[0], parts[0]
+            return np.sort(order[start:stop]) if file_order else order[start:stop]
+        rows = np.concatenate([order[start:stop]
+                               for (start, stop), (order, _, _) in zip(spans, parts)])
+        if file_order:
+            return np.sort(rows)
+        # Runs are in file order, so a stable sort keeps older rows first on ties
+        values = np.concatenate([sorted_values[start:stop]
+                                 for (start, stop), (_, sorted_values, _) in zip(spans, parts)])
+        return rows[np.argsort(values, kind="stable")]
+
+    def ordered(self, column, descending=False, top=None):
+        """
+        Rows ordered by a column, without sorting again (delta runs are
+        merged, taking at most `top` rows from each). Rows with a missing
+        reading come last in both directions.
+
+        Args:
+            column (str): Column name
+            descending (bool): Largest readings first
+            top (int): Return only the first top rows (None = all)
+
+        Returns:
+            ndarray: Row indices
+        """
+        parts = self._column(column)
+        if len(parts) == 1:
+            order, _, valid = parts[0]
+            if not descending:
+                return order[:top]
+            largest_first = order[:valid][::-1]
+            if top is not None and top <= valid:
+                return largest_first[:top]
+            return np.concatenate([largest_first, order[valid:]])[:top]
+
+        rows, values, missing = [], [], []
+        for order, sorted_values, valid in parts:
+            if top is None:
+                keep = slice(0, valid)
+            elif descending:
+                keep = slice(max(valid - top, 0), valid)
+            else:
+                keep = slice(0, min(top, valid))
+            rows.append(order[keep])
+            values.append(sorted_values[keep])
+            missing.append(order[valid:])
+        # Merging the candidates in ascending order reproduces one stable sort
+        # of the whole column; descending order is its reverse, as above
+        rows = np.concatenate(rows)[np.argsort(np.concatenate(values), kind="stable")]
+        if descending:
+            rows = rows[::-1]
+        return np.concatenate([rows, *missing])[:top]
+
+    def extend(self, columns):
+        """
+        Add appended rows as a new delta run: only the new readings are
+        sorted, and the existing runs are left untouched.
+
+        Args:
+            columns (dict): {column name: readings of every row, the
+                appended rows last}
+
+        Returns:
+            SortedIndex: self
+        """
+        first_row = len(self)
+        self.columns = columns
+        if len(self) > first_row:
+            self.runs.append(first_row)
+        return self
+
+    def compact(self):
+        """
+        Merge the delta runs into the base run. Each run's sorted readings
+        are inserted with one binary search each, so the base is never sorted
+        again; the result equals a fresh stable sort.
+
+        Returns:
+            SortedIndex: self
+        """
+        for name in self.columns:
+            (order, sorted_values, _), *runs = self._column(name)
+            for run_order, run_sorted, _ in runs:
+                # "right": equal (and NaN) readings go after the older rows
+                positions = np.searchsorted(sorted_values, run_sorted, side="right")
+                order = np.insert(order, positions, run_order)
+                sorted_values = np.insert(sorted_values, positions, run_sorted)
+            self._parts[name] = [self._part(order, sorted_values)]
+        self.runs = []
+        return self
+
+    def build_all(self):
+        """Sort every column now instead of on first use"""
+        for name in self.columns:
+            self._column(name)
+        return self
+
+    def save(self, directory, latest_only=False):
+        """
+        Store every run's permutation and sorted readings as .npy files.
+
+        Args:
+            directory (str): Folder to write to (usually the cache folder)
+            latest_only (bool): Write only the newest run (the others are
+                already saved)
+        """
+        self.build_all()
+        starts = [0, *self.runs]
+        for name in self.columns:
+            for start, (order, sorted_values, _) in zip(starts, self._parts[name]):
+                if latest_only and start != starts[-1]:
+                    continue
+                for kind, array in (("order", order), ("sorted", sorted_values)):
+                    target = _index_file(directory, name, kind, start)
+                    with open(target + ".tmp", "wb") as file:
+                        np.save(file, array)
+                    os.replace(target + ".tmp", target)
+
+    @classmethod
+    def load(cls, directory, columns, runs=(), mmap_mode="r"):
+        """
+        Open saved indexes (as read-only memory maps by default).
+
+        Args:
+            directory (str): Folder the index was saved to
+            columns (dict): {column name: readings} the index was built from
+            runs (list): First row of each saved delta run
+            mmap_mode (str): Passed to np.load (None reads into memory)
+
+        Returns:
+            SortedIndex: Index with every column ready
+        """
+        index = cls(columns, runs)
+        for name in columns:
+            index._parts[name] = [
+                cls._part(*(np.load(_index_file(directory, name, kind, start), mmap_mode=mmap_mode)
+                            for kind in ("order", "sorted")))
+                for start in [0, *runs]]
+        return index
+
+
+# Fold the delta runs of a saved index into its base once there are more than
+# this many, or once they hold more than this fraction of the base's rows
+INDEX_MAX_RUNS = 8
+INDEX_MAX_DELTA = 0.125
+
+
+def _index_file(directory, name, kind, start=0):
+    """Path of a saved index array: the base run, or the delta run from row start"""
+    run = f".run{start}" if start else ""
+    return os.path.join(directory, f"{name}{run}.{kind}.npy")
+
+
+def _remove_index_runs(directory):
+    """Delete the saved delta runs of every column"""
+    for entry in os.listdir(directory):
+        if re.fullmatch(r".+\.run\d+\.(order|sorted)\.npy", entry):
+            os.remove(os.path.join(directory, entry))
+
+
+def _read_index_runs(directory, meta):
+    """Delta runs of the saved index, or None if it is missing or out of date"""
+    saved = _read_cache_meta(directory, "index.json")
+    if saved is None or _cache_signature(saved) != _cache_signature(meta):
+        return None
+    return saved.get("runs", [])
+
+
+def load_index(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Open the sorted column indexes of a sensor CSV, stored next to its binary
+    cache. They are built (one argsort per column) the first time and again
+    whenever the cache is rebuilt; appended rows are added as delta runs by
+    refresh_cache.
+
+    Args:
+        path (str): Path of the sensor CSV
+        chunk_rows (int): Rows parsed per chunk if the cache must be rebuilt
+
+    Returns:
+        SortedIndex: Index over the memory-mapped sensor columns
+    """
+    columns, _ = load_cached(path, chunk_rows)
+    columns = {name: columns[name] for name in SENSOR_COLUMNS}
+    directory = cache_dir(path)
+    meta = _read_cache_meta(directory)
+    runs = _read_index_runs(directory, meta)
+    if runs is not None:
+        return SortedIndex.load(directory, columns, runs)
+
+    index_meta = os.path.join(directory, "index.json")
+    if os.path.exists(index_meta):
+        os.remove(index_meta)
+    _remove_index_runs(directory)
+    index = SortedIndex(columns)
+    index.save(directory)
+    _write_meta(directory, dict(_cache_signature(meta), runs=[]), "index.json")
+    return index
+
+
+_QUERY_TOKEN = re.compile(r"\s*(?:(?P<number>-?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)"
+                          r"|(?P<op><=|>=|==|!=|<|>)|(?P<word>[A-Za-z_]\w*)|(?P<paren>[()]))")
+
+_COMPARISONS = {"<": np.less, "<=": np.less_equal, ">": np.greater, ">=": np.greater_equal,
+                "==": np.equal, "!=": np.not_equal}
+
+# Operator seen from the other side: "25 < temperature" is "temperature > 25"
+_FLIPPED = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
+
+
+class Query:
+    """
+    A filter over named sensor columns, e.g.
+    "temperature > 25 and moisture > 40" or "75 <= humidity <= 85".
+    Supports <, <=, >, >=, ==, !=, chained comparisons, and/or/not and
+    parentheses. Column names are case-insensitive.
+
+    Evaluation is planned per call: with a SortedIndex, a selective range is
+    read straight from the index and only its rows are checked further;
+    otherwise the rows are scanned in cache-sized blocks that reuse a few
+    small mask buffers, so no full-length temporary arrays are created.
+    """
+
+    def __init__(self, expression, columns=SENSOR_COLUMNS):
+        """
+        Args:
+            expression (str): Filter expression
+            columns (tuple): Column names, in matrix column order
+
+        Raises:
+            ValueError: If the expression cannot be parsed
+        """
+        self.expression = expression
+        self.columns = tuple(columns)
+        self._positions = {name.lower(): i for i, name in enumerate(self.columns)}
+        self._tokens = self._tokenize(expression)
+        self._next = 0
+        self.tree = self._parse_or()
+        if self._next < len(self._tokens):
+            raise ValueError(f"Unexpected '{self._tokens[self._next][1]}' in query: {expression!r}")
+        del self._tokens
+
+    # ---- parsing -----------------------------------------------------------
+
+    @staticmethod
+    def _tokenize(expression):
+        tokens = []
+        position = 0
+        while expression[position:].strip():
+            match = _QUERY_TOKEN.match(expression, position)
+            if match is None:
+                raise ValueError(f"Cannot parse query at {expression[position:].strip()!r}")
+            kind, text = match.lastgroup, match.group(match.lastgroup)
+            tokens.append((kind, text.lower() if kind == "word" else text))
+            position = match.end()
+        return tokens
+
+    def _peek(self):
+        return self._tokens[self._next] if self._next < len(self._tokens) else (None, None)
+
+    def _take(self):
+        token = self._peek()
+        if token[0] is None:
+            raise ValueError(f"Query ends unexpectedly: {self.expression!r}")
+        self._next += 1
+        return token
+
+    def _parse_or(self):
+        children = [self._parse_and()]
+        while self._peek() == ("word", "or"):
+            self._take()
+            children.append(self._parse_and())
+        return children[0] if len(children) == 1 else ("or", tuple(children))
+
+    def _parse_and(self):
+        children = [self._parse_not()]
+        while self._peek() == ("word", "and"):
+            self._take()
+            children.append(self._parse_not())
+        # Flatten chained comparisons ("75 <= humidity <= 85") into one "and"
+        flat = []
+        for child in children:
+            flat.extend(child[1] if child[0] == "and" else (child,))
+        return flat[0] if len(flat) == 1 else ("and", tuple(flat))
+
+    def _parse_not(self):
+        if self._peek() == ("word", "not"):
+            self._take()
+            return ("not", self._parse_not())
+        if self._peek() == ("paren", "("):
+            self._take()
+            node = self._parse_or()
+            if self._take() != ("paren", ")"):
+                raise ValueError(f"Missing ')' in query: {self.expression!r}")
+            return node
+        return self._parse_comparison()
+
+    def _operand(self):
+        kind, text = self._take()
+        if kind == "number":
+            return float(text)
+        if kind == "word" and text.lower() in self._positions:
+            return self._positions[text.lower()]
+        raise ValueError(f"Expected a column name or number, got '{text}' "
+                         f"(columns: {', '.join(self.columns)})")
+
+    def _parse_comparison(self):
+        operands = [self._operand()]
+        operators = []
+        while self._peek()[0] == "op":
+            operators.append(self._take()[1])
+            operands.append(self._operand())
+        if not operators:
+            raise ValueError(f"Expected a comparison in query: {self.expression!r}")
+
+        comparisons = []
+        for op, left, right in zip(operators, operands, operands[1:]):
+            if isinstance(left, int) == isinstance(right, int):
+                raise ValueError(f"Compare a column with a number in query: {self.expression!r}")
+            if isinstance(left, int):
+                comparisons.append(("cmp", left, op, right))
+            else:
+                comparisons.append(("cmp", right, _FLIPPED[op], left))
+        return comparisons[0] if len(comparisons) == 1 else ("and", tuple(comparisons))
+
+    # ---- planning ----------------------------------------------------------
+
+    def _ranges(self, node):
+        """
+        Express a comparison (or an "and" of comparisons) as one range per
+        column, or return None if the node is not a pure conjunction of ranges.
+
+        Returns:
+            dict: {column position: [low, high, low_inclusive, high_inclusive]}
+        """
+        comparisons = node[1] if node[0] == "and" else (node,)
+        ranges = {}
+        for comparison in comparisons:
+            if comparison[0] != "cmp" or comparison[2] == "!=":
+                return None
+            _, column, op, value = comparison
+            bounds = ranges.setdefault(column, [None, None, True, True])
+            if op in (">", ">=", "=="):
+                inclusive = op != ">"
+                if bounds[0] is None or value > bounds[0] or (value == bounds[0] and not inclusive):
+                    bounds[0], bounds[2] = value, inclusive
+            if op in ("<", "<=", "=="):
+                inclusive = op != "<"
+                if bounds[1] is None or value < bounds[1] or (value == bounds[1] and not inclusive):
+                    bounds[1], bounds[3] = value, inclusive
+        return ranges
+
+    def plan(self, rows, index=None):
+        """
+        Choose how to evaluate the query.
+
+        Args:
+            rows (int): Number of rows that will be filtered
+            index (SortedIndex): Sorted index over the same rows, if any
+
+        Returns:
+            tuple: ("index", column, bounds, residual) to read a range from the
+            index and check the residual node (None = nothing left) on its
+            rows, ("union", ranges) for an "or" of single-column ranges, or
+            ("scan",) for a blocked scan
+        """
+        if index is None or rows == 0:
+            return ("scan",)
+        limit = _INDEX_SELECTIVITY * rows
+
+        if self.tree[0] == "or":
+            parts = [self._ranges(child) for child in self.tree[1]]
+            if all(part is not None and len(part) == 1 for part in parts):
+                ranges = [(self.columns[column], bounds)
+                          for part in parts for column, bounds in part.items()]
+                if sum(index.count(name, *bounds) for name, bounds in ranges) <= limit:
+                    return ("union", ranges)
+            return ("scan",)
+
+        children = self.tree[1] if self.tree[0] == "and" else (self.tree,)
+        indexable = [child for child in children if child[0] == "cmp" and child[2] != "!="]
+        ranges = self._ranges(("and", tuple(indexable))) if indexable else None
+        if not ranges:
+            return ("scan",)
+        column, bounds = min(ranges.items(),
+                             key=lambda item: index.count(self.columns[item[0]], *item[1]))
+        if index.count(self.columns[column], *bounds) > limit:
+            return ("scan",)
+        residual = tuple(child for child in children
+                         if not (child in indexable and child[1] == column))
+        if not residual:
+            residual = None
+        elif len(residual) == 1:
+            residual = residual[0]
+        else:
+            residual = ("and", residual)
+        return ("index", self.columns[column], bounds, residual)
+
+    # ---- evaluation --------------------------------------------------------
+
+    def _depth(self, node):
+        return 1 if node[0] == "cmp" else 1 + max(self._depth(child) for child in
+                                                  (node[1] if node[0] != "not" else (node[1],)))
+
+    def _evaluate(self, node, block, out, buffers, level):
+        """Write the node's boolean result for a block into out (buffers[level:] are free)"""
+        kind = node[0]
+        if kind == "cmp":
+            _, column, op, value = node
+            _COMPARISONS[op](block[:, column], value, out=out)
+        elif kind == "not":
+            self._evaluate(node[1], block, out, buffers, level)
+            np.logical_not(out, out=out)
+        else:
+            first, *rest = node[1]
+            self._evaluate(first, block, out, buffers, level)
+            scratch = buffers[level][:len(out)]
+            for child in rest:
+                # Stop early once the block's answer is settled
+                if (not out.any()) if kind == "and" else out.all():
+                    break
+                self._evaluate(child, block, scratch, buffers, level + 1)
+                (np.logical_and if kind == "and" else np.logical_or)(out, scratch, out=out)
+
+    def _scan(self, node, values, block_rows, count_only=False):
+        """Evaluate node block by block; return matching rows (or their number)"""
+        buffers = [np.empty(block_rows, dtype=bool) for _ in range(self._depth(node))]
+        matches = []
+        total = 0
+        for start in range(0, len(values), block_rows):
+            block = values[start:start + block_rows]
+            out = buffers[0][:len(block)]
+            self._evaluate(node, block, out, buffers, 1)
+            if count_only:
+                total += int(np.count_nonzero(out))
+            else:
+                hits = np.flatnonzero(out)
+                if hits.size:
+                    matches.append(hits + start)
+        if count_only:
+            return total
+        return np.concatenate(matches) if matches else np.empty(0, dtype=np.intp)
+
+    def rows(self, values, index=None, block_rows=QUERY_BLOCK_ROWS):
+        """
+        Row indices (in file order) of the rows that match the query.
+
+        Args:
+            values (ndarray): (rows, columns) matrix
+            index (SortedIndex): Sorted index over values, used when selective
+            block_rows (int): Rows per block for scans
+
+        Returns:
+            ndarray: Matching row indices
+        """
+        plan = self.plan(len(values), index)
+        if plan[0] == "union":
+            parts = [index.range(name, *bounds, file_order=False) for name, bounds in plan[1]]
+            return np.unique(np.concatenate(parts))
+        if plan[0] == "index":
+            _, name, bounds, residual = plan
+            candidates = index.range(name, *bounds)
+            if residual is None or candidates.size == 0:
+                return candidates
+            return candidates[self._scan(residual, values[candidates], block_rows)]
+        return self._scan(self.tree, values, block_rows)
+
+    def count(self, values, index=None, block_rows=QUERY_BLOCK_ROWS):
+        """
+        Number of matching rows (arguments as in rows). A plain range answered
+        by the index costs O(log n); no row indices are built for scans.
+
+        Returns:
+            int: Number of matching rows
+        """
+        plan = self.plan(len(values), index)
+        if plan[0] == "index" and plan[3] is None:
+            return index.count(plan[1], *plan[2])
+        if plan[0] == "scan":
+            return self._scan(self.tree, values, block_rows, count_only=True)
+        return len(self.rows(values, index, block_rows))
+
+
+# Unit conversions as (factor, offset): converted = reading * factor + offset
+UNIT_CONVERSIONS = {
+    ("C", "F"): (9 / 5, 32.0),
+    ("F", "C"): (5 / 9, -32.0 * 5 / 9),
+    ("C", "K"): (1.0, 273.15),
+    ("K", "C"): (1.0, -273.15),
+}
+
+
+class Pipeline:
+    """
+    A declarative chain of column transforms (scale, offset, unit
+    conversion, clip, fill missing readings). Steps run block by block with
+    in-place ufunc calls (out=), so chaining more steps never allocates
+    more arrays: apply() needs at most one copy of the data and view()
+    none at all.
+    """
+
+    def __init__(self, columns=SENSOR_COLUMNS):
+        """
+        Args:
+            columns (tuple): Column names, in matrix column order
+        """
+        self.columns = tuple(columns)
+        self.steps = []
+
+    def _position(self, column):
+        try:
+            return self.columns.index(column)
+        except ValueError:
+            raise ValueError(f"Unknown column '{column}' "
+                             f"(columns: {', '.join(self.columns)})") from None
+
+    def scale(self, column, factor):
+        """Multiply a column by factor (returns the pipeline for chaining)"""
+        self.steps.append(("linear", self._position(column), float(factor), 0.0))
+        return self
+
+    def offset(self, column, amount):
+        """Add amount to a column"""
+        self.steps.append(("linear", self._position(column), 1.0, float(amount)))
+        return self
+
+    def convert(self, column, source, target):
+        """
+        Convert a column between units, e.g. convert("Temperature", "C", "F").
+
+        Raises:
+            ValueError: If the conversion is not in UNIT_CONVERSIONS
+        """
+        if (source, target) not in UNIT_CONVERSIONS:
+            raise ValueError(f"No conversion from {source} to {target}")
+        factor, amount = UNIT_CONVERSIONS[(source, target)]
+        self.steps.append(("linear", self._position(column), factor, amount))
+        return self
+
+    def clip(self, column, low=None, high=None):
+        """Limit a column to [low, high] (None = no limit); missing readings stay NaN"""
+        self.steps.append(("clip", self._position(column), low, high))
+        return self
+
+    def impute(self, column, value):
+        """Replace missing readings (NaN) of a column with a constant"""
+        self.steps.append(("fill", self._position(column), float(value), None))
+        return self
+
+    def _run(self, block, mask):
+        """Apply every step to a block in place (mask is a reusable bool buffer)"""
+        for kind, position, first, second in self.steps:
+            column = block[:, position]
+            if kind == "linear":
+                if first != 1.0:
+                    np.multiply(column, first, out=column)
+                if second != 0.0:
+                    np.add(column, second, out=column)
+            elif kind == "clip":
+                np.clip(column, first, second, out=column)
+            else:
+                missing = np.isnan(column, out=mask[:len(column)])
+                np.copyto(column, first, where=missing)
+        return block
+
+    def apply(self, values, inplace=True, block_rows=QUERY_BLOCK_ROWS):
+        """
+        Run the pipeline over a matrix.
+
+        Args:
+            values (ndarray): (rows, columns) float matrix
+            inplace (bool): Transform values itself; False leaves it untouched
+                and fills a single new matrix block by block
+            block_rows (int): Rows transformed at a time
+
+        Returns:
+            ndarray: The transformed matrix (values itself when inplace)
+        """
+        result = values if inplace else np.empty(values.shape, dtype=np.float64)
+        mask = np.empty(block_rows, dtype=bool)
+        for start in range(0, len(values), block_rows):
+            block = result[start:start + block_rows]
+            if not inplace:
+                np.copyto(block, values[start:start + block_rows])
+            self._run(block, mask)
+        return result
+
+    def view(self, values):
+        """
+        Lazy transformed view of values: rows are transformed only when read.
+
+        Args:
+            values (ndarray): (rows, columns) matrix; never modified
+
+        Returns:
+            TransformedView: View of the transformed data
+        """
+        return TransformedView(self, values)
+
+
+class TransformedView:
+    """
+    Read-only view of a matrix as seen through a Pipeline. Indexing
+    transforms just the selected rows; iter_blocks() streams the whole
+    result through one reused block buffer.
+    """
+
+    def __init__(self, pipeline, values):
+        self.pipeline = pipeline
+        self.values = values
+
+    @property
+    def shape(self):
+        return self.values.shape
+
+    def __len__(self):
+        return len(self.values)
+
+    def __getitem__(self, key):
+        """Transform the selected rows, e.g. view[:5, 0] or view[rows]"""
+        rows, columns = (key[0], key[1:]) if isinstance(key, tuple) else (key, ())
+        source = self.values[rows]
+        block = np.array(source, dtype=np.float64, ndmin=2)
+        selected = self.pipeline._run(block, np.empty(len(block), dtype=bool))
+        if np.ndim(source) == 1:
+            selected = selected[0]
+        return selected[(Ellipsis,) + columns] if columns else selected
+
+    def column(self, name, block_rows=QUERY_BLOCK_ROWS):
+        """One transformed column as a new 1-D array"""
+        position = self.pipeline._position(name)
+        result = np.empty(len(self.values), dtype=np.float64)
+        for i, block in enumerate(self.iter_blocks(block_rows)):
+            result[i * block_rows:i * block_rows + len(block)] = block[:, position]
+        return result
+
+    def iter_blocks(self, block_rows=QUERY_BLOCK_ROWS):
+        """
+        Yield transformed blocks of rows. The same buffer is reused, so each
+        block is only valid until the next one is produced.
+        """
+        buffer = np.empty((block_rows, self.values.shape[1]), dtype=np.float64)
+        mask = np.empty(block_rows, dtype=bool)
+        for start in range(0, len(self.values), block_rows):
+            source = self.values[start:start + block_rows]
+            block = buffer[:len(source)]
+            np.copyto(block, source)
+            yield self.pipeline._run(block, mask)
+
+
+def _group_order(codes):
+    """
+    Order rows by Location code, keeping file order within each location.
+
+    Args:
+        codes (ndarray): Non-empty array of Location codes
+
+    Returns:
+        tuple: (order, starts, rows): the row permutation, where each
+        location's rows start in it and how many rows each location has
+    """
+    # A stable sort of small integer codes is a radix sort in NumPy
+    sort_codes = codes.astype(np.int16) if codes.max() < np.iinfo(np.int16).max else codes
+    order = np.argsort(sort_codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+    return order, starts, np.diff(np.r_[starts, codes.size])
+
+
+def location_stats(values, codes, columns=SENSOR_COLUMNS):
+    """
+    ColumnStats of every location in one vectorized pass. Rows are ordered
+    by Location code once, then each statistic is a single reduceat over the
+    group boundaries, so there is no Python loop over rows.
+
+    Args:
+        values (ndarray): (rows, columns) sensor matrix
+        codes (ndarray): Location code of every row (-1 = missing)
+        columns (tuple): Column names
+
+    Returns:
+        dict: {code: ColumnStats}
+    """
+    values = np.asarray(values, dtype=np.float64)
+    codes = np.asarray(codes)
+    if codes.size == 0:
+        return {}
+
+    order, starts, rows = _group_order(codes)
+    sorted_codes = codes[order]
+    ordered = values[order]
+
+    present = ~np.isnan(ordered)
+    count = np.add.reduceat(present, starts, axis=0, dtype=np.int64)
+    total = np.add.reduceat(np.where(present, ordered, 0.0), starts, axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = np.where(count > 0, total / count, 0.0)
+    deviation = np.where(present, ordered - np.repeat(mean, rows, axis=0), 0.0)
+    m2 = np.add.reduceat(deviation * deviation, starts, axis=0)
+    # fmin/fmax ignore NaN; a group without readings keeps the ±inf start value
+    minimum = np.fmin(np.inf, np.fmin.reduceat(ordered, starts, axis=0))
+    maximum = np.fmax(-np.inf, np.fmax.reduceat(ordered, starts, axis=0))
+
+    groups = {}
+    for g, code in enumerate(sorted_codes[starts].tolist()):
+        stats = ColumnStats(columns)
+        stats.rows = int(rows[g])
+        stats.count, stats.total, stats.mean, stats.m2 = count[g], total[g], mean[g], m2[g]
+        stats.minimum, stats.maximum = minimum[g], maximum[g]
+        groups[code] = stats
+    return groups
+
+
+def _location_report(groups, labels):
+    """{code: ColumnStats} -> {location: {"rows": n, column: statistics}} in code order"""
+    return {(labels[code] if code >= 0 else "(unknown)"): dict(rows=stats.rows, **stats.to_dict())
+            for code, stats in sorted(groups.items())}
+
+
+def group_by_location(values, codes, labels):
+    """
+    Per-location statistics of every sensor column (see location_stats).
+    Missing readings (NaN) are skipped; rows without a location are grouped
+    under "(unknown)".
+
+    Args:
+        values (ndarray): (rows, 3) sensor matrix
+        codes (ndarray): Location code of every row (-1 = missing)
+        labels (list): Code table (labels[code] is the location name)
+
+    Returns:
+        dict: {location: {"rows": n, column: {"count", "mean", "min", "max", ...}}}
+        (column statistics as in ColumnStats.to_dict)
+    """
+    return _location_report(location_stats(values, codes), labels)
+
+
+# Imputation strategies; within each location when Location codes are given
+IMPUTE_STRATEGIES = ("ffill", "interpolate", "mean", "median")
+
+
+def _nearest_valid(readings, starts, backward=False):
+    """
+    For every position, the position of the closest reading at or before it
+    (after it when backward) within its group: a running maximum of
+    "position if valid" indexes, reset at each group start.
+    """
+    if backward:
+        size = len(readings)
+        ends = np.r_[starts[1:], size] - 1
+        return size - 1 - _nearest_valid(readings[::-1], np.sort(size - 1 - ends))[::-1]
+    positions = np.arange(len(readings))
+    is_start = np.zeros(len(readings), dtype=bool)
+    is_start[starts] = True
+    nearest = np.where(~np.isnan(readings) | is_start, positions, 0)
+    return np.maximum.accumulate(nearest)
+
+
+def _group_fill(readings, starts, rows, statistic, has_unknown):
+    """Per-group mean or median of the readings (groups are consecutive)"""
+    present = ~np.isnan(readings)
+    count = np.add.reduceat(present, starts, dtype=np.int64)
+    if statistic == "mean":
+        with np.errstate(invalid="ignore", divide="ignore"):
+            fill = np.add.reduceat(np.where(present, readings, 0.0), starts) / count
+        overall = readings[present].mean() if present.any() else np.nan
+    else:
+        # np.median partitions instead of sorting (O(n)); the loop is over
+        # locations, not rows
+        groups = np.split(readings, starts[1:])
+        fill = np.array([np.median(group[~np.isnan(group)]) if count[g] else np.nan
+                         for g, group in enumerate(groups)])
+        overall = np.median(readings[present]) if present.any() else np.nan
+    # Rows without a location, and locations without any reading, use the
+    # statistic over all rows
+    fill[count == 0] = overall
+    if has_unknown:
+        fill[0] = overall
+    return np.repeat(fill, rows)
+
+
+def impute(values, codes=None, strategies=None, columns=SENSOR_COLUMNS, inplace=False):
+    """
+    Fill missing readings (NaN) column by column, without Python loops over
+    rows. With Location codes every strategy works within each location
+    (rows keep their file order, which is taken as time order):
+
+    - "ffill": repeat the location's previous reading (running maximum of
+      valid positions, O(n))
+    - "interpolate": linear between the previous and next reading of the
+      location by row position; the nearest reading at either end
+    - "mean" / "median": the location's mean or median reading (the
+      statistic over all rows for rows without a location); median uses
+      partitioning, not a sort
+
+    Args:
+        values (ndarray): (rows, columns) sensor matrix
+        codes (ndarray): Location code per row (-1 = missing); None = one group
+        strategies (dict): {column: strategy}; columns left out are not filled
+        columns (tuple): Column names, in matrix column order
+        inplace (bool): Fill values itself instead of a copy
+
+    Returns:
+        tuple: (filled matrix, report) with report =
+        {column: {"strategy", "missing", "filled"}}; readings that cannot be
+        filled (e.g. a location with no earlier reading for ffill) stay NaN
+
+    Raises:
+        ValueError: If a column or strategy is unknown
+    """
+    values = values if inplace else np.array(values, dtype=np.float64)
+    strategies = strategies or {}
+    codes = np.zeros(len(values), dtype=np.int32) if codes is None else np.asarray(codes)
+    report = {}
+    if len(values) == 0:
+        return values, {name: {"strategy": strategy, "missing": 0, "filled": 0}
+                        for name, strategy in strategies.items()}
+    order, starts, rows = _group_order(codes)
+    has_unknown = codes[order[0]] < 0
+
+    for name, strategy in strategies.items():
+        if name not in columns:
+            raise ValueError(f"Unknown column '{name}' (columns: {', '.join(columns)})")
+        if strategy not in IMPUTE_STRATEGIES:
+            raise ValueError(f"Unknown strategy '{strategy}' "
+                             f"(choose from {', '.join(IMPUTE_STRATEGIES)})")
+        position = columns.index(name)
+        readings = values[order, position]
+        missing = np.isnan(readings)
+        if not missing.any():
+            report[name] = {"strategy": strategy, "missing": 0, "filled": 0}
+            continue
+
+        if strategy == "ffill":
+            filled = readings[_nearest_valid(readings, starts)]
+        elif strategy == "interpolate":
+            before = _nearest_valid(readings, starts)
+            after = _nearest_valid(readings, starts, backward=True)
+            low, high = readings[before], readings[after]
+            # Row numbers in the file are the positions on the time axis
+            with np.errstate(invalid="ignore", divide="ignore"):
+                weight = (order - order[before]) / (order[after] - order[before])
+            filled = np.where(np.isnan(low), high,
+                              np.where(np.isnan(high), low, low + (high - low) * weight))
+        else:
+            filled = _group_fill(readings, starts, rows, strategy, has_unknown)
+
+        # Only the missing readings are written back to the matrix
+        values[order[missing], position] = filled[missing]
+        report[name] = {"strategy": strategy, "missing": int(missing.sum()),
+                        "filled": int(np.count_nonzero(~np.isnan(filled[missing])))}
+    return values, report
+
+
+def _iter_cached_rows(columns, start=0, block_rows=DEFAULT_CHUNK_ROWS):
+    """Yield (values, codes) blocks of the cached columns from row start on"""
+    for first in range(start, len(columns[LOCATION_COLUMN]), block_rows):
+        values = np.column_stack([columns[name][first:first + block_rows]
+                                  for name in SENSOR_COLUMNS])
+        yield values, np.asarray(columns[LOCATION_COLUMN][first:first + block_rows])
+
+
+def _summarize(summary, values, codes):
+    """
+    Fold rows into a summary:
+    {"total": ColumnStats, "locations": {code: ColumnStats}, "filters": {}}
+    """
+    summary["total"].update(values)
+    for code, stats in location_stats(values, codes).items():
+        if code in summary["locations"]:
+            summary["locations"][code].merge(stats)
+        else:
+            summary["locations"][code] = stats
+    for expression in STREAM_FILTERS:
+        summary["filters"][expression] = (summary["filters"].get(expression, 0)
+                                          + Query(expression).count(values))
+
+
+def _read_summary(directory, meta):
+    """Saved summary of the cached rows, or None if missing or out of date"""
+    saved = _read_cache_meta(directory, "summary.json")
+    if saved is None or saved["signature"] != _cache_signature(meta):
+        return None
+    return {"total": ColumnStats.from_state(saved["total"]),
+            "locations": {int(code): ColumnStats.from_state(state)
+                          for code, state in saved["locations"].items()},
+            "filters": saved["filters"]}
+
+
+def _save_summary(directory, meta, summary):
+    _write_meta(directory, {"signature": _cache_signature(meta), "total": summary["total"].state(),
+                            "locations": {str(code): stats.state()
+                                          for code, stats in summary["locations"].items()},
+                            "filters": summary["filters"]}, "summary.json")
+
+
+def _update_derived(directory, previous, meta):
+    """
+    After an append, fold the new rows into the saved summary and add them to
+    the sorted indexes as a delta run (if both were up to date before), so
+    neither is rebuilt and only the new run's index files are written.
+    """
+    columns = _open_columns(directory, meta)
+    first_row = previous["rows"]
+    summary = _read_summary(directory, previous)
+    if summary is not None:
+        for values, codes in _iter_cached_rows(columns, first_row):
+            _summarize(summary, values, codes)
+        _save_summary(directory, meta, summary)
+
+    runs = _read_index_runs(directory, previous)
+    if runs is None:
+        return
+    os.remove(os.path.join(directory, "index.json"))
+    columns = {name: columns[name] for name in SENSOR_COLUMNS}
+    saved = {name: readings[:first_row] for name, readings in columns.items()}
+    index = SortedIndex.load(directory, saved, runs).extend(columns)
+    if index.runs and (len(index.runs) > INDEX_MAX_RUNS
+                       or len(index) - index.runs[0] > index.runs[0] * INDEX_MAX_DELTA):
+        index.compact().save(directory)
+        _remove_index_runs(directory)
+    elif len(index.runs) > len(runs):
+        index.save(directory, latest_only=True)
+    _write_meta(directory, dict(_cache_signature(meta), runs=index.runs), "index.json")
+
+
+def load_summary(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    The analyze_stream statistics and filter counts plus per-location
+    statistics of the whole CSV, saved in the cache folder. They are
+    computed once; after rows are appended only the new rows are summarized
+    and merged in (see refresh_cache).
+
+    Args:
+        path (str): Path of the sensor CSV
+        chunk_rows (int): Rows per chunk when parsing or summarizing
+
+    Returns:
+        dict: rows, columns (see ColumnStats.to_dict), locations (as in
+        group_by_location) and filters
+    """
+    columns, labels = load_cached(path, chunk_rows)
+    directory = cache_dir(path)
+    meta = _read_cache_meta(directory)
+    summary = _read_summary(directory, meta)
+    if summary is None:
+        summary = {"total": ColumnStats(), "locations": {},
+                   "filters": dict.fromkeys(STREAM_FILTERS, 0)}
+        for values, codes in _iter_cached_rows(columns, 0, chunk_rows):
+            _summarize(summary, values, codes)
+        _save_summary(directory, meta, summary)
+    return {"rows": summary["total"].rows, "columns": summary["total"].to_dict(),
+            "locations": _location_report(summary["locations"], labels),
+            "filters": summary["filters"]}
+
+
+def analyze_stream(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Run the Lab12 analysis steps chunk by chunk, so files far larger than RAM
+    can be summarized. Missing readings (NaN) are skipped by the statistics.
+
+    Args:
+        path (str): Path of the sensor CSV
+        chunk_rows (int): Rows parsed per chunk
+
+    Returns:
+        dict: rows, per-column statistics (see ColumnStats.to_dict) and the
+        Lab12 filter counts
+    """
+    stats = ColumnStats()
+    queries = [Query(expression) for expression in STREAM_FILTERS]
+    filters = dict.fromkeys(STREAM_FILTERS, 0)
+
+    for chunk, _ in iter_chunks(path, chunk_rows):
+        stats.update(chunk)
+        for query in queries:
+            filters[query.expression] += query.count(chunk)
+
+    return {"rows": stats.rows, "columns": stats.to_dict(), "filters": filters}
+
+
+def write_csv(path, values, codes=None, labels=None, columns=SENSOR_COLUMNS, decimals=2,
+              na_rep="", compress=None, block_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Write a sensor matrix as CSV, much faster than np.savetxt: each block of
+    rows is formatted by a single %-operation in C instead of one Python
+    call per row, and goes to the file in one large buffered write. The
+    header is written, Location codes are turned back into their labels and
+    the output can be gzip-compressed on the fly.
+
+    Args:
+        path (str): Output file ("*.gz" is compressed unless compress=False)
+        values (ndarray): (rows, columns) matrix
+        codes (ndarray): Location code per row (-1 = missing); None writes
+            no Location column
+        labels (list): Location code table
+        columns (tuple): Column names for the header
+        decimals (int): Digits after the decimal point
+        na_rep (str): Text written for missing readings ("" keeps the blank
+            fields of the original CSV, so the file loads back the same way)
+        compress (bool): gzip the output (None = decide by the .gz suffix)
+        block_rows (int): Rows formatted per write
+
+    Returns:
+        int: Number of rows written
+    """
+    compress = path.endswith(".gz") if compress is None else compress
+    header = list(columns) + ([LOCATION_COLUMN] if codes is not None else [])
+    row_format = ",".join([f"%.{decimals}f"] * len(columns)) + "\n"
+    if codes is not None:
+        # Code -1 (missing) picks the trailing empty label
+        lookup = np.array(list(labels) + [""], dtype=object)
+
+    if compress:
+        file = gzip.open(path, "wt", encoding="utf-8", newline="", compresslevel=GZIP_LEVEL)
+    else:
+        file = open(path, "w", encoding="utf-8", newline="", buffering=WRITE_BUFFER_BYTES)
+    with file:
+        file.write(",".join(header) + "\n")
+        for start in range(0, len(values), block_rows):
+            block = np.asarray(values[start:start + block_rows], dtype=np.float64)
+            text = (row_format * len(block)) % tuple(block.ravel().tolist())
+            if na_rep != "nan":
+                text = text.replace("nan", na_rep)
+            if codes is not None:
+                lines = text.split("\n")
+                lines.pop()
+                row_labels = lookup[codes[start:start + block_rows]].tolist()
+                text = "\n".join(map(",".join, zip(lines, row_labels))) + "\n"
+            file.write(text)
+    return len(values)
+
+
+def generate_sensor_csv(path, rows, seed=0, missing_rate=0.05):
+    """
+    Write a synthetic sensor CSV in the same format as student_practice_data.csv.
+
+    Args:
+        path (str): Output file
+        rows (int): Number of data rows
+        seed (int): Random seed
+        missing_rate (float): Fraction of readings/locations left blank
+    """
+    rng = np.random.default_rng(seed)
+    locations = np.array(["Lab A", "Lab B", "Lab C", "Greenhouse", "Field 1", ""])
+    block = 100_000
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("Temperature,Moisture,Humidity,Location\n")
+        for start in range(0, rows, block):
+            size = min(block, rows - start)
+            values = np.column_stack([rng.normal(24, 2, size), rng.normal(44, 4, size),
+                                      rng.normal(78, 6, size)]).round(1).astype(str)
+            values[rng.random(values.shape) < missing_rate] = ""
+            labels = locations[rng.integers(0, len(locations) - 1, size)]
+            labels[rng.random(size) < missing_rate] = ""
+            lines = [",".join(row) for row in np.column_stack([values, labels])]
+            file.write("\n".join(lines) + "\n")
+
+
+def benchmark_loader(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Compare np.genfromtxt (what Lab12 used) with the chunked streaming reader.
+
+    Args:
+        path (str): Sensor CSV to load
+        chunk_rows (int): Rows per chunk for the streaming reader
+    """
+    print("\n" + "=" * 70)
+    print("📊 SENSOR CSV LOADER BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    reference = np.genfromtxt(path, delimiter=",", skip_header=1)
+    genfromtxt_time = time.perf_counter() - start_time
+    rows = reference.shape[0]
+
+    start_time = time.perf_counter()
+    streamed_rows = sum(chunk.shape[0] for chunk, _ in iter_chunks(path, chunk_rows))
+    stream_time = time.perf_counter() - start_time
+
+    same = np.array_equal(reference[:, :len(SENSOR_COLUMNS)],
+                          load_sensor_data(path, chunk_rows).values, equal_nan=True)
+    print(f"{'Loader':<28} {'Rows':<12} {'Time (s)':<12} {'Rows/s':<14}")
+    print("-" * 70)
+    print(f"{'np.genfromtxt':<28} {rows:<12} {genfromtxt_time:<12.3f} "
+          f"{rows / genfromtxt_time:<14,.0f}")
+    print(f"{'iter_chunks (streaming)':<28} {streamed_rows:<12} {stream_time:<12.3f} "
+          f"{streamed_rows / stream_time:<14,.0f}")
+    print("-" * 70)
+    print(f"Speedup: {genfromtxt_time / stream_time:.1f}x  |  Identical values: {same}")
+    print("=" * 70 + "\n")
+
+
+def benchmark_cache(path, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Compare parsing the CSV text with opening the memory-mapped column cache.
+
+    Args:
+        path (str): Sensor CSV to load
+        chunk_rows (int): Rows per chunk for parsing/building
+    """
+    print("\n" + "=" * 70)
+    print("📊 SENSOR COLUMN CACHE BENCHMARK")
+    print("=" * 70)
+
+    start_time = time.perf_counter()
+    parsed = load_sensor_data(path, chunk_rows)
+    parse_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    build_cache(path, chunk_rows)
+    build_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    columns, _ = load_cached(path, chunk_rows)
+    open_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    cached = load_sensor_data(path, chunk_rows, cache=True)
+    matrix_time = time.perf_counter() - start_time
+
+    print(f"{'Step':<40} {'Time (s)':<12}")
+    print("-" * 70)
+    print(f"{'Parse CSV text (chunked)':<40} {parse_time:<12.4f}")
+    print(f"{'Build binary cache (one-off)':<40} {build_time:<12.4f}")
+    print(f"{'Open cached columns (mmap)':<40} {open_time:<12.4f}")
+    print(f"{'Cached columns -> in-memory matrix':<40} {matrix_time:<12.4f}")
+    print("-" * 70)
+    same = (np.array_equal(parsed.values, cached.values, equal_nan=True)
+            and np.array_equal(parsed.codes, cached.codes) and parsed.labels == cached.labels)
+    print(f"Rows: {len(columns[LOCATION_COLUMN])}  |  Identical values: {same}")
+    print("=" * 70 + "\n")
+
+
+def benchmark_query(path, chunk_rows=DEFAULT_CHUNK_ROWS, repeats=5):
+    """
+    Compare boolean-mask filters with Query (blocked scan and sorted index).
+
+    Args:
+        path (str): Sensor CSV to query
+        chunk_rows (int): Rows per chunk if the cache must be built
+        repeats (int): Timing repeats (the best run is reported)
+    """
+    values = load_sensor_data(path, chunk_rows, cache=True).values
+    index = load_index(path, chunk_rows)
+    temperature, moisture, humidity = values.T
+    masks = {
+        "temperature > 25 and moisture > 40": lambda: (temperature > 25) & (moisture > 40),
+        "humidity < 80 or temperature < 22": lambda: (humidity < 80) | (temperature < 22),
+        "temperature > 30 and moisture > 40": lambda: (temperature > 30) & (moisture > 40),
+        "75 <= humidity <= 76": lambda: (humidity >= 75) & (humidity <= 76),
+    }
+
+    def best_time(function):
+        times = []
+        for _ in range(repeats):
+            start_time = time.perf_counter()
+            result = function()
+            times.append(time.perf_counter() - start_time)
+        return min(times), result
+
+    print("\n" + "=" * 70)
+    print("📊 SENSOR QUERY BENCHMARK")
+    print("=" * 70)
+    print(f"Rows: {len(values)}  |  best of {repeats} runs (ms)")
+    print(f"{'Query':<36} {'Mask':<8} {'Scan':<8} {'Indexed':<8} {'Plan':<6} {'Same':<5}")
+    print("-" * 70)
+    for expression, mask in masks.items():
+        query = Query(expression)
+        mask_time, expected = best_time(lambda: np.flatnonzero(mask()))
+        scan_time, scanned = best_time(lambda: query.rows(values))
+        index_time, indexed = best_time(lambda: query.rows(values, index))
+        same = np.array_equal(expected, scanned) and np.array_equal(expected, indexed)
+        print(f"{expression:<36} {mask_time * 1000:<8.2f} {scan_time * 1000:<8.2f} "
+              f"{index_time * 1000:<8.2f} {query.plan(len(values), index)[0]:<6} {str(same):<5}")
+    print("=" * 70 + "\n")
+
+
+def benchmark_writer(row_counts=(1_000_000, 10_000_000), seed=0):
+    """
+    Compare np.savetxt (what Lab12 used) with write_csv, plain and gzipped.
+
+    Args:
+        row_counts (tuple): Dataset sizes to write
+        seed (int): Random seed for the synthetic readings
+    """
+    import tempfile
+
+    print("\n" + "=" * 70)
+    print("📊 SENSOR CSV WRITER BENCHMARK")
+    print("=" * 70)
+    print(f"{'Writer':<28} {'Rows':<12} {'Time (s)':<12} {'MB/s':<10} {'Size (MB)':<10}")
+    print("-" * 70)
+    rng = np.random.default_rng(seed)
+    labels = ["Lab A", "Lab B", "Lab C", "Greenhouse"]
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in row_counts:
+            values = rng.normal(50, 10, (rows, len(SENSOR_COLUMNS))).round(1)
+            values[rng.random(values.shape) < 0.05] = np.nan
+            codes = rng.integers(-1, len(labels), rows).astype(np.int32)
+            writers = [
+                ("np.savetxt", "savetxt.csv",
+                 lambda target: np.savetxt(target, values, delimiter=",", fmt="%.2f")),
+                ("write_csv", "write.csv", lambda target: write_csv(target, values, codes, labels)),
+                ("write_csv (gzip)", "write.csv.gz",
+                 lambda target: write_csv(target, values, codes, labels)),
+            ]
+            for name, filename, writer in writers:
+                target = os.path.join(directory, filename)
+                start_time = time.perf_counter()
+                writer(target)
+                elapsed = time.perf_counter() - start_time
+                size_mb = os.path.getsize(target) / 1e6
+                # Throughput of the uncompressed text, so the rows compare fairly
+                text_mb = os.path.getsize(os.path.join(directory, "write.csv")) / 1e6 \
+                    if name.endswith("(gzip)") else size_mb
+                print(f"{name:<28} {rows:<12} {elapsed:<12.3f} {text_mb / elapsed:<10.1f} "
+                      f"{size_mb:<10.1f}")
+            print("-" * 70)
+    print("=" * 70 + "\n")
+
+
+def benchmark_refresh(rows=1_000_000, appended=10_000, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Compare refreshing the cache, summary and sorted indexes after an append
+    with rebuilding them from scratch.
+
+    Args:
+        rows (int): Rows in the CSV before the append
+        appended (int): Rows appended
+        chunk_rows (int): Rows parsed per chunk
+    """
+    import shutil
+    import tempfile
+
+    print("\n" + "=" * 70)
+    print("📊 INCREMENTAL REFRESH BENCHMARK")
+    print("=" * 70)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sensors.csv")
+        extra = os.path.join(directory, "extra.csv")
+        generate_sensor_csv(path, rows, seed=0)
+        generate_sensor_csv(extra, appended, seed=1)
+        load_index(path, chunk_rows)
+        load_summary(path, chunk_rows)
+
+        with open(extra, "r", encoding="utf-8") as source, \
+                open(path, "a", encoding="utf-8") as target:
+            source.readline()
+            shutil.copyfileobj(source, target)
+
+        start_time = time.perf_counter()
+        report = refresh_cache(path, chunk_rows)
+        refresh_time = time.perf_counter() - start_time
+        incremental = load_summary(path, chunk_rows)
+
+        shutil.rmtree(cache_dir(path))
+        start_time = time.perf_counter()
+        load_index(path, chunk_rows)
+        rebuilt = load_summary(path, chunk_rows)
+        rebuild_time = time.perf_counter() - start_time
+
+    print(f"{'Step':<44} {'Time (s)':<12}")
+    print("-" * 70)
+    step = f"Refresh after append ({report['mode']}, {report['new_rows']} rows)"
+    print(f"{step:<44} {refresh_time:<12.4f}")
+    print(f"{'Rebuild cache, indexes and summary':<44} {rebuild_time:<12.4f}")
+    print("-" * 70)
+    same = incremental["filters"] == rebuilt["filters"] and all(
+        incremental["columns"][name]["count"] == rebuilt["columns"][name]["count"]
+        and np.isclose(incremental["columns"][name]["mean"], rebuilt["columns"][name]["mean"])
+        for name in SENSOR_COLUMNS)
+    print(f"Rows: {rows} + {appended}  |  Speedup: {rebuild_time / refresh_time:.1f}x  |  "
+          f"Same summary: {same}")
+    print("=" * 70 + "\n")
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the SmartFarm benchmarks.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="SmartFarm sensor toolkit")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench_load = commands.add_parser("bench-load",
+                                     help="benchmark the CSV loader against np.genfromtxt")
+    bench_load.add_argument("--csv", help="existing sensor CSV (default: generate one)")
+    bench_load.add_argument("--rows", type=int, default=1_000_000, help="rows to generate")
+    bench_load.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+
+    bench_cache = commands.add_parser("bench-cache",
+                                      help="benchmark the binary column cache against parsing")
+    bench_cache.add_argument("--csv", help="existing sensor CSV (default: generate one)")
+    bench_cache.add_argument("--rows", type=int, default=1_000_000, help="rows to generate")
+    bench_cache.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+
+    bench_query = commands.add_parser("bench-query", help="benchmark Query against boolean masks")
+    bench_query.add_argument("--csv", help="existing sensor CSV (default: generate one)")
+    bench_query.add_argument("--rows", type=int, default=1_000_000, help="rows to generate")
+    bench_query.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+
+    bench_write = commands.add_parser("bench-write", help="benchmark write_csv against np.savetxt")
+    bench_write.add_argument("--rows", type=int, nargs="+", default=[1_000_000, 10_000_000],
+                             help="dataset sizes to write")
+
+    bench_refresh = commands.add_parser("bench-refresh",
+                                        help="benchmark incremental refresh after an append")
+    bench_refresh.add_argument("--rows", type=int, default=1_000_000, help="rows before the append")
+    bench_refresh.add_argument("--append", type=int, default=10_000, help="rows appended")
+    bench_refresh.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "bench-write":
+        benchmark_writer(args.rows)
+        return
+    if args.command == "bench-refresh":
+        benchmark_refresh(args.rows, args.append, args.chunk_rows)
+        return
+
+    path = args.csv
+    if path is None:
+        path = f"sensor_bench_{args.rows}.csv"
+        if not os.path.exists(path):
+            print(f"📝 Generating {args.rows} rows into '{path}'...")
+            generate_sensor_csv(path, args.rows)
+
+    if args.command == "bench-load":
+        benchmark_loader(path, args.chunk_rows)
+    elif args.command == "bench-cache":
+        benchmark_cache(path, args.chunk_rows)
+    elif args.command == "bench-query":
+        benchmark_query(path, args.chunk_rows)
+
+
+if __name__ == "__main__":
+    main()
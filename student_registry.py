@@ -0,0 +1,243 @@
+"""
+Student Registry
+Student records for lab#4.py with hash indexes: a case-folded name index for
+search/update/remove and secondary indexes on subject and grade, so every
+operation touches only the matching records instead of scanning the list.
+"""
+
+import argparse
+import random
+import time
+
+
+class StudentRegistry:
+    """
+    Student records ({"name", "age", "grade", "subject"}) in insertion order.
+    Names match case-insensitively; when several students share a name, the
+    earliest added one is found, updated or removed first (like a list scan).
+    """
+
+    def __init__(self, students=()):
+        """
+        Args:
+            students (list): Initial records (dicts with name, age, grade, subject)
+        """
+        self._records = {}     # record id -> record, in insertion order
+        self._by_name = {}     # casefolded name -> {record id: None} (ordered set)
+        self._by_subject = {}  # subject -> {record id: None}
+        self._by_grade = {}    # grade -> {record id: None}
+        self._next_id = 0
+        for student in students:
+            self.add(student["name"], student["age"], student["grade"], student["subject"])
+
+    def __len__(self):
+        return len(self._records)
+
+    def __iter__(self):
+        return iter(self._records.values())
+
+    @staticmethod
+    def _link(index, key, record_id):
+        index.setdefault(key, {})[record_id] = None
+
+    @staticmethod
+    def _unlink(index, key, record_id):
+        ids = index[key]
+        del ids[record_id]
+        if not ids:
+            del index[key]
+
+    def _find_id(self, name):
+        ids = self._by_name.get(name.casefold())
+        return next(iter(ids)) if ids else None
+
+    def add(self, name, age, grade, subject):
+        """
+        Args:
+            name (str): Student name
+            age (int): Age
+            grade (str): Grade, e.g. "A-"
+            subject (str): Subject
+
+        Returns:
+            dict: The new record
+        """
+        record_id = self._next_id
+        self._next_id += 1
+        record = {"name": name, "age": age, "grade": grade, "subject": subject}
+        self._records[record_id] = record
+        self._link(self._by_name, name.casefold(), record_id)
+        self._link(self._by_subject, subject, record_id)
+        self._link(self._by_grade, grade, record_id)
+        return record
+
+    def find(self, name):
+        """
+        Args:
+            name (str): Student name (any case)
+
+        Returns:
+            dict: The record, or None if there is no such student
+        """
+        record_id = self._find_id(name)
+        return None if record_id is None else self._records[record_id]
+
+    def remove(self, name):
+        """
+        Args:
+            name (str): Student name (any case)
+
+        Returns:
+            dict: The removed record, or None if there is no such student
+        """
+        record_id = self._find_id(name)
+        if record_id is None:
+            return None
+        record = self._records.pop(record_id)
+        self._unlink(self._by_name, record["name"].casefold(), record_id)
+        self._unlink(self._by_subject, record["subject"], record_id)
+        self._unlink(self._by_grade, record["grade"], record_id)
+        return record
+
+    def update(self, name, age, grade, subject):
+        """
+        Args:
+            name (str): Student name (any case)
+            age (int): New age
+            grade (str): New grade
+            subject (str): New subject
+
+        Returns:
+            dict: The updated record, or None if there is no such student
+        """
+        record_id = self._find_id(name)
+        if record_id is None:
+            return None
+        record = self._records[record_id]
+        if record["subject"] != subject:
+            self._unlink(self._by_subject, record["subject"], record_id)
+            self._link(self._by_subject, subject, record_id)
+        if record["grade"] != grade:
+            self._unlink(self._by_grade, record["grade"], record_id)
+            self._link(self._by_grade, grade, record_id)
+        record.update(age=age, grade=grade, subject=subject)
+        return record
+
+    def by_subject(self, subject):
+        """
+        Args:
+            subject (str): Subject
+
+        Returns:
+            list: Records of the students taking it, in the order they joined it
+        """
+        return [self._records[record_id] for record_id in self._by_subject.get(subject, ())]
+
+    def by_grade(self, grade):
+        """
+        Args:
+            grade (str): Grade
+
+        Returns:
+            list: Records of the students with it, in the order they got it
+        """
+        return [self._records[record_id] for record_id in self._by_grade.get(grade, ())]
+
+
+def _scan_find(students, name):
+    """lab#4's original list scan, kept as the benchmark baseline"""
+    for s in students:
+        if s["name"].lower() == name.lower():
+            return s
+    return None
+
+
+def benchmark_registry(count=1_000_000, operations=50, seed=0):
+    """
+    Compare lab#4's list scans with StudentRegistry for search, update and
+    remove on a large roster.
+
+    Args:
+        count (int): Students in the roster
+        operations (int): Operations of each kind timed on the list (the
+            registry runs 100k; a scan of 1M students takes milliseconds)
+        seed (int): Random seed
+    """
+    rng = random.Random(seed)
+    subjects = ["Math", "Physics", "Computer", "Chemistry", "Biology"]
+    grades = ["A", "A-", "B+", "B", "C"]
+    roster = [{"name": f"Student{i}", "age": rng.randint(17, 25), "grade": rng.choice(grades),
+               "subject": rng.choice(subjects)} for i in range(count)]
+    names = [f"sTuDeNt{rng.randrange(count)}" for _ in range(operations)]
+    registry_names = [f"student{rng.randrange(count)}" for _ in range(100_000)]
+
+    print("\n" + "=" * 70)
+    print("📊 STUDENT REGISTRY BENCHMARK")
+    print("=" * 70)
+
+    students = list(roster)
+    start_time = time.perf_counter()
+    for name in names:
+        _scan_find(students, name)
+    scan_search = (time.perf_counter() - start_time) / operations
+    start_time = time.perf_counter()
+    for name in names:
+        record = _scan_find(students, name)
+        if record is not None:
+            students.remove(record)
+    scan_remove = (time.perf_counter() - start_time) / operations
+
+    start_time = time.perf_counter()
+    registry = StudentRegistry(roster)
+    build_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    found = sum(registry.find(name) is not None for name in registry_names)
+    search_time = (time.perf_counter() - start_time) / len(registry_names)
+    start_time = time.perf_counter()
+    for name in registry_names:
+        registry.update(name, 21, "A", "Math")
+    update_time = (time.perf_counter() - start_time) / len(registry_names)
+    start_time = time.perf_counter()
+    removed = sum(registry.remove(name) is not None for name in registry_names)
+    remove_time = (time.perf_counter() - start_time) / len(registry_names)
+
+    start_time = time.perf_counter()
+    math_students = len(registry.by_subject("Math"))
+    subject_time = time.perf_counter() - start_time
+
+    print(f"Students: {count}")
+    print(f"{'Operation':<44} {'Per operation (µs)':<20}")
+    print("-" * 70)
+    print(f"{'list scan: search':<44} {scan_search * 1e6:<20,.1f}")
+    print(f"{'list scan: remove (scan + list.remove)':<44} {scan_remove * 1e6:<20,.1f}")
+    print(f"{'StudentRegistry: search':<44} {search_time * 1e6:<20,.2f}")
+    print(f"{'StudentRegistry: update':<44} {update_time * 1e6:<20,.2f}")
+    print(f"{'StudentRegistry: remove':<44} {remove_time * 1e6:<20,.2f}")
+    print("-" * 70)
+    print(f"Build: {build_time:.2f} s  |  by_subject('Math'): {math_students} students "
+          f"in {subject_time * 1000:.1f} ms")
+    print(f"Registry lookups found: {found}  |  removed: {removed}  |  left: {len(registry)}")
+    print("=" * 70 + "\n")
+
+
+def main(argv=None):
+    """
+    Command-line entry point for the registry benchmark.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Indexed student registry")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    bench = commands.add_parser("bench", help="benchmark against lab#4's list scans")
+    bench.add_argument("--students", type=int, default=1_000_000, help="roster size")
+
+    args = parser.parse_args(argv)
+    if args.command == "bench":
+        benchmark_registry(args.students)
+
+
+if __name__ == "__main__":
+    main()
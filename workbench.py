@@ -0,0 +1,196 @@
+"""
+AiLab Workbench
+A single entry point for the lab programs. Each subcommand loads its lab
+script (and heavy libraries such as NumPy or pandas) only when it is chosen,
+so starting the workbench or running a light task stays fast.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# name: (script, entry function, help). An entry of None runs the script in a
+# child interpreter and forwards the remaining arguments to its own command line.
+SUBCOMMANDS = {
+    "pathfind": ("Fall-23-BSCS-466-OEL.py", None,
+                 "Smart Campus Path Finder (interactive, --batch, --all-pairs, --benchmark-bfs)"),
+    "farm-analysis": ("Lab12.py", "main", "SmartFarm sensor data analysis (NumPy)"),
+    "library": ("lab#5_Task#2.py", "loopfunction", "Library management system"),
+    "students": ("lab#4.py", "main", "Student records manager"),
+    "finance": ("LAB-Paper.py", "finance_analysis", "Financial revenue analysis (pandas)"),
+}
+
+# Libraries that must not be imported just to start the workbench
+HEAVY_MODULES = ("numpy", "pandas", "matplotlib")
+
+
+def load_script(filename):
+    """
+    Import a lab script as a module (file names like 'lab#4.py' are not valid
+    module names, so they are loaded by path). Scripts are cached in sys.modules.
+
+    Args:
+        filename (str): Script file name relative to the repository root
+
+    Returns:
+        module: The loaded script
+    """
+    import importlib.util
+
+    module_name = "_workbench_" + re.sub(r"\W", "_", os.path.splitext(filename)[0])
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(module_name, os.path.join(ROOT, filename))
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_subcommand(name, argv=()):
+    """
+    Run one workbench subcommand.
+
+    Args:
+        name (str): Subcommand name (a key of SUBCOMMANDS)
+        argv (list): Extra arguments for scripts with their own command line
+
+    Returns:
+        int: Exit status (0 for entry functions)
+    """
+    script, entry, _ = SUBCOMMANDS[name]
+    if entry is None:
+        # A script with its own command line (and worker pools) runs as a program
+        import subprocess
+
+        return subprocess.call([sys.executable, os.path.join(ROOT, script), *argv])
+    getattr(load_script(script), entry)()
+    return 0
+
+
+def parse_importtime(stderr):
+    """
+    Parse the output of 'python -X importtime'.
+
+    Args:
+        stderr (str): Text written to stderr by the interpreter
+
+    Returns:
+        list: (module, self_us, cumulative_us, nesting_level) per import
+    """
+    imports = []
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)", line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return imports
+
+
+def import_profile(target=None):
+    """
+    Measure import cost with 'python -X importtime' in a fresh interpreter.
+
+    Args:
+        target (str): Subcommand whose script is loaded (None = bare startup)
+
+    Returns:
+        list: Parsed imports (see parse_importtime)
+    """
+    import subprocess
+
+    code = "import workbench"
+    if target is not None:
+        code += f"; workbench.load_script(workbench.SUBCOMMANDS[{target!r}][0])"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    return parse_importtime(result.stderr)
+
+
+def benchmark_imports(targets, top=5, budget_ms=None):
+    """
+    Print an import-time summary for the workbench and its subcommands.
+
+    Args:
+        targets (list): Subcommands to profile (None in the list = bare startup)
+        top (int): Slowest top-level imports listed per target
+        budget_ms (float): Fail if bare startup takes longer or imports a heavy module
+
+    Returns:
+        bool: True if the startup budget was met (always True without a budget)
+    """
+    within_budget = True
+    print("\n" + "=" * 70)
+    print("⏱️  IMPORT-TIME SUMMARY (python -X importtime)")
+    print("=" * 70)
+
+    for target in targets:
+        imports = import_profile(target)
+        total_ms = sum(self_us for _, self_us, _, _ in imports) / 1000
+        loaded = {module.split(".")[0] for module, _, _, _ in imports}
+        heavy = [module for module in HEAVY_MODULES if module in loaded]
+        label = target or "workbench startup"
+
+        print(f"\n📦 {label}: {total_ms:.1f} ms, {len(imports)} modules"
+              f"{' (heavy: ' + ', '.join(heavy) + ')' if heavy else ''}")
+        top_level = sorted((entry for entry in imports if entry[3] == 0),
+                           key=lambda entry: -entry[2])
+        for module, _, cumulative_us, _ in top_level[:top]:
+            print(f"   {module:<40} {cumulative_us / 1000:>8.1f} ms")
+
+        if target is None and budget_ms is not None:
+            if total_ms > budget_ms or heavy:
+                within_budget = False
+                print(f"❌ Startup exceeds the {budget_ms} ms budget or imports a heavy module!")
+            else:
+                print(f"✅ Startup within the {budget_ms} ms budget")
+
+    print("=" * 70 + "\n")
+    return within_budget
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list): Command-line arguments (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(
+        description="AiLab Workbench: run any lab program from one place")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    for name, (_, entry, help_text) in SUBCOMMANDS.items():
+        # Scripts with their own command line receive every remaining argument (even --help)
+        commands.add_parser(name, help=help_text, add_help=entry is not None)
+
+    importtime = commands.add_parser("importtime", help="summarize import cost per subcommand")
+    importtime.add_argument("targets", nargs="*", metavar="SUBCOMMAND",
+                            help="subcommands to profile (default: all)")
+    importtime.add_argument("--top", type=int, default=5, help="slowest imports listed per target")
+    importtime.add_argument("--budget-ms", type=float, default=None,
+                            help="exit with status 1 if bare startup is slower than this")
+
+    args, extra = parser.parse_known_args(argv)
+    if extra and (args.command not in SUBCOMMANDS or SUBCOMMANDS[args.command][1] is not None):
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
+
+    if args.command == "importtime":
+        unknown = [target for target in args.targets if target not in SUBCOMMANDS]
+        if unknown:
+            parser.error(f"unknown subcommand(s) for importtime: {', '.join(unknown)}")
+        targets = [None, *(args.targets or SUBCOMMANDS)]
+        if not benchmark_imports(targets, args.top, args.budget_ms):
+            sys.exit(1)
+    else:
+        status = run_subcommand(args.command, extra)
+        if status:
+            sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()